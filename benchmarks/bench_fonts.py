@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Bundled font loading benchmark.
+
+Compares the font work done at startup when every bundled TTF is registered
+with Qt (the previous behaviour) against BundledFonts, which registers only
+the faces the overlay uses. "cold" builds the font catalog from the files'
+name tables, "warm" reads it from the on-disk cache, as every launch after
+the first does. Each measurement runs in a fresh interpreter and also lays
+out a line of text in the configured family, so Qt's deferred font parsing
+is included. Memory is the growth of the resident set size (Linux only).
+
+Usage:
+    python benchmarks/bench_fonts.py [--runs 5] [--family HackNerdFont]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+FONTS_DIR = os.path.join(os.path.dirname(__file__), "..", "fonts")
+
+
+def rss_kb():
+    """Returns the resident set size in KiB, or None if it is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def measure(mode, family, cache_path):
+    """Runs one measurement in this process and returns timings in ms."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC_DIR)
+
+    from PyQt6.QtGui import QFont, QFontDatabase, QTextDocument
+    from PyQt6.QtWidgets import QApplication
+
+    qt_app = QApplication(sys.argv)
+    from pymonitor.ui.fonts import BundledFonts
+
+    rss_before = rss_kb()
+    start = time.perf_counter()
+    if mode == "all":
+        for file_name in os.listdir(FONTS_DIR):
+            if file_name.lower().endswith(".ttf"):
+                QFontDatabase.addApplicationFont(os.path.join(FONTS_DIR, file_name))
+        loaded = sum(1 for f in os.listdir(FONTS_DIR) if f.lower().endswith(".ttf"))
+    else:
+        fonts = BundledFonts(FONTS_DIR, cache_path)
+        fonts.ensure_family(family)
+        loaded = len(fonts.loaded)
+    registered = (time.perf_counter() - start) * 1000
+
+    # What the overlay does next: lay out bold and regular text in the family
+    start = time.perf_counter()
+    document = QTextDocument()
+    document.setDefaultFont(QFont(family, 12))
+    document.setHtml("<b>CPU</b>: 42.00 %<br>GPU: 55.00 °C")
+    document.size()
+    first_layout = (time.perf_counter() - start) * 1000
+
+    rss_after = rss_kb()
+    qt_app.quit()
+    return {
+        "registered": registered,
+        "first_layout": first_layout,
+        "faces": loaded,
+        "rss_kb": None if rss_before is None else rss_after - rss_before,
+    }
+
+
+def run_isolated(mode, family, cache_path):
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            __file__,
+            "--measure",
+            mode,
+            "--family",
+            family,
+            "--cache",
+            cache_path,
+        ],
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--family", default="HackNerdFont")
+    parser.add_argument("--measure", choices=("all", "cold", "warm"), help=argparse.SUPPRESS)
+    parser.add_argument("--cache", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.family, args.cache)))
+        return 0
+
+    results = {"all": [], "cold": [], "warm": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "fonts.json")
+        for _ in range(args.runs):
+            results["all"].append(run_isolated("all", args.family, cache_path))
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            results["cold"].append(run_isolated("cold", args.family, cache_path))
+            results["warm"].append(run_isolated("warm", args.family, cache_path))
+
+    print(f"Font loading for '{args.family}', median of {args.runs} runs")
+    for mode, runs in results.items():
+        registered = statistics.median(run["registered"] for run in runs)
+        layout = statistics.median(run["first_layout"] for run in runs)
+        rss = [run["rss_kb"] for run in runs if run["rss_kb"] is not None]
+        memory = f"{statistics.median(rss) / 1024:6.1f} MiB" if rss else "     n/a"
+        print(
+            f"  {mode:<5} {runs[0]['faces']:2d} faces  load {registered:7.1f} ms  "
+            f"first layout {layout:6.1f} ms  RSS {memory}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Poll, format and render pipeline benchmark.
+
+Drives the application with the synthetic hardware backend at several
+scales (10, 100, 1,000 and 5,000 sensors by default) and times each stage:
+
+  poll      HardwareMonitor.get_hardware_data
+  format    Application._format_data_for_display (the main overlay's HTML)
+  overlay   WatermarkWindow.update_text plus a repaint, offscreen
+  tree      SettingsWindow.populate_sensor_tree
+
+The first `--shown` sensors of every hardware item are shown on the
+overlay. With --session, a session recorded with `--record` is replayed
+instead (one snapshot per poll), so the stages see a real machine's
+sensors and values; its results are listed under "session". Each scale
+runs in a fresh interpreter. Results can be written as
+JSON with --output and compared against a stored result with --baseline:
+stages whose median got slower by more than --threshold (and by more than
+--min-delta ms) are reported as regressions and the exit status is 1.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--scales 10 100 1000 5000] [--iterations 50]
+    python benchmarks/bench_pipeline.py --output baseline.json
+    python benchmarks/bench_pipeline.py --session desktop.jsonl.gz
+    python benchmarks/bench_pipeline.py --baseline baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+STAGES = ("poll", "format", "overlay", "tree")
+RESULT_VERSION = 1
+
+
+def summarize(samples):
+    """Returns the median and 95th percentile of durations in seconds, as ms."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+        "runs": len(ordered),
+    }
+
+
+def timed(function, iterations, warmup=2):
+    for _ in range(warmup):
+        function()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def measure(sensor_count, iterations, shown, session=None):
+    """Runs every stage at one scale, or on `session`, in this process.
+
+    Returns the stages' summaries.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC_DIR)
+
+    from pymonitor.core.app import Application
+    from pymonitor.hardware.session import ReplayHardwareMonitor
+    from pymonitor.hardware.synthetic import SyntheticHardwareMonitor
+    import pymonitor.ui.settings_window as settings_window
+
+    # The About tab is never built here, but keep the benchmark offline
+    settings_window.get_latest_lhm_version = lambda **kwargs: None
+    settings_window.get_cached_lhm_version = lambda **kwargs: None
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Application(
+            sys.argv[:1],
+            hardware_factory=lambda settings: (
+                ReplayHardwareMonitor(settings, session, speed=0)
+                if session
+                else SyntheticHardwareMonitor(settings, sensor_count=sensor_count)
+            ),
+            settings_path=os.path.join(tmp, "settings.json"),
+        )
+        monitor = app.hardware_monitor
+        monitor.initialize()
+        data = monitor.get_hardware_data()
+        app.settings.set(
+            "visualization.enabled_sensors",
+            {
+                hardware["id"]: {
+                    sensor["id"]: sensor["name"] for sensor in hardware["sensors"][:shown]
+                }
+                for hardware in data
+            },
+        )
+        app.watermark.show()
+
+        results["poll"] = timed(monitor.get_hardware_data, iterations)
+        # Later stages work on pre-polled snapshots, so only they are timed
+        snapshots = [monitor.get_hardware_data() for _ in range(iterations + 2)]
+        snapshot_iter = iter(snapshots)
+        results["format"] = timed(
+            lambda: app._format_data_for_display(next(snapshot_iter)), iterations
+        )
+
+        frames = [app._format_data_for_display(data) for data in snapshots]
+        frame_iter = iter(frames)
+
+        def update_overlay():
+            app.watermark.update_text(next(frame_iter))
+            app.watermark.repaint()
+
+        results["overlay"] = timed(update_overlay, iterations)
+
+        app.latest_data = monitor.get_hardware_data()
+        window = settings_window.SettingsWindow(app)
+        for index in range(window.tabs.count()):
+            if window.tabs.tabText(index) == "Visualization":
+                window.ensure_tab_built(index)
+        results["tree"] = timed(
+            window.populate_sensor_tree, max(3, iterations // 10), warmup=1
+        )
+
+        app.settings.flush()
+        monitor.close()
+    return results
+
+
+def run_isolated(sensor_count, iterations, shown, session=None):
+    command = [
+        sys.executable,
+        __file__,
+        "--measure",
+        str(sensor_count),
+        "--iterations",
+        str(iterations),
+        "--shown",
+        str(shown),
+    ]
+    if session:
+        command += ["--session", session]
+    output = subprocess.check_output(command, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(current, baseline, threshold, min_delta):
+    """Prints current vs baseline medians; returns the regressed (scale, stage)s."""
+    regressions = []
+    print(f"\nComparison with baseline ({baseline['meta'].get('created', '?')})")
+    for scale, stages in current["results"].items():
+        base_stages = baseline["results"].get(scale)
+        if base_stages is None:
+            print(f"  {scale:>5} sensors: not in baseline")
+            continue
+        for stage in STAGES:
+            if stage not in stages or stage not in base_stages:
+                continue
+            now = stages[stage]["median_ms"]
+            before = base_stages[stage]["median_ms"]
+            change = (now - before) / before if before else 0.0
+            regressed = now - before > min_delta and change > threshold
+            flag = "  REGRESSION" if regressed else ""
+            print(
+                f"  {scale:>5} sensors  {stage:<8} {before:9.3f} -> {now:9.3f} ms "
+                f"({change * 100:+6.1f}%){flag}"
+            )
+            if regressed:
+                regressions.append((scale, stage))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[10, 100, 1000, 5000]
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--shown", type=int, default=4, help="shown sensors per device")
+    parser.add_argument("--session", help="replay this recorded session instead")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-delta", type=float, default=0.05)
+    parser.add_argument("--measure", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        print(
+            json.dumps(measure(args.measure, args.iterations, args.shown, args.session))
+        )
+        return 0
+
+    current = {
+        "version": RESULT_VERSION,
+        "meta": {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "shown_per_device": args.shown,
+            "session": args.session,
+        },
+        "results": {},
+    }
+    print(f"Pipeline benchmark, median / p95 of {args.iterations} iterations (ms)")
+    print(f"  {'sensors':>7}  " + "  ".join(f"{stage:>17}" for stage in STAGES))
+    # A session has its own sensor count; the scale is only a placeholder
+    scales = ["session"] if args.session else args.scales
+    for scale in scales:
+        stages = run_isolated(
+            0 if args.session else scale, args.iterations, args.shown, args.session
+        )
+        current["results"][str(scale)] = stages
+        print(
+            f"  {scale:>7}  "
+            + "  ".join(
+                f"{stages[stage]['median_ms']:8.3f} /{stages[stage]['p95_ms']:8.3f}"
+                for stage in STAGES
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Settings access microbenchmark.
+
+Measures the per-tick cost of the settings lookups made while polling and
+formatting N sensors. "dotted get" replays the previous access pattern: the
+sensor loop called settings.get("monitoring.temperature_unit") once per
+sensor plus once more per temperature sensor (for the unit), and the overlay
+formatting made about ten settings.get calls per tick. "cached" replays the
+current pattern: the monitor keeps the unit in an attribute that a settings
+subscription updates, and per-tick values are read through SettingHandles.
+
+Usage:
+    python benchmarks/bench_settings_access.py [--sensors 300] [--ticks 2000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pymonitor.config.settings import Settings
+
+SENSOR_TYPES = ("Temperature", "Load", "Clock", "Power", "Data", "Fan", "Voltage")
+
+# Keys the overlay formatting used to read on every tick
+FORMAT_KEYS = (
+    ("visualization.enabled_sensors", {}),
+    ("visualization.component_order", []),
+    ("visualization.show_component_titles", True),
+    ("visualization.sensor_indentation", 4),
+    ("visualization.category_spacing", 1),
+    ("visualization.display_mode", "multiline"),
+    ("visualization.show_icons", True),
+    ("visualization.show_sparklines", False),
+    ("icons", {}),
+    ("monitoring.update_interval", 2),
+)
+
+
+def dotted_get_tick(settings, sensor_types):
+    """The settings lookups of one tick with plain dotted-key gets."""
+    for sensor_type in sensor_types:
+        settings.get("monitoring.temperature_unit", "celsius")
+        if "Temperature" in sensor_type:
+            settings.get("monitoring.temperature_unit", "celsius")
+    for key, default in FORMAT_KEYS:
+        settings.get(key, default)
+
+
+class _CachedConsumer:
+    """Holds what the monitor and worker now keep between ticks."""
+
+    def __init__(self, settings):
+        self.temperature_unit = settings.get("monitoring.temperature_unit", "celsius")
+        settings.subscribe("monitoring.temperature_unit", self._set_unit)
+        self.handles = [settings.handle(key, default) for key, default in FORMAT_KEYS]
+
+    def _set_unit(self, unit):
+        self.temperature_unit = unit or "celsius"
+
+
+def cached_tick(consumer, sensor_types):
+    """The same lookups through a cached attribute and SettingHandles."""
+    fahrenheit = consumer.temperature_unit == "fahrenheit"
+    for sensor_type in sensor_types:
+        if fahrenheit and "Temperature" in sensor_type:
+            pass
+    for handle in consumer.handles:
+        handle.get()
+
+
+def time_ticks(func, arg, sensor_types, ticks):
+    timings = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        func(arg, sensor_types)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sensors", type=int, default=300)
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    sensor_types = [SENSOR_TYPES[i % len(SENSOR_TYPES)] for i in range(args.sensors)]
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(os.path.join(tmp, "settings.json"))
+        consumer = _CachedConsumer(settings)
+
+        dotted = time_ticks(dotted_get_tick, settings, sensor_types, args.ticks)
+        cached = time_ticks(cached_tick, consumer, sensor_types, args.ticks)
+
+        # The cached values follow changes
+        settings.set("monitoring.temperature_unit", "fahrenheit")
+        assert consumer.temperature_unit == "fahrenheit"
+
+    print(f"Settings access per tick, {args.sensors} sensors, {args.ticks} ticks")
+    for name, timings in (("dotted get", dotted), ("cached", cached)):
+        print(
+            f"  {name:<11} median {statistics.median(timings):8.1f} us  "
+            f"mean {statistics.mean(timings):8.1f} us"
+        )
+    saving = statistics.median(dotted) - statistics.median(cached)
+    print(f"  saving      {saving:8.1f} us per tick")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
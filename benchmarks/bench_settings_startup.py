@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Settings window startup benchmark.
+
+Compares what the settings window costs at application startup when it is
+built eagerly with all tabs (the previous behaviour) against the lazy
+construction: nothing at startup, then the window with only its first tab on
+first open. Startup is timed as the construction of the Application with
+the synthetic backend, plus the eager window in eager mode. Each measurement
+runs in a fresh interpreter so import and font database costs are included,
+and the version check is stubbed out (the eager path used to also start a
+GitHub request on every launch).
+
+Usage:
+    python benchmarks/bench_settings_startup.py [--runs 5] [--sensors 300]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+def make_data(sensor_count):
+    """Builds a fake hardware snapshot with `sensor_count` sensors."""
+    per_hardware = 50
+    data = []
+    for h in range(0, sensor_count, per_hardware):
+        hw_id = f"/bench/{h // per_hardware}"
+        data.append(
+            {
+                "id": hw_id,
+                "name": f"Bench Hardware {h // per_hardware}",
+                "type": "Cpu",
+                "sensors": [
+                    {
+                        "id": f"{hw_id}/load/{i}",
+                        "name": f"Sensor {i}",
+                        "type": "Load",
+                        "value": "50.00 %",
+                        "raw": 50.0,
+                    }
+                    for i in range(min(per_hardware, sensor_count - h))
+                ],
+            }
+        )
+    return data
+
+
+def measure(mode, sensor_count):
+    """Runs one measurement in this process and returns timings in ms.
+
+    "startup" is the construction of the Application with the synthetic
+    backend; in eager mode it also builds the settings window with all its
+    tabs, as the previous startup did.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC_DIR)
+
+    from pymonitor.core.app import Application
+    from pymonitor.hardware.synthetic import SyntheticHardwareMonitor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+
+        start = time.perf_counter()
+        app = Application(
+            sys.argv[:1],
+            hardware_factory=lambda settings: SyntheticHardwareMonitor(settings),
+            settings_path=os.path.join(tmp, "settings.json"),
+        )
+        app.latest_data = make_data(sensor_count)
+        timings["application"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        import pymonitor.ui.settings_window as settings_window
+
+        settings_window.get_latest_lhm_version = lambda **kwargs: None
+        settings_window.get_cached_lhm_version = lambda **kwargs: None
+        timings["import"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        window = app.get_settings_window()
+        timings["first_tab"] = (time.perf_counter() - start) * 1000
+
+        if mode == "eager":
+            start = time.perf_counter()
+            for index in range(window.tabs.count()):
+                window.ensure_tab_built(index)
+            timings["other_tabs"] = (time.perf_counter() - start) * 1000
+            window.version_worker.wait()
+            timings["startup"] = sum(
+                timings[key] for key in ("application", "import", "first_tab", "other_tabs")
+            )
+        else:
+            timings["startup"] = timings["application"]
+
+        app.settings_watcher.stop()
+        app.settings.flush()
+        app.quit()
+    return timings
+
+
+def run_isolated(mode, sensor_count):
+    output = subprocess.check_output(
+        [sys.executable, __file__, "--measure", mode, "--sensors", str(sensor_count)],
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--sensors", type=int, default=300)
+    parser.add_argument("--measure", choices=("eager", "lazy"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.sensors)))
+        return 0
+
+    results = {
+        mode: [run_isolated(mode, args.sensors) for _ in range(args.runs)]
+        for mode in ("eager", "lazy")
+    }
+
+    def median(mode, key):
+        return statistics.median(run.get(key, 0.0) for run in results[mode])
+
+    eager_startup = median("eager", "startup")
+    lazy_startup = median("lazy", "startup")
+    lazy_first_open = median("lazy", "import") + median("lazy", "first_tab")
+    print(f"Settings window, {args.sensors} sensors, median of {args.runs} runs")
+    print(f"  eager: {eager_startup:8.1f} ms at startup")
+    print(f"         (application {median('eager', 'application'):.1f} ms, "
+          f"import {median('eager', 'import'):.1f} ms, "
+          f"first tab {median('eager', 'first_tab'):.1f} ms, "
+          f"other tabs {median('eager', 'other_tabs'):.1f} ms)")
+    print(f"  lazy:  {lazy_startup:8.1f} ms at startup, {lazy_first_open:.1f} ms on first open")
+    print(f"         (import {median('lazy', 'import'):.1f} ms, "
+          f"first tab {median('lazy', 'first_tab'):.1f} ms; "
+          "other tabs are built when first shown)")
+    print(f"  startup saved: {eager_startup - lazy_startup:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Sparkline rendering benchmark.
+
+Simulates N sparklines receiving samples at a given rate and reports the
+per-frame cost of the incremental (scrolling pixmap) renderer used by the
+overlay, next to a naive renderer that rebuilds a QPainterPath from all
+points every frame.
+
+Usage:
+    python benchmarks/bench_sparklines.py [--sparklines 30] [--rate 4] [--seconds 60]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPixmap
+from PyQt6.QtCore import Qt
+
+from pymonitor.core.history import HistoryStore
+from pymonitor.ui.sparkline import SparklineSet
+
+
+class _BenchSettings:
+    """Minimal settings object exposing only what SparklineSet reads."""
+
+    def get(self, key, default=None):
+        return {"visualization.sparkline_height": 12}.get(key, default)
+
+
+def sensor_id(index):
+    return f"/bench/sensor/{index}"
+
+
+def make_data(count, tick):
+    """Builds one tick of fake hardware data with `count` sensors."""
+    sensors = []
+    for i in range(count):
+        sensor_type = "Load" if i % 2 else "Temperature"
+        base = 50 + 30 * math.sin((tick + i * 7) / 10.0)
+        sensors.append(
+            {
+                "id": sensor_id(i),
+                "name": f"Sensor {i}",
+                "type": sensor_type,
+                "value": f"{base:.2f}",
+                "raw": base + random.uniform(-5, 5),
+            }
+        )
+    return [{"id": "/bench", "name": "Bench", "type": "Cpu", "sensors": sensors}]
+
+
+def naive_frame(history, keys, width, height, color):
+    """Rebuilds every sparkline from scratch, as a QPainterPath over all points."""
+    for key in keys:
+        _, samples = history.snapshot(key)
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        values = [v for v in samples if v is not None]
+        if values:
+            low, high = min(values), max(values)
+            span = (high - low) or 1.0
+            path = QPainterPath()
+            x = width - len(samples)
+            for i, v in enumerate(values):
+                y = height - 1 - (v - low) / span * (height - 1)
+                if i == 0:
+                    path.moveTo(x + i, y)
+                else:
+                    path.lineTo(x + i, y)
+            painter = QPainter(pixmap)
+            painter.setPen(color)
+            painter.drawPath(path)
+            painter.end()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sparklines", type=int, default=30)
+    parser.add_argument("--rate", type=float, default=4.0, help="Samples per second")
+    parser.add_argument("--seconds", type=int, default=60, help="History length")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument(
+        "--budget-ms", type=float, default=2.0, help="Per-frame budget to check"
+    )
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    width = max(2, int(args.seconds * args.rate))
+    history = HistoryStore(width)
+    sparklines = SparklineSet(history, _BenchSettings())
+    keys = [sensor_id(i) for i in range(args.sparklines)]
+    enabled = {"/bench": set(keys)}
+
+    # Warm up: fill the ring buffers once
+    for tick in range(width):
+        history.record(make_data(args.sparklines, tick), enabled)
+
+    incremental, naive = [], []
+    for tick in range(width, width + args.frames):
+        history.record(make_data(args.sparklines, tick), enabled)
+
+        start = time.perf_counter()
+        for key in keys:
+            sparklines.pixmap(key)
+        incremental.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        naive_frame(history, keys, width, 12, QColor("#FFFFFF"))
+        naive.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{args.sparklines} sparklines, {width} samples each "
+        f"({args.seconds}s at {args.rate:g} Hz), {args.frames} frames"
+    )
+    for name, timings in (("incremental", incremental), ("naive path", naive)):
+        print(
+            f"  {name:<12} mean {statistics.mean(timings):7.3f} ms  "
+            f"p95 {percentile(timings, 95):7.3f} ms  "
+            f"max {max(timings):7.3f} ms"
+        )
+
+    p95 = percentile(incremental, 95)
+    within = p95 <= args.budget_ms
+    print(
+        f"Budget {args.budget_ms:.2f} ms/frame: "
+        f"{'OK' if within else 'EXCEEDED'} (incremental p95 {p95:.3f} ms)"
+    )
+    app.quit()
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Time-to-first-frame benchmark.
+
+Starts the full application in a fresh interpreter, with the synthetic
+hardware backend standing in for LibreHardwareMonitor and `--open-delay`
+seconds simulating Computer.Open(), and records from process start:
+
+  import        pymonitor.main imported
+  constructed   Application created
+  shown         event loop running with the overlays and tray icon shown
+  first frame   first hardware frame displayed by the overlay
+
+"blocking" replays the previous startup, which opened the backend before
+showing anything; "deferred" is the current one, where the worker thread
+opens it while the overlay is already up.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--sensors 300] [--open-delay 1.5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+START = time.perf_counter()
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+PHASES = ("import", "constructed", "shown", "first_frame")
+
+
+def measure(mode, sensor_count, open_delay):
+    """Runs the application once in this process and returns timings in ms."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC_DIR)
+    timings = {}
+
+    def mark(phase):
+        timings.setdefault(phase, (time.perf_counter() - START) * 1000)
+
+    import pymonitor.main  # noqa: F401 # What launching the app imports
+    from pymonitor.core.app import Application
+    from pymonitor.hardware.synthetic import SyntheticHardwareMonitor
+
+    mark("import")
+    # Heavy modules that must not be loaded before the first frame
+    timings["heavy_modules"] = [
+        name
+        for name in ("clr", "requests", "pymonitor.ui.settings_window")
+        if name in sys.modules
+    ]
+
+    from PyQt6.QtCore import QTimer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Application(
+            sys.argv,
+            hardware_factory=lambda settings: SyntheticHardwareMonitor(
+                settings, sensor_count=sensor_count, open_delay=open_delay
+            ),
+            settings_path=os.path.join(tmp, "settings.json"),
+        )
+        mark("constructed")
+
+        if mode == "blocking":
+            # The previous startup opened the backend before the event loop
+            app.hardware_monitor.initialize()
+
+        update_overlays = app.update_overlays
+
+        def first_frame(texts):
+            update_overlays(texts)
+            mark("first_frame")
+            app.exit()
+
+        app.update_overlays = first_frame
+        QTimer.singleShot(0, lambda: mark("shown"))
+        # Give up if no frame ever arrives
+        QTimer.singleShot(int((open_delay + 30) * 1000), app.exit)
+        app.run()
+    return timings
+
+
+def run_isolated(mode, sensor_count, open_delay):
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            __file__,
+            "--measure",
+            mode,
+            "--sensors",
+            str(sensor_count),
+            "--open-delay",
+            str(open_delay),
+        ],
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--sensors", type=int, default=300)
+    parser.add_argument("--open-delay", type=float, default=1.5)
+    parser.add_argument("--measure", choices=("blocking", "deferred"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.sensors, args.open_delay)))
+        return 0
+
+    results = {
+        mode: [run_isolated(mode, args.sensors, args.open_delay) for _ in range(args.runs)]
+        for mode in ("blocking", "deferred")
+    }
+
+    print(
+        f"Startup, {args.sensors} synthetic sensors, {args.open_delay:.1f} s simulated "
+        f"Computer.Open(), median of {args.runs} runs (ms from process start)"
+    )
+    print(f"  {'':<10}" + "".join(f"{phase:>13}" for phase in PHASES))
+    for mode, runs in results.items():
+        medians = [
+            statistics.median(run.get(phase, float("nan")) for run in runs)
+            for phase in PHASES
+        ]
+        print(f"  {mode:<10}" + "".join(f"{value:13.1f}" for value in medians))
+    heavy = sorted({name for run in results["deferred"] for name in run["heavy_modules"]})
+    print(f"  heavy modules imported at startup: {', '.join(heavy) or 'none'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
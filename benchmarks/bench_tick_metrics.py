@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tick instrumentation overhead benchmark.
+
+Drives the polling pipeline (HardwareWorker.tick, frame delivery and the
+overlay repaint) against the synthetic hardware backend, then measures what
+the latency histograms add to it: the number of durations recorded per tick
+times the cost of timing and recording one duration. The overhead is
+reported against the median cost of a whole tick, worker and GUI side.
+
+The synthetic backend reads its sensors in well under a millisecond, so the
+percentage is a worst case; LibreHardwareMonitor's Update() calls make real
+ticks much longer.
+
+Usage:
+    python benchmarks/bench_tick_metrics.py [--ticks 500] [--sensors 300] [--enabled 4]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pymonitor.core.app import Application, HardwareWorker
+from pymonitor.core.metrics import LatencyHistogram
+from pymonitor.hardware.synthetic import SyntheticHardwareMonitor
+
+
+def record_cost(samples=200_000):
+    """Returns the seconds taken by one `record(perf_counter() - start)`."""
+    histogram = LatencyHistogram()
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    for _ in range(samples):
+        histogram.record(perf_counter() - start)
+    timed = perf_counter() - start
+    start = perf_counter()
+    for _ in range(samples):
+        pass
+    empty = perf_counter() - start
+    # The instrumented code takes one extra perf_counter() per duration
+    return (timed - empty) / samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--sensors", type=int, default=300)
+    parser.add_argument("--enabled", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Application(
+            sys.argv[:1],
+            hardware_factory=lambda settings: SyntheticHardwareMonitor(
+                settings, sensor_count=args.sensors
+            ),
+            settings_path=os.path.join(tmp, "settings.json"),
+        )
+        app.hardware_monitor.initialize()
+        # Show the first `--enabled` sensors of every hardware item
+        enabled = {}
+        for hardware in app.hardware_monitor.get_hardware_data():
+            enabled[hardware["id"]] = {
+                sensor["id"]: sensor["name"]
+                for sensor in hardware["sensors"][: args.enabled]
+            }
+        app.settings.set("visualization.enabled_sensors", enabled)
+        for overlay in app.overlays:
+            overlay.show()
+        worker = HardwareWorker(app)
+        worker.frame_available.connect(app.on_frame_available)
+
+        tick_times = []
+        for _ in range(args.ticks):
+            start = time.perf_counter()
+            worker.tick()
+            app.processEvents()  # Delivers the frame and repaints the overlay
+            tick_times.append(time.perf_counter() - start)
+
+        counts = {name: stats["count"] for name, stats in app.metrics.snapshot().items()}
+        app.settings.flush()
+        app.hardware_monitor.close()
+
+    records_per_tick = sum(counts.values()) / args.ticks
+    cost = record_cost()
+    tick = statistics.median(tick_times)
+    overhead = records_per_tick * cost
+
+    print(
+        f"Tick instrumentation, {args.sensors} synthetic sensors "
+        f"({args.enabled} shown per device), {args.ticks} ticks"
+    )
+    for name, count in sorted(counts.items()):
+        print(f"  {name:<16} {count / args.ticks:5.2f} per tick")
+    print(f"  median tick            {tick * 1e3:8.3f} ms")
+    print(f"  timing + record        {cost * 1e6:8.3f} µs")
+    print(f"  records per tick       {records_per_tick:8.2f}")
+    print(
+        f"  overhead per tick      {overhead * 1e6:8.3f} µs "
+        f"({overhead / tick * 100:.2f}% of the tick)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
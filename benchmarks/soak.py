@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Accelerated soak test for memory leaks and drift.
+
+Runs the full per-tick pipeline (poll, render, history, frame delivery and
+overlay paint) against the synthetic hardware backend for days of ticks,
+using a virtual clock that jumps one update interval per tick instead of
+waiting, so a day of 2-second ticks takes a few minutes. Sparklines are on
+so the history and sparkline caches are exercised too.
+
+Every `--checkpoint` virtual hours it records the memory traced by
+tracemalloc, Python object counts by type, the resident set size (Linux),
+the number of live QObjects and the median tick time. The first checkpoint
+is the baseline. At the end it reports the biggest growth since then and
+exits with status 1 if any of it is past its threshold:
+
+  --max-traced-kb     growth of tracemalloc's traced memory
+  --max-rss-mb        growth of the resident set size
+  --max-objects       growth of the object count of any one type
+  --max-qobjects      growth of the number of QObjects
+  --max-tick-growth   growth of the median tick time, as a fraction
+
+It also reports the schedule drift: the worker waits a full interval after
+each tick, so every tick's own duration delays all later ones.
+
+Usage:
+    python benchmarks/soak.py [--days 1] [--interval 2] [--sensors 100]
+"""
+
+import argparse
+import collections
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject
+from PyQt6.QtWidgets import QApplication
+
+from pymonitor.core.app import Application, HardwareWorker
+from pymonitor.core.governor import SAMPLE_SECONDS
+from pymonitor.hardware.synthetic import SyntheticHardwareMonitor
+
+
+class VirtualClock:
+    """A monotonic clock that only moves when advanced."""
+
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def rss_kb():
+    """Returns the resident set size in KiB, or None if it is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def object_counts():
+    gc.collect()
+    return collections.Counter(type(o).__name__ for o in gc.get_objects())
+
+
+def qobject_count(app):
+    return len(app.findChildren(QObject)) + len(QApplication.allWidgets())
+
+
+class Checkpoint:
+    """Memory and timing measurements at one point of the soak."""
+
+    def __init__(self, app, hour, tick_times):
+        # Let deleteLater() run, as the event loop would have
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        self.hour = hour
+        # Leaves out what the harness itself allocates, e.g. its checkpoints
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        self.traced_kb = sum(
+            stat.size for stat in self.snapshot.statistics("filename")
+        ) / 1024
+        self.objects = object_counts()
+        self.object_total = sum(self.objects.values())
+        self.rss_kb = rss_kb()
+        self.qobjects = qobject_count(app)
+        self.tick_ms = statistics.median(tick_times) * 1000 if tick_times else 0.0
+
+    def forget(self):
+        """Drops the bulky measurements once a later checkpoint replaced them."""
+        self.snapshot = self.objects = None
+
+    def line(self, baseline):
+        rss = "n/a" if self.rss_kb is None else f"{(self.rss_kb - baseline.rss_kb) / 1024:+7.1f} MiB"
+        return (
+            f"  {self.hour:6.1f} h  traced {self.traced_kb - baseline.traced_kb:+9.1f} KiB"
+            f"  RSS {rss}  objects {self.object_total - baseline.object_total:+7d}"
+            f"  QObjects {self.qobjects - baseline.qobjects:+4d}  tick {self.tick_ms:6.3f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=float, default=1.0)
+    parser.add_argument("--interval", type=float, default=2.0, help="update interval (s)")
+    parser.add_argument("--sensors", type=int, default=100)
+    parser.add_argument("--shown", type=int, default=4, help="shown sensors per device")
+    parser.add_argument("--checkpoint", type=float, default=2.0, help="hours")
+    parser.add_argument("--max-traced-kb", type=float, default=512)
+    parser.add_argument("--max-rss-mb", type=float, default=32)
+    parser.add_argument("--max-objects", type=int, default=500)
+    parser.add_argument("--max-qobjects", type=int, default=0)
+    parser.add_argument("--max-tick-growth", type=float, default=0.5)
+    args = parser.parse_args()
+
+    clock = VirtualClock()
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Application(
+            sys.argv[:1],
+            hardware_factory=lambda settings: SyntheticHardwareMonitor(
+                settings, sensor_count=args.sensors
+            ),
+            settings_path=os.path.join(tmp, "settings.json"),
+            clock=clock,
+        )
+        monitor = app.hardware_monitor
+        monitor.initialize()
+        app.settings.set(
+            "visualization.enabled_sensors",
+            {
+                hardware["id"]: {
+                    sensor["id"]: sensor["name"]
+                    for sensor in hardware["sensors"][: args.shown]
+                }
+                for hardware in monitor.get_hardware_data()
+            },
+        )
+        app.settings.set("visualization.show_sparklines", True)
+        app.settings.set("monitoring.update_interval", args.interval)
+        # CPU use measured against virtual time is meaningless; the governor
+        # still samples and reports, but keeps the full rate
+        app.settings.set("performance.governor", False)
+        for overlay in app.overlays:
+            overlay.show()
+        worker = HardwareWorker(app)
+        worker.frame_available.connect(app.on_frame_available)
+        # Sampled once per virtual SAMPLE_SECONDS below, not by its timer
+        app.governor.start(worker)
+        app.governor.stop()
+
+        total_ticks = int(args.days * 86400 / args.interval)
+        ticks_per_checkpoint = max(1, int(args.checkpoint * 3600 / args.interval))
+        ticks_per_sample = max(1, int(SAMPLE_SECONDS / args.interval))
+        print(
+            f"Soak: {total_ticks} ticks ({args.days:g} days at {args.interval:g} s), "
+            f"{args.sensors} sensors, checkpoint every {args.checkpoint:g} h"
+        )
+
+        baseline = last = None
+        tick_times = []
+        busy = 0.0  # Total tick time, which delays the following ticks
+        started = time.perf_counter()
+        for tick in range(1, total_ticks + 1):
+            clock.advance(args.interval)
+            start = time.perf_counter()
+            worker.tick()
+            app.processEvents()  # Delivers the frame and repaints the overlays
+            duration = time.perf_counter() - start
+            tick_times.append(duration)
+            busy += duration
+            if tick % ticks_per_sample == 0:
+                app.governor.sample()
+            if tick % ticks_per_checkpoint == 0:
+                if last is not None and last is not baseline:
+                    last.forget()
+                last = Checkpoint(app, tick * args.interval / 3600, tick_times)
+                tick_times = []
+                if baseline is None:
+                    baseline = last
+                print(last.line(baseline), flush=True)
+
+        elapsed = time.perf_counter() - started
+        app.settings.flush()
+        monitor.close()
+
+    if last is baseline:
+        print("Too short for a comparison; use more --days or a shorter --checkpoint.")
+        return 0
+
+    print(
+        f"\nSimulated {args.days:g} days in {elapsed:.0f} s. "
+        f"Schedule drift: {busy:.1f} s ({busy / args.days:.1f} s per day)"
+    )
+    print("Largest tracemalloc growth since the first checkpoint:")
+    for stat in last.snapshot.compare_to(baseline.snapshot, "lineno")[:8]:
+        if stat.size_diff > 0:
+            print(f"  {stat.size_diff / 1024:+8.1f} KiB {stat.count_diff:+6d} blocks  {stat.traceback}")
+    growth = last.objects - baseline.objects
+    print("Largest object count growth:")
+    for name, count in growth.most_common(8):
+        print(f"  {count:+7d} {name}")
+
+    failures = []
+    traced = last.traced_kb - baseline.traced_kb
+    if traced > args.max_traced_kb:
+        failures.append(f"traced memory grew {traced:.1f} KiB (max {args.max_traced_kb:g})")
+    if last.rss_kb is not None and baseline.rss_kb is not None:
+        rss = (last.rss_kb - baseline.rss_kb) / 1024
+        if rss > args.max_rss_mb:
+            failures.append(f"RSS grew {rss:.1f} MiB (max {args.max_rss_mb:g})")
+    for name, count in growth.items():
+        if count > args.max_objects:
+            failures.append(f"{count} more {name} objects (max {args.max_objects})")
+    qobjects = last.qobjects - baseline.qobjects
+    if qobjects > args.max_qobjects:
+        failures.append(f"{qobjects} more QObjects (max {args.max_qobjects})")
+    if baseline.tick_ms and last.tick_ms > baseline.tick_ms * (1 + args.max_tick_growth):
+        failures.append(
+            f"median tick went from {baseline.tick_ms:.3f} to {last.tick_ms:.3f} ms"
+        )
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nPASSED: no growth past the thresholds.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
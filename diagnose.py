@@ -6,10 +6,28 @@ Automatically detects and helps fix common issues.
 
 import sys
 import os
+import argparse
 import subprocess
 import platform
+import time
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Hardware type -> its "monitoring.hardware_categories" key
+HARDWARE_TYPE_CATEGORIES = {
+    "Cpu": "cpu",
+    "GpuNvidia": "gpu",
+    "GpuAmd": "gpu",
+    "GpuIntel": "gpu",
+    "Memory": "memory",
+    "Motherboard": "motherboard",
+    "SuperIO": "motherboard",
+    "EmbeddedController": "motherboard",
+    "Storage": "storage",
+    "Network": "network",
+}
+
 def print_header(title):
     """Print a formatted header."""
     print(f"\n{'='*60}")
@@ -233,8 +251,228 @@ def provide_solutions():
     print("   • Try different Python installation (not Windows Store version)")
     print("   • Create virtual environment: python -m venv venv")
 
+def ms(seconds):
+    """Formats a duration in seconds as milliseconds."""
+    return "    n/a" if seconds is None else f"{seconds * 1000:7.2f}"
+
+def migrated_settings(settings, data):
+    """Returns a settings snapshot with name-based sensor selections migrated.
+
+    The main and per-overlay selections are converted to identifiers against
+    `data` as the application does, but only in memory: settings.json is not
+    changed.
+    """
+    from pymonitor.config.migration import migrate_visualization, needs_migration
+    from pymonitor.config.settings import SettingsSnapshot
+
+    snapshot = settings.snapshot()
+    result = dict(snapshot.data)
+    visualization = result.get("visualization")
+    if needs_migration(visualization):
+        result["visualization"] = dict(
+            visualization, **migrate_visualization(visualization, data)
+        )
+    overlays = []
+    for entry in result.get("overlays", []) or []:
+        overlay_visualization = entry.get("visualization") if isinstance(entry, dict) else None
+        if needs_migration(overlay_visualization):
+            entry = dict(
+                entry,
+                visualization=dict(
+                    overlay_visualization,
+                    **migrate_visualization(overlay_visualization, data),
+                ),
+            )
+        overlays.append(entry)
+    if overlays:
+        result["overlays"] = overlays
+    return SettingsSnapshot(result, snapshot.version)
+
+def diagnose_performance(iterations, monitor=None, settings=None):
+    """Times the hardware backend and the overlay rendering on this machine.
+
+    Opens the backend, polls it `iterations` times and times each hardware
+    item's Update(), reading and formatting the sensors, and rendering the
+    current settings.json selection. Prints the devices ranked by cost and
+    the hardware categories worth disabling.
+    """
+    print_header("PERFORMANCE DIAGNOSIS")
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+    from pymonitor.config.settings import Settings, OverlaySettings
+    from pymonitor.core.metrics import TickMetrics
+    from pymonitor.core.render_plan import RenderPlan
+
+    if settings is None:
+        settings = Settings(str(PROJECT_ROOT / "settings.json"))
+    try:
+        if monitor is None:
+            from pymonitor.hardware.monitor import HardwareMonitor
+            monitor = HardwareMonitor(settings, lib_path=str(PROJECT_ROOT))
+        start = time.perf_counter()
+        monitor.initialize()
+        print_success(f"Hardware backend opened in {ms(time.perf_counter() - start).strip()} ms")
+    except Exception as e:
+        print_error(f"Could not open the hardware backend: {e}")
+        print_info("Run the other checks first: python diagnose.py")
+        return False
+
+    try:
+        # The first update after opening is much slower than the others; not timed
+        data = monitor.get_hardware_data()
+        # A fixed clock keeps every sample in one slice of the sliding windows
+        metrics = TickMetrics(clock=lambda: 0.0)
+        monitor.metrics = metrics
+        poll_time = metrics.histogram("poll")
+        print_info(f"Polling {iterations} times...")
+        for _ in range(iterations):
+            start = time.perf_counter()
+            data = monitor.get_hardware_data()
+            poll_time.record(time.perf_counter() - start)
+
+        # The main overlay plus any additional ones, as the application builds
+        # them, with old name-based selections resolved against this machine
+        current = migrated_settings(settings, data)
+        overlays = [current] + [
+            OverlaySettings(current, index)
+            for index in range(len(current.get("overlays", []) or []))
+        ]
+        plans = [RenderPlan(overlay) for overlay in overlays]
+        render_time = metrics.histogram("render")
+        for _ in range(iterations):
+            start = time.perf_counter()
+            for plan in plans:
+                plan.render(data)
+            render_time.record(time.perf_counter() - start)
+    finally:
+        monitor.close()
+
+    shown = {}  # Hardware id -> ids of its sensors shown on any overlay
+    for overlay in overlays:
+        for hardware_id, sensors in (overlay.get("visualization.enabled_sensors", {}) or {}).items():
+            # Name-based entries left are for hardware that is not present
+            if isinstance(sensors, dict):
+                shown.setdefault(hardware_id, set()).update(sensors)
+
+    stats = metrics.snapshot()
+    poll = stats["poll"]["mean"]
+    if poll is None:
+        print_error("Nothing was timed; use --iterations 1 or more")
+        return False
+    devices = []
+    for item in data:
+        update = stats.get(f"update: {item['name']} ({item['id']})", {})
+        devices.append(
+            {
+                "name": item["name"],
+                "category": HARDWARE_TYPE_CATEGORIES.get(item["type"], item["type"]),
+                "sensors": len(item["sensors"]),
+                "shown": len(shown.get(item["id"], ())),
+                "mean": update.get("mean"),
+                "p95": update.get("p95"),
+                "max": update.get("max"),
+            }
+        )
+    devices.sort(key=lambda device: device["mean"] or 0.0, reverse=True)
+
+    print("\n📊 Update() per device, in ms (ranked by mean):")
+    print(f"   {'mean':>7} {'p95':>7} {'max':>7} {'share':>6} {'sensors':>7} {'shown':>5}  device")
+    for device in devices:
+        share = f"{device['mean'] / poll * 100:5.1f}%" if device["mean"] and poll else "   n/a"
+        print(
+            f"   {ms(device['mean'])} {ms(device['p95'])} {ms(device['max'])} {share} "
+            f"{device['sensors']:7d} {device['shown']:5d}  {device['name']} ({device['category']})"
+        )
+
+    render = stats["render"]["mean"] or 0.0
+    read = stats["sensor read"]["mean"] if "sensor read" in stats else None
+    interval = float(settings.get("monitoring.update_interval", 1) or 1)
+    usage = (poll + render) / interval * 100
+    budget = float(settings.get("performance.cpu_budget", 0.5))
+    print("\n⏱️  Per update, in ms (mean / p95):")
+    print(f"   Poll (all devices):          {ms(poll)} / {ms(stats['poll']['p95'])}")
+    print(f"   Reading and formatting:      {ms(read)}")
+    print(f"   Rendering {len(plans)} overlay(s):       {ms(render)} / {ms(stats['render']['p95'])}")
+    print(
+        f"   {sum(d['sensors'] for d in devices)} sensors on {len(devices)} devices, "
+        f"{sum(d['shown'] for d in devices)} shown"
+    )
+    message = (
+        f"About {usage:.2f}% of one core at a {interval:g} s update interval "
+        f"(budget {budget:g}%, without painting)"
+    )
+    if usage > budget:
+        print_warning(message)
+    else:
+        print_success(message)
+
+    categories = {}
+    for device in devices:
+        category = categories.setdefault(
+            device["category"], {"cost": 0.0, "devices": 0, "sensors": 0, "shown": 0}
+        )
+        category["cost"] += device["mean"] or 0.0
+        category["devices"] += 1
+        category["sensors"] += device["sensors"]
+        category["shown"] += device["shown"]
+    ranked = sorted(categories.items(), key=lambda item: item[1]["cost"], reverse=True)
+
+    print("\n💡 RECOMMENDATIONS (largest savings first):")
+    # Only the categories the setting can switch off
+    configurable = set(HARDWARE_TYPE_CATEGORIES.values())
+    unused = [
+        (name, c)
+        for name, c in ranked
+        if name in configurable and not c["shown"] and c["cost"] > 0
+    ]
+    for name, category in unused:
+        print_info(
+            f'Set "monitoring.hardware_categories.{name}" to false: saves '
+            f"{ms(category['cost']).strip()} ms per update "
+            f"({category['cost'] / poll * 100:.0f}% of polling); none of its "
+            f"{category['sensors']} sensors on {category['devices']} device(s) are shown"
+        )
+    for name, category in ranked:
+        if category["shown"] and poll and category["cost"] / poll >= 0.25:
+            print_info(
+                f"{name} costs {ms(category['cost']).strip()} ms per update "
+                f"({category['cost'] / poll * 100:.0f}%), but {category['shown']} "
+                f"of its sensors are shown"
+            )
+    if unused:
+        print_info(
+            "Change it in settings.json; it takes effect when PyMonitor.NET next starts"
+        )
+    else:
+        print_success("Every enabled hardware category has sensors on an overlay")
+    if usage > budget:
+        print_info(
+            "Over the budget, the CPU governor polls less often and updates "
+            "unshown hardware less; a longer update interval also helps"
+        )
+    return True
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
 def main():
     """Main diagnostic function."""
+    parser = argparse.ArgumentParser(description="PyMonitor.NET Diagnostic Tool")
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="time the hardware backend and rendering instead of checking the setup",
+    )
+    parser.add_argument(
+        "--iterations", type=positive_int, default=20, help="polls to time with --perf"
+    )
+    args = parser.parse_args()
+    if args.perf:
+        return 0 if diagnose_performance(args.iterations) else 1
+
     print_header("PyMonitor.NET Diagnostic Tool")
     print("This tool will help identify and fix common issues.\n")
     
@@ -280,7 +518,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\n\n❌ Diagnostic cancelled by user")
     except Exception as e:
@@ -13,12 +13,14 @@ def is_admin():
 def run_as_admin():
     """Re-run the script with administrative privileges."""
     script_path = os.path.abspath(sys.argv[0])
+    # Pass options such as --trace-startup on to the elevated process
+    arguments = " ".join(f'"{arg}"' for arg in [script_path] + sys.argv[1:])
     try:
         ret = ctypes.windll.shell32.ShellExecuteW(
             None, 
             "runas", 
             sys.executable, 
-            f'"{script_path}"', 
+            arguments, 
             None, 
             1
         )
@@ -0,0 +1,118 @@
+# src/pymonitor/config/migration.py
+
+"""Migration of name-based sensor selections to stable identifiers.
+
+Older settings stored the selection as ``{hardware name: [sensor name, ...]}``
+and the hardware order as a list of hardware names. Names are not unique
+(a GPU reports "GPU Core" as a temperature, a load and a clock), so the
+selection is now stored by identifier:
+
+- ``visualization.enabled_sensors``: ``{hardware id: {sensor id: sensor name}}``,
+  where the dict order is the display order and the names are informational.
+- ``visualization.component_order``: ``[hardware id, ...]``.
+
+Names can only be resolved to identifiers against a hardware snapshot, so the
+migration runs when snapshots arrive. Entries for hardware that is not present
+yet are kept as they are and migrated once it shows up.
+"""
+
+
+def _is_legacy_selection(value):
+    return isinstance(value, list)
+
+
+def needs_migration(visualization):
+    """True if a visualization settings dict still contains name-based entries."""
+    if not isinstance(visualization, dict):
+        return False
+    enabled = visualization.get("enabled_sensors") or {}
+    if any(_is_legacy_selection(value) for value in enabled.values()):
+        return True
+    return any(
+        not str(entry).startswith("/") for entry in visualization.get("component_order") or []
+    )
+
+
+def migrate_visualization(visualization, data):
+    """Returns migrated copies of a visualization dict's selection keys.
+
+    Returns a dict with the "enabled_sensors" and/or "component_order" values
+    that changed, or an empty dict if nothing could be migrated.
+    """
+    hardware_by_name = {}
+    for hw_item in data:
+        hardware_by_name.setdefault(hw_item["name"], []).append(hw_item)
+    hardware_ids = {hw_item["id"] for hw_item in data}
+    changes = {}
+
+    enabled = visualization.get("enabled_sensors")
+    if isinstance(enabled, dict):
+        migrated = {}
+        changed = False
+        for key, value in enabled.items():
+            if not _is_legacy_selection(value) or key not in hardware_by_name:
+                if key not in migrated:
+                    migrated[key] = value
+                continue
+            # A name used to select every sensor with that name, so the
+            # migrated selection keeps all of them, in the configured order
+            position = {}
+            for index, name in enumerate(value):
+                position.setdefault(name, index)
+            for hw_item in hardware_by_name[key]:
+                sensors = [s for s in hw_item["sensors"] if s["name"] in position]
+                sensors.sort(key=lambda s: position[s["name"]])
+                migrated[hw_item["id"]] = {s["id"]: s["name"] for s in sensors}
+            changed = True
+        if changed:
+            changes["enabled_sensors"] = migrated
+
+    order = visualization.get("component_order")
+    if isinstance(order, list):
+        migrated = []
+        changed = False
+        for entry in order:
+            if entry in hardware_ids or entry not in hardware_by_name:
+                migrated.append(entry)
+            else:
+                migrated.extend(hw_item["id"] for hw_item in hardware_by_name[entry])
+                changed = True
+        if changed:
+            changes["component_order"] = list(dict.fromkeys(migrated))
+
+    return changes
+
+
+def migrate_sensor_selection(settings, data):
+    """Migrates the main and per-overlay selections against a snapshot.
+
+    Returns True if the settings were changed.
+    """
+    if not data:
+        return False
+    changed = False
+
+    visualization = settings.get("visualization", {})
+    if needs_migration(visualization):
+        for key, value in migrate_visualization(visualization, data).items():
+            settings.set(f"visualization.{key}", value)
+            changed = True
+
+    overlays = settings.get("overlays", []) or []
+    migrated_overlays = []
+    overlays_changed = False
+    for entry in overlays:
+        overlay_visualization = entry.get("visualization") if isinstance(entry, dict) else None
+        if needs_migration(overlay_visualization):
+            changes = migrate_visualization(overlay_visualization, data)
+            if changes:
+                entry = dict(entry, visualization=dict(overlay_visualization, **changes))
+                overlays_changed = True
+        migrated_overlays.append(entry)
+    if overlays_changed:
+        settings.set("overlays", migrated_overlays)
+        changed = True
+
+    if changed:
+        print("Migrated the sensor selection to stable sensor identifiers.")
+    return changed
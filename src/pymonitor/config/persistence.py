@@ -0,0 +1,166 @@
+# src/pymonitor/config/persistence.py
+
+import json
+import os
+import sys
+import threading
+import time
+
+
+def serialize_settings(data):
+    """Returns the settings.json text for a settings dict."""
+    return json.dumps(data, indent=4)
+
+
+def write_atomically(path, content):
+    """Writes content to a temporary file and renames it over path.
+
+    The rename replaces the file in one step, so a crash or power loss while
+    writing leaves either the old or the new settings, never a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SettingsWriter:
+    """Persists settings snapshots to a file.
+
+    schedule() is debounced: every call pushes the write `delay` seconds
+    further out, so a burst of changes (e.g. dragging a slider) results in a
+    single write of the last state, done on a background thread. Writes whose
+    serialized content equals what is already on disk are skipped.
+
+    Every snapshot handed over is numbered, and a snapshot older than the
+    last one written is never written: the background thread may already
+    have taken an older one when write() stores a newer one.
+    """
+
+    def __init__(self, path, delay=0.5):
+        self.path = path
+        self.delay = delay
+        self.writes = 0  # Number of files actually written
+        self._condition = threading.Condition()
+        self._pending = None  # Data waiting to be written
+        self._sequence = 0  # Number of the latest snapshot handed over
+        self._pending_sequence = 0
+        # The background thread took a snapshot and has not written it yet
+        self._in_flight = False
+        self._written_sequence = 0  # Number of the last snapshot written
+        self._deadline = 0.0
+        self._thread = None
+        self._io_lock = threading.Lock()  # One writer of the file at a time
+        self._last_content = self._read_current()
+
+    def _read_current(self):
+        try:
+            with open(self.path, "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def schedule(self, data):
+        """Writes data after `delay` seconds without further schedule() calls."""
+        with self._condition:
+            self._sequence += 1
+            self._pending = data
+            self._pending_sequence = self._sequence
+            self._deadline = time.monotonic() + self.delay
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="SettingsWriter", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def write(self, data):
+        """Writes data now on the calling thread. Raises OSError on failure.
+
+        Returns True if the file was written, False if it was up to date.
+        """
+        with self._condition:
+            # Supersedes anything scheduled before
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending = None
+        return self._write(data, sequence)
+
+    @property
+    def last_content(self):
+        """The settings.json text last written or seen on disk, if known."""
+        return self._last_content
+
+    def mark_written(self, content=None):
+        """Records content written to the file by someone else.
+
+        Supersedes any scheduled write, which holds settings older than the
+        file and would otherwise overwrite it. Keeps the no-op check accurate
+        after an external edit: saving the settings back to what they were
+        before it must still write the file.
+        """
+        with self._condition:
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending = None
+        with self._io_lock:
+            # A snapshot the background thread already took is dropped too
+            self._written_sequence = max(self._written_sequence, sequence)
+            if content is not None:
+                self._last_content = content
+
+    def flush(self):
+        """Writes a pending scheduled change now (e.g. on exit).
+
+        Also waits for a write the background thread is doing, which the
+        exiting process would otherwise cut short.
+        """
+        with self._condition:
+            while self._in_flight:
+                self._condition.wait()
+            data, self._pending = self._pending, None
+            sequence = self._pending_sequence
+        if data is not None:
+            try:
+                self._write(data, sequence)
+            except OSError as e:
+                print(f"Error saving settings to file: {e}", file=sys.stderr)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    # Woken early by a newer change or still debouncing
+                    self._condition.wait(remaining)
+                    continue
+                data, self._pending = self._pending, None
+                sequence = self._pending_sequence
+                self._in_flight = True
+            try:
+                self._write(data, sequence)
+            except OSError as e:
+                print(f"Error saving settings to file: {e}", file=sys.stderr)
+            finally:
+                with self._condition:
+                    self._in_flight = False
+                    self._condition.notify_all()
+
+    def _write(self, data, sequence):
+        content = serialize_settings(data)
+        with self._io_lock:
+            if sequence < self._written_sequence:
+                return False  # A newer snapshot is already on disk
+            if content == self._last_content:
+                self._written_sequence = sequence
+                return False
+            write_atomically(self.path, content)
+            self._written_sequence = sequence
+            self._last_content = content
+            self.writes += 1
+        return True
@@ -3,17 +3,169 @@
 import json
 import os
 import sys
+import threading
 import collections.abc
 
+from .persistence import SettingsWriter
+
+
+def _lookup(data, key, default):
+    """Walks a nested dict along a dotted key."""
+    return _lookup_path(data, key.split("."), default)
+
+
+def _lookup_path(data, keys, default):
+    """Walks a nested dict along an already split key."""
+    value = data
+    try:
+        for k in keys:
+            value = value[k]
+        return value
+    except (KeyError, TypeError):
+        return default
+
+
+class SettingHandle:
+    """A precompiled accessor for one setting.
+
+    get() returns a cached value and only looks the key up again when the
+    settings version changed, so hot paths can call it every tick for the
+    cost of one comparison. Works with Settings and OverlaySettings.
+    """
+
+    __slots__ = ("source", "key", "default", "_version", "_value")
+
+    def __init__(self, source, key, default=None):
+        self.source = source
+        self.key = key
+        self.default = default
+        self._version = None
+        self._value = default
+
+    def get(self):
+        version = self.source.version
+        if version != self._version:
+            # If a change lands between these two reads, the newer value is
+            # cached under the older version and simply looked up again
+            self._value = self.source.get(self.key, self.default)
+            self._version = version
+        return self._value
+
+
+class SettingsSnapshot:
+    """An immutable version of the settings.
+
+    The nested dicts of a snapshot are never modified after it is published;
+    Settings.set builds a new snapshot instead. Holding a snapshot therefore
+    gives a consistent view of the settings without any locking, and it can
+    be restored later to undo every change made since.
+    """
+
+    __slots__ = ("data", "version")
+
+    def __init__(self, data, version):
+        self.data = data
+        self.version = version
+
+    def get(self, key, default=None):
+        """Gets a setting value using dot notation."""
+        return _lookup(self.data, key, default)
+
+    def snapshot(self):
+        return self
+
 
 class Settings:
-    """Manages the application's user-configurable settings."""
+    """Manages the application's user-configurable settings.
+
+    The current settings are a SettingsSnapshot. Readers (including the
+    worker thread) just follow the current snapshot reference, so reads are
+    lock-free and never see a half-applied change. Writers copy the dicts
+    along the changed key's path and publish a new snapshot.
+    """
 
     def __init__(self, settings_path="settings.json"):
         self.path = settings_path
-        self.data = self._load_defaults()
+        # Serializes writers; readers never take it
+        self._write_lock = threading.Lock()
+        self._snapshot = SettingsSnapshot(self._load_defaults(), 0)
+        self._subscribers = []  # (key, split key, callback)
+        self._writer = SettingsWriter(settings_path)
+        # When enabled, every change is written to the file shortly after it
+        # was made (debounced, on a background thread)
+        self.autosave = False
         self.load()
 
+    @property
+    def version(self):
+        """Incremented on every change so consumers (e.g. render plans) can
+        cheaply detect that cached settings-derived state is stale."""
+        return self._snapshot.version
+
+    @property
+    def data(self):
+        """The current settings dict. It must not be modified."""
+        return self._snapshot.data
+
+    @data.setter
+    def data(self, value):
+        with self._write_lock:
+            previous = self._publish(value)
+        self._changed(previous, value)
+
+    def _publish(self, data):
+        """Makes data the current snapshot; returns the previous data."""
+        previous = self._snapshot.data
+        self._snapshot = SettingsSnapshot(data, self._snapshot.version + 1)
+        return previous
+
+    def handle(self, key, default=None):
+        """Returns a SettingHandle for a dotted key."""
+        return SettingHandle(self, key, default)
+
+    def subscribe(self, key, callback):
+        """Calls callback(new_value) whenever the value at a dotted key changes.
+
+        Callbacks run on the thread that made the change, after the new
+        snapshot is published. Subtrees shared between snapshots are compared
+        by identity first, so checking a subscription is cheap.
+        """
+        self._subscribers.append((key, tuple(key.split(".")), callback))
+
+    def unsubscribe(self, key, callback):
+        self._subscribers = [
+            entry for entry in self._subscribers if entry[0] != key or entry[2] != callback
+        ]
+
+    def _changed(self, previous, current):
+        self._notify(previous, current)
+        if self.autosave:
+            self._writer.schedule(current)
+
+    def _notify(self, previous, current):
+        missing = object()
+        for key, keys, callback in list(self._subscribers):
+            old = _lookup_path(previous, keys, missing)
+            new = _lookup_path(current, keys, missing)
+            if old is new or old == new:
+                continue
+            try:
+                callback(None if new is missing else new)
+            except Exception as e:
+                print(f"Error in settings callback for '{key}': {e}", file=sys.stderr)
+
+    def snapshot(self):
+        """Returns the current immutable settings snapshot."""
+        return self._snapshot
+
+    def restore(self, snapshot):
+        """Makes a previously taken snapshot current again (e.g. on Cancel).
+
+        This publishes a new version, so cached state derived from the
+        settings in between is recomputed.
+        """
+        self.data = snapshot.data
+
     def _load_defaults(self):
         """Returns a dictionary with the default settings."""
         return {
@@ -33,17 +185,30 @@ class Settings:
                 "auto_width": True,  # New setting to enable automatic width adjustment
             },
             "visualization": {
-                "enabled_sensors": {},
-                "component_order": [],
+                "enabled_sensors": {},  # {hardware id: {sensor id: sensor name}}
+                "component_order": [],  # Hardware ids
                 "show_component_titles": True,
                 "sensor_indentation": 4,
                 "category_spacing": 5,  # Spacing in pixels between categories
                 "display_mode": "multiline",  # 'multiline' or 'singleline'
                 "show_icons": True,
+                "show_sparklines": False,  # Mini-graph of recent values per sensor
+                "sparkline_width": 60,  # In pixels; one column per sample
+                "sparkline_height": 12,  # In pixels
             },
             "monitoring": {
                 "update_interval": 2,  # in seconds
                 "temperature_unit": "celsius",  # celsius or fahrenheit
+                # Hardware categories opened by LibreHardwareMonitor; a
+                # change takes effect on the next start
+                "hardware_categories": {
+                    "cpu": True,
+                    "gpu": True,
+                    "memory": True,
+                    "motherboard": True,
+                    "storage": True,
+                    "network": True,
+                },
                 "enabled_hardware": [
                     "Cpu",
                     "GpuNvidia",
@@ -54,10 +219,31 @@ class Settings:
                 },
                 "order": {"hardware": ["Cpu", "GpuNvidia", "Memory"], "sensors": {}},
             },
+            "performance": {
+                # PyMonitor's own CPU usage, in percent of one core, above
+                # which polling and drawing are reduced. A poll of a typical
+                # desktop every 2 s costs 1-3% of a core.
+                "cpu_budget": 5.0,
+                # Opt-in: True lets the governor enforce cpu_budget
+                "governor": False,
+            },
+            # Additional overlays. Each entry may override any "position",
+            # "appearance" or "visualization" key of the main overlay, e.g.
+            # {"position": {"monitor": 1}, "visualization": {...}}.
+            "overlays": [],
+            # Offscreen copy of the main overlay for recording/streaming tools
+            "output": {
+                "overlay": 0,  # Index into [main overlay] + "overlays"
+                "fps": 2,
+                "png_path": "",  # Write frames as PNG to this file if set
+                "shared_memory_key": "",  # Publish raw RGBA frames if set
+            },
             "about": {
                 "version": "0.2.0-beta",
                 "author": "Cascade, from Windsurf",
                 "repository_url": "https://github.com/RexPhoe/PyMonitor.NET",
+                # Reuse the last LibreHardwareMonitor release check this long
+                "version_check_ttl_hours": 24,
             },
             "icons": {
                 "hardware": {
@@ -87,35 +273,59 @@ class Settings:
         }
 
     def get(self, key, default=None):
-        """Gets a setting value using dot notation (e.g., 'window.anchor')."""
-        keys = key.split(".")
-        value = self.data
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        """Gets a setting value using dot notation (e.g., 'window.anchor').
+
+        Returned containers belong to the snapshot and must not be modified.
+        """
+        return _lookup(self._snapshot.data, key, default)
 
     def set(self, key, value):
-        """Sets a setting value using dot notation."""
+        """Sets a setting value using dot notation.
+
+        Only the dicts on the key's path are copied; everything else is shared
+        with the previous snapshot. Setting a key to its current value does
+        nothing, so refreshed controls do not trigger an autosave.
+        """
         keys = key.split(".")
-        d = self.data
-        for k in keys[:-1]:
-            d = d.setdefault(k, {})
-        d[keys[-1]] = value
+        missing = object()
+        with self._write_lock:
+            if _lookup_path(self._snapshot.data, keys, missing) == value:
+                return
+            root = dict(self._snapshot.data)
+            d = root
+            for k in keys[:-1]:
+                child = d.get(k)
+                d[k] = child = dict(child) if isinstance(child, dict) else {}
+                d = child
+            d[keys[-1]] = value
+            previous = self._publish(root)
+        self._changed(previous, root)
 
     def save(self):
-        """Saves the current settings to the file."""
-        print(f"Saving settings to: {self.path}")
+        """Saves the current settings to the file now.
+
+        The file is replaced atomically and left untouched if its content
+        would not change.
+        """
         try:
-            with open(self.path, "w") as f:
-                json.dump(self.data, f, indent=4)
-            print("Settings saved successfully.")
+            if self._writer.write(self.data):
+                print(f"Settings saved to: {self.path}")
         except IOError as e:
             print(f"Error saving settings to file: {e}", file=sys.stderr)
             raise
 
+    def flush(self):
+        """Writes any change still waiting for the autosave delay (e.g. on exit)."""
+        self._writer.flush()
+
+    def is_saved_content(self, content):
+        """Returns True if content is what this instance last wrote to the file.
+
+        Lets the file watcher recognize its own autosaves, even when the
+        settings have changed again since.
+        """
+        return content == self._writer.last_content
+
     def load(self):
         """Loads settings from the file, merging with defaults."""
         if not os.path.exists(self.path):
@@ -137,6 +347,22 @@ class Settings:
             )
             self.data = self._load_defaults()
 
+    def apply_loaded(self, user_settings, content=None):
+        """Publishes settings read from the file by someone else (live reload).
+
+        The file contents are merged with the defaults like on startup. The
+        result is not autosaved back, so an externally managed file is not
+        rewritten, and an autosave still waiting for its delay is dropped.
+        `content` is the file text the settings were parsed from; the writer
+        compares later saves against it. Returns (previous data, new data).
+        """
+        data = self._deep_update(self._load_defaults(), user_settings)
+        self._writer.mark_written(content)
+        with self._write_lock:
+            previous = self._publish(data)
+        self._notify(previous, data)
+        return previous, data
+
     def _deep_update(self, d, u):
         """Recursively update a dictionary."""
         for k, v in u.items():
@@ -145,3 +371,38 @@ class Settings:
             else:
                 d[k] = v
         return d
+
+
+class OverlaySettings:
+    """Read-only settings view for an additional overlay.
+
+    Keys present in the overlay's entry of the "overlays" list take precedence;
+    everything else falls back to the main settings.
+    """
+
+    def __init__(self, settings, index):
+        self.base = settings
+        self.index = index
+
+    @property
+    def version(self):
+        return self.base.version
+
+    def snapshot(self):
+        """Returns a view of this overlay's settings over one base snapshot."""
+        return OverlaySettings(self.base.snapshot(), self.index)
+
+    def handle(self, key, default=None):
+        """Returns a SettingHandle that honours the overlay's overrides."""
+        return SettingHandle(self, key, default)
+
+    def get(self, key, default=None):
+        """Gets a setting value using dot notation, preferring the overlay's own."""
+        base = self.base.snapshot()
+        overlays = base.get("overlays", []) or []
+        if self.index < len(overlays):
+            missing = object()
+            value = _lookup(overlays[self.index], key, missing)
+            if value is not missing:
+                return value
+        return base.get(key, default)
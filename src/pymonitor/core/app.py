@@ -1,77 +1,266 @@
 # src/pymonitor/core/app.py
 
 import sys
-import time
 import os
+import signal
+import threading
+import time
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, QSharedMemory
-from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtCore import QEvent, QObject, QThread, QTimer, pyqtSignal, QSharedMemory
 
 from ..hardware.monitor import HardwareMonitor
-from ..config.settings import Settings
+from ..config.settings import Settings, OverlaySettings
+from ..config.migration import migrate_sensor_selection
+from .history import HistoryStore
+from .governor import OverheadGovernor
+from .mailbox import FrameMailbox
+from .metrics import TickMetrics
+from .paths import user_cache_dir
+from .profiler import SamplingProfiler
+from .settings_watcher import SettingsFileWatcher
+from .startup_trace import startup_trace
 from ..ui.tray_icon import TrayIcon
 from ..ui.watermark import WatermarkWindow
-from ..ui.settings_window import SettingsWindow
+from ..ui.frame_output import FrameOutput
+from ..ui.fonts import BundledFonts
 
 PROJECT_ROOT = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "..", "..")
 )
+PROFILES_DIR = os.path.join(user_cache_dir(), "profiles")
+# Starts/stops the sampling profiler from outside (kill -USR1 <pid>, or
+# Ctrl+Break in the console on Windows)
+PROFILE_SIGNAL = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
 
 
 class HardwareWorker(QObject):
-    """A worker that runs in a separate thread to fetch hardware data."""
+    """A worker that runs in a separate thread to fetch hardware data.
+
+    Hardware is polled once per tick; the same snapshot is then rendered by
+    every overlay's render plan, so polling cost does not depend on the
+    number of overlays.
 
-    data_updated = pyqtSignal(str)
+    Frames are handed to the UI through the application's FrameMailbox rather
+    than as signal payloads: the worker overwrites the single slot and only
+    emits frame_available when the slot was empty, so queued frames cannot
+    pile up while the GUI thread is busy.
+    """
+
+    frame_available = pyqtSignal()
+    # Emitted with the exception if the hardware backend cannot be opened
+    backend_failed = pyqtSignal(object)
 
     def __init__(self, app):
         super().__init__()
         self.app = app
         self.is_running = False
+        # Set to cut the sleep between polls short (new poll or stop request)
+        self._wake = threading.Event()
+        self._update_interval = app.settings.handle("monitoring.update_interval", 2)
+        self._sparkline_width = app.settings.handle("visualization.sparkline_width", 60)
+        # Looked up once; recording into a histogram is then a plain call
+        self._poll_time = app.metrics.histogram("poll")
+        self._render_time = app.metrics.histogram("render")
+        self._history_time = app.metrics.histogram("history")
+        self._tick_time = app.metrics.histogram("tick")
+        # CPU time of this thread at the end of the last tick, read by the
+        # governor from the GUI thread
+        self.cpu_time = 0.0
 
     def run(self):
-        """The main work loop."""
+        """Opens the hardware backend, then runs the main work loop.
+
+        The backend is opened here rather than before the event loop starts,
+        so the overlay and tray icon are up while Computer.Open() probes the
+        hardware; the first frame replaces the overlay's placeholder text.
+        """
         self.is_running = True
+        # Names the QThread in traces and profiles instead of "Dummy-1"
+        threading.current_thread().name = "HardwareWorker"
+        try:
+            self.app.hardware_monitor.initialize()
+        except Exception as e:
+            self.is_running = False
+            self.backend_failed.emit(e)
+            return
+        start, polled, rendered = self.tick()
+        startup_trace.add_span("first poll", start, polled)
+        startup_trace.add_span("first render", polled, rendered)
         while self.is_running:
-            data = self.app.hardware_monitor.get_hardware_data()
-            display_text = self.app._format_data_for_display(data)
-            self.data_updated.emit(display_text)
-            interval = self.app.settings.get("monitoring.update_interval", 2)
-            time.sleep(interval)
+            self._wake.wait(
+                self._update_interval.get() * self.app.governor.current.interval_scale
+            )
+            self._wake.clear()
+            if self.is_running:
+                self.tick()
+
+    def tick(self):
+        """Polls the hardware once, renders every overlay and posts the frame.
+
+        Stage durations go to the application's TickMetrics. Returns the
+        start, polled and rendered perf_counter() timestamps.
+        """
+        start = time.perf_counter()
+        data = self.app.hardware_monitor.get_hardware_data()
+        polled = time.perf_counter()
+        # Publish the snapshot for GUI-thread consumers (settings previews).
+        # It is never mutated after this point, so sharing it is safe.
+        self.app.latest_data = data
+        if self.app.recorder is not None:
+            self.app.recorder.record(data)
+        overlays = self.app.overlays
+        # One HTML string per overlay, in the order of Application.overlays
+        texts = [overlay.render_plan.render(data) for overlay in overlays]
+        rendered = time.perf_counter()
+        # Sparkline pixmaps are drawn on the GUI thread when the text is
+        # set, so recording after rendering still includes this sample
+        self._record_history(data, overlays, start)
+        recorded = time.perf_counter()
+        if self.app.frame_mailbox.post(texts):
+            self.frame_available.emit()
+        self._poll_time.record(polled - start)
+        self._render_time.record(rendered - polled)
+        self._history_time.record(recorded - rendered)
+        self._tick_time.record(time.perf_counter() - start)
+        self.cpu_time = time.thread_time()
+        return start, polled, rendered
+
+    def poll_now(self):
+        """Wakes the worker so it polls immediately instead of after the interval."""
+        self._wake.set()
+
+    def _record_history(self, data, overlays, polled_at):
+        """Records sparkline samples for the sensors shown by any overlay.
+
+        Uses the selections the render plans compiled for this tick, so no
+        settings are read here.
+        """
+        selections = [
+            overlay.render_plan.sensor_order
+            for overlay in overlays
+            if overlay.render_plan.draws_sparklines
+        ]
+        if not selections:
+            # Still recorded, so the store drops the histories nobody draws
+            selection = {}
+        elif len(selections) == 1:
+            selection = selections[0]
+        else:
+            selection = {}
+            for sensor_order in selections:
+                for hardware_id, sensor_ids in sensor_order.items():
+                    selection.setdefault(hardware_id, set()).update(sensor_ids)
+        self.app.history.set_capacity(int(self._sparkline_width.get()))
+        self.app.history.record(data, selection, polled_at)
 
     def stop(self):
         """Stops the worker loop."""
         self.is_running = False
+        self._wake.set()
 
 
 class Application(QApplication):
     """Main application class, inheriting from QApplication for GUI support."""
 
-    def __init__(self, args):
+    def __init__(
+        self, args, hardware_factory=None, settings_path=None, clock=time.monotonic
+    ):
+        """Creates the application.
+
+        `hardware_factory` (called with the Settings) and `settings_path`
+        replace the LibreHardwareMonitor backend and the project's
+        settings.json, e.g. for benchmarks. `clock` is the wall clock of the
+        metrics windows and the CPU governor; the soak test passes a virtual
+        one.
+        """
+        start = time.perf_counter()
         super().__init__(args)
+        startup_trace.add_span("QApplication", start, time.perf_counter())
 
-        # Load bundled Nerd Fonts so icons render even if not installed system-wide
-        try:
-            fonts_dir = os.path.join(PROJECT_ROOT, "fonts")
-            if os.path.isdir(fonts_dir):
-                for fname in os.listdir(fonts_dir):
-                    if fname.lower().endswith(".ttf"):
-                        QFontDatabase.addApplicationFont(os.path.join(fonts_dir, fname))
-        except Exception as e:
-            # Non-fatal: continue even if fonts fail to load
-            print(f"Warning: failed to load fonts: {e}")
+        # Bundled Nerd Fonts render icons even if not installed system-wide.
+        # Overlays register the faces they use when they apply their style.
+        self.fonts = BundledFonts(os.path.join(PROJECT_ROOT, "fonts"))
 
         # Single instance lock
         self.shared_memory = QSharedMemory("PyMonitor.NET_SINGLE_INSTANCE_LOCK")
 
-        self.settings = Settings(os.path.join(PROJECT_ROOT, "settings.json"))
-        self.hardware_monitor = HardwareMonitor(self.settings, lib_path=PROJECT_ROOT)
-        self.watermark = WatermarkWindow(self)
-        self.tray_icon = TrayIcon(self)
-        self.settings_window = SettingsWindow(self)
+        with startup_trace.phase("Settings.load"):
+            self.settings = Settings(
+                settings_path or os.path.join(PROJECT_ROOT, "settings.json")
+            )
+        self.settings.autosave = True
+        # The library itself is loaded and opened by the worker thread
+        with startup_trace.phase("HardwareMonitor"):
+            if hardware_factory is None:
+                self.hardware_monitor = HardwareMonitor(
+                    self.settings, lib_path=PROJECT_ROOT
+                )
+            else:
+                self.hardware_monitor = hardware_factory(self.settings)
+        # Latency histograms of the polling and display pipeline
+        self.metrics = TickMetrics(clock=clock)
+        self.hardware_monitor.metrics = self.metrics
+        self._delivery_time = self.metrics.histogram("frame delivery")
+        self._overlay_update_time = self.metrics.histogram("overlay update")
+        # Set if the hardware backend failed to open; main() reports it
+        self.startup_error = None
+        self._trace_frame_shown = False  # First frame seen (--trace-startup)
+        self.frame_mailbox = FrameMailbox()
+        self.latest_data = []  # Latest hardware snapshot, published by the worker
+        self.recorder = None  # SessionRecorder of --record, fed by the worker
+        # (settings version, hardware ids) the sensor selection was last
+        # migrated against
+        self._migration_checked = None
+        self.history = HistoryStore(
+            int(self.settings.get("visualization.sparkline_width", 60))
+        )
+        # Recorded values are in display units; a graph mixing °C and °F
+        # samples would show a jump that never happened. Subscribing covers
+        # the settings window, Cancel and settings.json reloads alike.
+        self.settings.subscribe(
+            "monitoring.temperature_unit", lambda unit: self.history.clear()
+        )
+        with startup_trace.phase("widgets"):
+            self.watermark = WatermarkWindow(self)
+            # The main overlay plus any additional ones configured in "overlays"
+            self.overlays = [self.watermark] + [
+                WatermarkWindow(self, OverlaySettings(self.settings, index))
+                for index in range(len(self.settings.get("overlays", []) or []))
+            ]
+            self.tray_icon = TrayIcon(self)
+        self.frame_output = self._create_frame_output()
+        # Created on first open; most sessions never show it
+        self.settings_window = None
+        # Degrades polling and drawing while PyMonitor uses too much CPU
+        self.governor = OverheadGovernor(self, wall_clock=clock)
+        self.governor.status_changed.connect(self.tray_icon.setToolTip)
+        # On-demand stack sampling, from the tray menu or PROFILE_SIGNAL
+        self.profiler = None
+        # Lowers the GIL switch interval while profiling (--precise-profiling)
+        self.precise_profiling = False
+        if PROFILE_SIGNAL is not None:
+            signal.signal(
+                PROFILE_SIGNAL,
+                lambda *_: QTimer.singleShot(0, self.toggle_profiling),
+            )
+        # Applies edits made to settings.json while the app is running
+        self.settings_watcher = SettingsFileWatcher(self.settings, self)
+        self.settings_watcher.settings_changed.connect(self.apply_settings_changes)
 
         self.setQuitOnLastWindowClosed(False)
         self.aboutToQuit.connect(self.cleanup)
 
+    def _create_frame_output(self):
+        """Returns a FrameOutput for the configured overlay, or None if disabled."""
+        if not (
+            self.settings.get("output.png_path")
+            or self.settings.get("output.shared_memory_key")
+        ):
+            return None
+        index = int(self.settings.get("output.overlay", 0))
+        overlay = self.overlays[index] if index < len(self.overlays) else self.watermark
+        return FrameOutput(overlay, self.settings)
+
     def is_already_running(self):
         """Checks if another instance of the application is running."""
         if self.shared_memory.attach():
@@ -86,7 +275,6 @@ class Application(QApplication):
     def run(self):
         """Initializes components and starts the application event loop."""
         print("Application starting...")
-        self.hardware_monitor.initialize()
 
         # Set up the background thread for monitoring
         self.thread = QThread()
@@ -95,11 +283,21 @@ class Application(QApplication):
 
         # Connect signals and slots
         self.thread.started.connect(self.worker.run)
-        self.worker.data_updated.connect(self.watermark.update_text)
+        self.worker.frame_available.connect(self.on_frame_available)
+        self.worker.backend_failed.connect(self.on_backend_failed)
 
         self.thread.start()
-        self.watermark.show()
-        self.tray_icon.run()
+        self.governor.start(self.worker)
+        with startup_trace.phase("show overlays and tray"):
+            for overlay in self.overlays:
+                overlay.show()
+            if self.frame_output:
+                self.frame_output.start()
+            self.tray_icon.run()
+        if startup_trace.enabled:
+            # Paints of the main overlay mark the first visible milestones
+            self.watermark.label.installEventFilter(self)
+            QTimer.singleShot(0, lambda: startup_trace.mark("event loop running"))
 
         print("Starting event loop...")
         return self.exec()
@@ -108,6 +306,13 @@ class Application(QApplication):
         """Clean up resources before exiting."""
         print("Application cleaning up...")
         try:
+            if hasattr(self, "governor") and self.governor:
+                self.governor.stop()
+
+            # Keep a profile that was still being recorded
+            if hasattr(self, "profiler") and self.profiler and self.profiler.running:
+                self.toggle_profiling()
+
             # Stop the worker thread
             if hasattr(self, "worker") and self.worker:
                 print("Stopping worker...")
@@ -119,6 +324,16 @@ class Application(QApplication):
                 self.thread.quit()
                 self.thread.wait(3000)  # Wait max 3 seconds for thread to finish
 
+            # Finish the session file once the worker no longer records
+            if hasattr(self, "recorder") and self.recorder:
+                print(f"Recorded {self.recorder.frames} snapshots to: {self.recorder.path}")
+                self.recorder.close()
+
+            # Stop the offscreen frame output
+            if hasattr(self, "frame_output") and self.frame_output:
+                print("Stopping frame output...")
+                self.frame_output.stop()
+
             # Close hardware monitor
             if hasattr(self, "hardware_monitor") and self.hardware_monitor:
                 print("Closing hardware monitor...")
@@ -129,16 +344,28 @@ class Application(QApplication):
                 print("Hiding tray icon...")
                 self.tray_icon.hide()
 
-            # Hide watermark window
-            if hasattr(self, "watermark") and self.watermark:
+            # Hide watermark windows
+            if hasattr(self, "overlays"):
                 print("Hiding watermark...")
-                self.watermark.hide()
+                for overlay in self.overlays:
+                    overlay.hide()
+
+            # Stop watching settings.json
+            if hasattr(self, "settings_watcher") and self.settings_watcher:
+                self.settings_watcher.stop()
 
             # Close settings window
             if hasattr(self, "settings_window") and self.settings_window:
                 print("Closing settings window...")
                 self.settings_window.close()
 
+            # Report a startup trace that never reached the first frame
+            startup_trace.finish()
+
+            # Write settings changes still waiting for the autosave delay
+            if hasattr(self, "settings"):
+                self.settings.flush()
+
             # Detach shared memory
             if hasattr(self, "shared_memory") and self.shared_memory.isAttached():
                 print("Detaching shared memory...")
@@ -149,183 +376,192 @@ class Application(QApplication):
 
         print("Cleanup complete. Exiting.")
 
-    def exit(self):
+    def toggle_profiling(self):
+        """Starts the sampling profiler, or stops it and writes its output."""
+        if self.profiler is None or not self.profiler.running:
+            self.profiler = SamplingProfiler(precise=self.precise_profiling)
+            self.profiler.start()
+            print("Profiling started.")
+            self.tray_icon.set_profiling(True)
+            return
+        samples = self.profiler.stop()
+        self.tray_icon.set_profiling(False)
+        try:
+            collapsed_path, pstats_path = self.profiler.write(PROFILES_DIR)
+        except OSError as e:
+            print(f"Could not write profile: {e}", file=sys.stderr)
+            return
+        print(
+            f"Profiling stopped after {self.profiler.duration:.1f} s "
+            f"({samples} samples).\n"
+            f"  Collapsed stacks: {collapsed_path}\n"
+            f"  pstats: {pstats_path}"
+        )
+        self.tray_icon.showMessage(
+            "PyMonitor.NET", f"Profile written to {os.path.dirname(collapsed_path)}"
+        )
+
+    def exit(self, return_code=0):
         """Signals the application to exit gracefully."""
         print("Exit requested.")
         # Only perform cleanup manually if we're actually exiting via tray
-        # Don't call cleanup here to avoid interference with normal startup
-        self.quit()
+        # Don't call cleanup here to avoid interference with normal startup.
+        # quit() would first ask every window to close, which the overlays
+        # refuse, so leave the event loop directly.
+        QApplication.exit(return_code)
+
+    def on_frame_available(self):
+        """Renders the newest frame from the mailbox, skipping superseded ones."""
+        texts = self.frame_mailbox.take()
+        if texts is not None:
+            start = time.perf_counter()
+            self._delivery_time.record(start - self.frame_mailbox.taken_posted_at)
+            if startup_trace.enabled and not self._trace_frame_shown:
+                startup_trace.mark("first frame received")
+                self._trace_frame_shown = True
+                # Report anyway if the frame does not repaint the overlay
+                # (e.g. no sensors are selected)
+                QTimer.singleShot(1000, startup_trace.finish)
+            if self._migrate_sensor_selection():
+                # The frame was rendered with the old name-based selection.
+                # Autosave persists the migrated selection.
+                self.refresh_overlays()
+            else:
+                self.update_overlays(texts)
+            self._overlay_update_time.record(time.perf_counter() - start)
+            if self.settings_window is not None and self.settings_window.isVisible():
+                self.settings_window.refresh_sensor_catalog(self.latest_data)
+
+    def _migrate_sensor_selection(self):
+        """Migrates name-based sensor selections against the latest snapshot.
+
+        Entries for hardware that is not present stay name-based, so the
+        migration only runs again once the settings or the set of hardware
+        ids changed. Returns True if the settings were changed.
+        """
+        hardware_ids = frozenset(hw_item["id"] for hw_item in self.latest_data)
+        if (self.settings.version, hardware_ids) == self._migration_checked:
+            return False
+        changed = migrate_sensor_selection(self.settings, self.latest_data)
+        # Taken after the migration, so its own changes are not checked again
+        self._migration_checked = (self.settings.version, hardware_ids)
+        return changed
+
+    def eventFilter(self, obj, event):
+        """Marks the main overlay's first paints while tracing startup."""
+        if event.type() == QEvent.Type.Paint and obj is self.watermark.label:
+            if not self._trace_frame_shown:
+                startup_trace.mark("overlay painted (placeholder)")
+            else:
+                startup_trace.mark("first frame painted")
+                obj.removeEventFilter(self)
+                # Report once the paint itself has finished
+                QTimer.singleShot(0, startup_trace.finish)
+        return super().eventFilter(obj, event)
+
+    def on_backend_failed(self, error):
+        """Exits when the hardware backend could not be opened."""
+        print(f"Could not open the hardware backend: {error}", file=sys.stderr)
+        self.startup_error = error
+        self.exit(1)
+
+    def get_settings_window(self):
+        """Returns the settings window, creating it the first time it is needed."""
+        if self.settings_window is None:
+            from ..ui.settings_window import SettingsWindow
+
+            self.settings_window = SettingsWindow(self)
+        return self.settings_window
+
+    def update_overlays(self, texts):
+        """Hands each overlay the text rendered for it by the worker."""
+        for overlay, text in zip(self.overlays, texts):
+            overlay.update_text(text)
+
+    def refresh_overlays(self):
+        """Re-renders every overlay from the latest snapshot without polling hardware."""
+        data = self.latest_data
+        for overlay in self.overlays:
+            overlay.update_text(overlay.render_plan.render(data))
+
+    def request_poll(self):
+        """Asks the worker thread for an immediate hardware poll."""
+        if hasattr(self, "worker") and self.worker:
+            self.worker.poll_now()
+
+    def update_overlay_appearance(self):
+        """Re-applies appearance settings to every overlay."""
+        for overlay in self.overlays:
+            overlay.update_appearance()
+
+    def reposition_overlays(self):
+        """Recomputes the position of every overlay from the settings."""
+        for overlay in self.overlays:
+            overlay.reposition()
+
+    def update_overlay_flags(self):
+        """Re-applies window flags (e.g. always on top) to every overlay."""
+        for overlay in self.overlays:
+            overlay.update_flags()
+
+    def apply_settings_changes(self, changed):
+        """Applies settings changed outside the app (see SettingsFileWatcher).
+
+        `changed` holds dotted keys such as "appearance.font_size". Only the
+        affected parts are updated: overlays are restyled, repositioned or
+        re-rendered and polling is rescheduled, but the hardware backend is
+        never reopened. Render plans recompile on their own, since they
+        follow the settings version.
+        """
+        sections = {key.split(".", 1)[0] for key in changed}
+
+        if "overlays" in sections:
+            self._sync_overlay_windows()
+        if sections & {"appearance", "overlays"} or changed & {
+            "position.width",
+            "position.auto_width",
+            "visualization.sparkline_height",
+            "visualization.sparkline_width",
+        }:
+            self.update_overlay_appearance()
+        if sections & {"position", "overlays"}:
+            self.reposition_overlays()
+        if "window.always_on_top" in changed or "overlays" in sections:
+            self.update_overlay_flags()
+        if sections & {"visualization", "icons", "monitoring", "overlays"}:
+            # Units and selections show up without waiting for the next poll
+            self.refresh_overlays()
+        if changed & {"monitoring.update_interval", "monitoring.temperature_unit"}:
+            # Restart the sleep so a new interval takes effect now (a new
+            # temperature unit already cleared the sparkline history)
+            self.request_poll()
+        if sections & {"output", "overlays"}:
+            self._restart_frame_output()
+        if self.settings_window is not None and self.settings_window.isVisible():
+            self.settings_window.apply_reloaded_settings()
+
+    def _sync_overlay_windows(self):
+        """Creates or removes overlay windows to match the "overlays" list."""
+        wanted = 1 + len(self.settings.get("overlays", []) or [])
+        overlays = self.overlays[:wanted]
+        for index in range(len(overlays) - 1, wanted - 1):
+            overlay = WatermarkWindow(self, OverlaySettings(self.settings, index))
+            overlay.show()
+            overlays.append(overlay)
+        removed = self.overlays[wanted:]
+        # The worker reads this list every tick; replace it rather than mutate it
+        self.overlays = overlays
+        for overlay in removed:
+            overlay.hide()
+            overlay.deleteLater()
+
+    def _restart_frame_output(self):
+        if self.frame_output:
+            self.frame_output.stop()
+        self.frame_output = self._create_frame_output()
+        if self.frame_output:
+            self.frame_output.start()
 
     def _format_data_for_display(self, data):
-        """Formats the hardware data for display based on user settings."""
-        lines = []
-        enabled_sensors_config = self.settings.get("visualization.enabled_sensors", {})
-        component_order = self.settings.get("visualization.component_order", [])
-        show_titles = self.settings.get("visualization.show_component_titles", True)
-        indentation = self.settings.get("visualization.sensor_indentation", 4)
-        indent_space = "&nbsp;" * indentation
-        category_spacing = self.settings.get("visualization.category_spacing", 1)
-        display_mode = self.settings.get("visualization.display_mode", "multiline")
-        show_icons = self.settings.get("visualization.show_icons", True)
-
-        # Read customizable icons from settings with fallback defaults
-        icons_cfg = self.settings.get("icons", {}) or {}
-        hw_icons_user = icons_cfg.get("hardware", {}) or {}
-        sensor_icons_user = icons_cfg.get("sensors", {}) or {}
-
-        hw_icons_fallback = {
-            "Cpu": "\uf2db",
-            "GPU": "\uf21b5",
-            "GpuNvidia": "\uf21b5",
-            "GpuAmd": "\uf21b5",
-            "GpuIntel": "\uf21b5",
-            "Memory": "\uf96a",
-            "Motherboard": "\uf2db",
-            "Storage": "\uf287",
-            "HDD": "\uf287",
-            "SSD": "\uf287",
-            "Network": "\uf6ff",
-            "Wifi": "\uf5a9",
-        }
-        sensor_icons_fallback = {
-            "temperature": "\uf2c9",
-            "load": "\uf141",
-            "clock": "\uf251",
-            "power": "\uf0e7",
-            "fan": "\uf863",
-            "data": "\uf1c0",
-            "voltage": "\uf1e6",
-        }
-
-        def get_hw_icon(hw_type_or_name: str) -> str:
-            if not hw_type_or_name:
-                return ""
-            # Exact user overrides first
-            if hw_type_or_name in hw_icons_user:
-                return hw_icons_user[hw_type_or_name]
-            cap = hw_type_or_name.capitalize()
-            if cap in hw_icons_user:
-                return hw_icons_user[cap]
-            # Fallback exacts
-            if hw_type_or_name in hw_icons_fallback:
-                return hw_icons_fallback[hw_type_or_name]
-            if cap in hw_icons_fallback:
-                return hw_icons_fallback[cap]
-            # Heuristics by substring
-            low = hw_type_or_name.lower()
-            if "gpu" in low:
-                return hw_icons_user.get("GPU", hw_icons_fallback.get("GPU", ""))
-            if "cpu" in low:
-                return hw_icons_user.get("Cpu", hw_icons_fallback.get("Cpu", ""))
-            if "mem" in low:
-                return hw_icons_user.get("Memory", hw_icons_fallback.get("Memory", ""))
-            if "stor" in low or "disk" in low:
-                return hw_icons_user.get(
-                    "Storage", hw_icons_fallback.get("Storage", "")
-                )
-            if "net" in low:
-                return hw_icons_user.get(
-                    "Network", hw_icons_fallback.get("Network", "")
-                )
-            if "wifi" in low:
-                return hw_icons_user.get("Wifi", hw_icons_fallback.get("Wifi", ""))
-            return ""
-
-        def get_sensor_icon_by_type(sensor_type_str: str) -> str:
-            t = (sensor_type_str or "").lower()
-            if "temperature" in t:
-                return sensor_icons_user.get(
-                    "temperature", sensor_icons_fallback["temperature"]
-                )
-            if "load" in t:
-                return sensor_icons_user.get("load", sensor_icons_fallback["load"])
-            if "clock" in t:
-                return sensor_icons_user.get("clock", sensor_icons_fallback["clock"])
-            if "power" in t:
-                return sensor_icons_user.get("power", sensor_icons_fallback["power"])
-            if "fan" in t:
-                return sensor_icons_user.get("fan", sensor_icons_fallback["fan"])
-            if "data" in t:
-                return sensor_icons_user.get("data", sensor_icons_fallback["data"])
-            if "voltage" in t:
-                return sensor_icons_user.get(
-                    "voltage", sensor_icons_fallback["voltage"]
-                )
-            return ""
-
-        # Sort data based on the component_order setting
-        if component_order:
-            data.sort(
-                key=lambda x: (
-                    component_order.index(x["name"])
-                    if x["name"] in component_order
-                    else float("inf")
-                )
-            )
-
-        section_count = 0  # Track number of sections added
-
-        for hardware_item in data:
-            hardware_name = hardware_item["name"]
-            hardware_type = hardware_item.get("type", "")
-            enabled_sensors = enabled_sensors_config.get(hardware_name, [])
-
-            filtered_sensors = [
-                s for s in hardware_item["sensors"] if s["name"] in enabled_sensors
-            ]
-            filtered_sensors.sort(key=lambda s: enabled_sensors.index(s["name"]))
-
-            if filtered_sensors:
-                # Add spacing before this section (but not before the first section)
-                if section_count > 0 and category_spacing > 0:
-                    lines.append(
-                        f'<div style="margin-bottom: {category_spacing}px;"></div>'
-                    )
-                title_icon = (
-                    get_hw_icon(hardware_type or hardware_name) if show_icons else ""
-                )
-                title_prefix = (title_icon + " ") if (show_icons and title_icon) else ""
-
-                if display_mode == "multiline":
-                    if show_titles:
-                        lines.append(f"<b>{title_prefix}{hardware_name}</b>")
-
-                    for sensor in filtered_sensors:
-                        prefix = indent_space if show_titles else ""
-                        sensor_icon = (
-                            get_sensor_icon_by_type(sensor.get("type", ""))
-                            if show_icons
-                            else ""
-                        )
-                        sensor_label = (
-                            f"{sensor_icon} {sensor['name']}"
-                            if sensor_icon
-                            else sensor["name"]
-                        )
-                        lines.append(f"{prefix}{sensor_label}: {sensor['value']}")
-                elif display_mode == "singleline":
-                    sensor_strings = []
-                    for s in filtered_sensors:
-                        sensor_icon = (
-                            get_sensor_icon_by_type(s.get("type", ""))
-                            if show_icons
-                            else ""
-                        )
-                        name_part = (
-                            f"{sensor_icon} {s['name']}" if sensor_icon else s["name"]
-                        )
-                        sensor_strings.append(f"{name_part}: {s['value']}")
-                    line = " | ".join(sensor_strings)
-                    if show_titles:
-                        lines.append(f"<b>{title_prefix}{hardware_name}</b>: {line}")
-                    else:
-                        lines.append(line)
-
-                # Increment section counter since we added a section
-                section_count += 1
-
-        # Remove the last blank lines if they exist
-        while lines and lines[-1] == "":
-            lines.pop()
-
-        return "<br>".join(lines)
+        """Formats the hardware data for the main overlay based on user settings."""
+        return self.watermark.render_plan.render(data)
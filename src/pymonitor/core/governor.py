@@ -0,0 +1,190 @@
+# src/pymonitor/core/governor.py
+
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+SAMPLE_SECONDS = 10
+# Usage must fall below this fraction of the budget, for RESTORE_SAMPLES
+# samples in a row, before a degradation is undone. Each level roughly
+# halves the work, so restoring at half the budget does not oscillate.
+RESTORE_FRACTION = 0.5
+RESTORE_SAMPLES = 3
+
+
+class DegradationLevel:
+    """One step of the governor: how much polling and drawing is reduced."""
+
+    __slots__ = ("interval_scale", "idle_update_every", "sparklines")
+
+    def __init__(self, interval_scale, idle_update_every, sparklines):
+        self.interval_scale = interval_scale  # Multiplies the update interval
+        # Hardware no overlay shows is updated on every n-th poll only
+        self.idle_update_every = idle_update_every
+        self.sparklines = sparklines  # False suspends sparkline drawing
+
+    def describe(self):
+        """Returns what this level changes, e.g. "polling interval x2"."""
+        changes = []
+        if self.interval_scale > 1:
+            changes.append(f"polling interval x{self.interval_scale}")
+        if self.idle_update_every > 1:
+            changes.append(f"hidden hardware every {self.idle_update_every} polls")
+        if not self.sparklines:
+            changes.append("sparklines off")
+        return ", ".join(changes)
+
+
+LEVELS = (
+    DegradationLevel(1, 1, True),
+    DegradationLevel(2, 1, True),
+    DegradationLevel(2, 4, True),
+    DegradationLevel(4, 8, False),
+)
+
+
+class OverheadGovernor(QObject):
+    """Keeps PyMonitor's own CPU usage within a budget.
+
+    Every SAMPLE_SECONDS it measures the CPU time the process used
+    (time.process_time) against wall time, split into the worker thread, the
+    GUI thread and everything else (Qt and .NET threads) with the threads'
+    CPU clocks. If "performance.governor" is on (it is off by default) and
+    usage is over "performance.cpu_budget" (percent of one core), it
+    degrades one level per sample: longer polling intervals, then
+    less frequent updates of hardware no overlay shows, then no sparklines.
+    Levels are undone one at a time once usage stays well under the budget.
+
+    The worker and the hardware monitor read the current level's attributes
+    each tick; status_changed carries the text for the tray tooltip.
+    """
+
+    status_changed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        app,
+        process_clock=time.process_time,
+        thread_clock=time.thread_time,
+        wall_clock=time.monotonic,
+    ):
+        super().__init__(app)
+        self.app = app
+        self.process_clock = process_clock
+        self.thread_clock = thread_clock
+        self.wall_clock = wall_clock
+        self._budget = app.settings.handle("performance.cpu_budget", 5.0)
+        self._enabled = app.settings.handle("performance.governor", False)
+        self.level = 0
+        self.usage = None  # Percent of one core over the last sample
+        self.breakdown = {}  # "worker" / "gui" / "other" -> percent
+        self._quiet_samples = 0
+        self._worker = None
+        self._last = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(SAMPLE_SECONDS * 1000)
+        self._timer.timeout.connect(self.sample)
+
+    @property
+    def current(self):
+        return LEVELS[self.level]
+
+    def start(self, worker):
+        """Starts sampling; `worker` publishes its thread's CPU time as cpu_time."""
+        self._worker = worker
+        self._last = self._read_clocks()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _read_clocks(self):
+        worker_cpu = self._worker.cpu_time if self._worker is not None else 0.0
+        return self.wall_clock(), self.process_clock(), self.thread_clock(), worker_cpu
+
+    def sample(self):
+        """Measures usage since the last sample and adjusts the level."""
+        now = self._read_clocks()
+        if self._last is None:
+            self._last = now
+            return
+        wall, process, gui, worker = (a - b for a, b in zip(now, self._last))
+        self._last = now
+        if wall <= 0:
+            return
+        self.usage = process / wall * 100
+        self.breakdown = {
+            "worker": worker / wall * 100,
+            "gui": gui / wall * 100,
+            "other": max(0.0, process - worker - gui) / wall * 100,
+        }
+
+        level = self.level
+        budget = float(self._budget.get())
+        if not self._enabled.get():
+            level = 0
+            self._quiet_samples = 0
+        elif self.usage > budget:
+            level = min(level + 1, len(LEVELS) - 1)
+            self._quiet_samples = 0
+        elif self.usage < budget * RESTORE_FRACTION and level > 0:
+            self._quiet_samples += 1
+            if self._quiet_samples >= RESTORE_SAMPLES:
+                level -= 1
+                self._quiet_samples = 0
+        else:
+            self._quiet_samples = 0
+
+        if level != self.level:
+            self.set_level(level)
+        elif level:
+            # Follows overlays and sensor selections changed while degraded
+            self._apply()
+        self.status_changed.emit(self.status())
+
+    def set_level(self, level):
+        """Applies a degradation level to the monitor and the overlays."""
+        previous = LEVELS[self.level]
+        self.level = level
+        current = LEVELS[level]
+        print(
+            f"CPU governor: level {level} ({current.describe() or 'full rate'}), "
+            f"usage {self.usage or 0:.2f}% of one core"
+        )
+        self._apply()
+        if current.sparklines != previous.sparklines:
+            self.app.refresh_overlays()
+        if current.interval_scale < previous.interval_scale:
+            # Do not wait out the longer interval before polling faster
+            self.app.request_poll()
+
+    def _apply(self):
+        current = self.current
+        monitor = self.app.hardware_monitor
+        monitor.idle_update_every = current.idle_update_every
+        monitor.active_hardware = self.shown_hardware() if self.level else None
+        for overlay in self.app.overlays:
+            overlay.render_plan.sparklines_allowed = current.sparklines
+
+    def shown_hardware(self):
+        """Returns the ids of the hardware any overlay shows sensors of."""
+        shown = set()
+        for overlay in self.app.overlays:
+            shown.update(overlay.settings.get("visualization.enabled_sensors", {}) or {})
+        return shown
+
+    def status(self):
+        """Returns the tray tooltip text: usage, budget and degradations."""
+        lines = ["PyMonitor.NET"]
+        if self.usage is not None:
+            lines.append(
+                f"CPU: {self.usage:.2f}% of one core (budget {float(self._budget.get()):g}%)"
+            )
+            lines.append(
+                "Worker {worker:.2f}%, UI {gui:.2f}%, other {other:.2f}%".format(
+                    **self.breakdown
+                )
+            )
+        if self.level:
+            lines.append(f"Reduced: {self.current.describe()}")
+        return "\n".join(lines)
@@ -0,0 +1,119 @@
+# src/pymonitor/core/history.py
+
+import threading
+import time
+from collections import deque
+from urllib.parse import quote
+
+SPARKLINE_SCHEME = "sparkline"
+
+
+def sensor_key(sensor):
+    """Returns the key used to track a sensor's history across ticks."""
+    return sensor["id"]
+
+
+def sparkline_url(key):
+    """Returns the image URL the overlay HTML uses to embed a sensor's sparkline."""
+    return f"{SPARKLINE_SCHEME}:{quote(key, safe='')}"
+
+
+class SensorHistory:
+    """A fixed-size ring buffer with the most recent samples of one sensor."""
+
+    def __init__(self, capacity, sensor_type=""):
+        self.sensor_type = sensor_type
+        self.samples = deque(maxlen=capacity)
+        # Total number of samples ever appended. Readers compare it with the
+        # count they last saw to find out how many samples are new.
+        self.count = 0
+
+    def append(self, value):
+        self.samples.append(value)
+        self.count += 1
+
+
+class HistoryStore:
+    """Per-sensor sample history, written by the worker thread and read by the UI."""
+
+    def __init__(self, capacity=60):
+        self.capacity = capacity
+        self._histories = {}
+        self._lock = threading.Lock()
+        # Incremented whenever histories are dropped, so readers holding
+        # state derived from them (SparklineSet) know to drop it too
+        self.version = 0
+        self._cleared_at = float("-inf")  # perf_counter() of the last clear()
+
+    def set_capacity(self, capacity):
+        """Changes the number of samples kept per sensor, keeping the newest ones."""
+        if capacity == self.capacity:
+            return
+        with self._lock:
+            self.capacity = capacity
+            for history in self._histories.values():
+                history.samples = deque(history.samples, maxlen=capacity)
+
+    def record(self, data, enabled_sensors, polled_at=None):
+        """Appends the current raw value of every displayed sensor.
+
+        enabled_sensors maps hardware ids to containers of sensor ids; the
+        histories of sensors no longer in it are dropped, so a sensor shown
+        again later does not join its old samples to the new ones.
+        `polled_at` is the perf_counter() time the poll started; a snapshot
+        polled before the last clear() is not recorded.
+        """
+        with self._lock:
+            if polled_at is not None and polled_at < self._cleared_at:
+                return
+            recorded = 0
+            for hardware_item in data:
+                enabled = enabled_sensors.get(hardware_item["id"])
+                if not enabled:
+                    continue
+                for sensor in hardware_item["sensors"]:
+                    if sensor["id"] not in enabled:
+                        continue
+                    key = sensor_key(sensor)
+                    history = self._histories.get(key)
+                    if history is None:
+                        history = self._histories[key] = SensorHistory(
+                            self.capacity, sensor.get("type", "")
+                        )
+                    history.append(sensor.get("raw"))
+                    recorded += 1
+            if len(self._histories) > recorded:
+                enabled_ids = set()
+                for sensor_ids in enabled_sensors.values():
+                    enabled_ids.update(sensor_ids)
+                stale = [key for key in self._histories if key not in enabled_ids]
+                if stale:
+                    for key in stale:
+                        del self._histories[key]
+                    self.version += 1
+
+    def snapshot(self, key, since=0):
+        """Returns (count, samples) for a sensor.
+
+        The samples are only copied if there are any newer than `since`, the
+        count a reader saw last time; otherwise an empty tuple is returned.
+        """
+        with self._lock:
+            history = self._histories.get(key)
+            if history is None:
+                return 0, ()
+            if history.count == since:
+                return since, ()
+            return history.count, tuple(history.samples)
+
+    def sensor_type(self, key):
+        """Returns the sensor type recorded for a key, or an empty string."""
+        history = self._histories.get(key)
+        return history.sensor_type if history else ""
+
+    def clear(self):
+        """Drops every history, e.g. when values change units."""
+        with self._lock:
+            self._histories.clear()
+            self._cleared_at = time.perf_counter()
+            self.version += 1
@@ -0,0 +1,62 @@
+# src/pymonitor/core/mailbox.py
+
+import threading
+import time
+
+
+class FrameMailbox:
+    """A single-slot, latest-value mailbox between the worker and the UI thread.
+
+    The worker overwrites the slot with every new frame; the UI takes only the
+    newest one. A frame that is overwritten before the UI picked it up is
+    counted as dropped, so a busy GUI thread never renders stale frames and
+    memory stays bounded to one pending frame.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self._pending = False
+        self._posted_at = 0.0
+        # perf_counter() time at which the frame last taken was posted
+        self.taken_posted_at = 0.0
+        self.posted = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def post(self, frame):
+        """Stores a frame. Returns True if the consumer needs to be notified.
+
+        The consumer only has to be notified when the slot was empty; if a
+        frame is still pending, a notification is already on its way.
+        """
+        with self._lock:
+            self.posted += 1
+            was_pending = self._pending
+            if was_pending:
+                self.dropped += 1
+            self._frame = frame
+            self._posted_at = time.perf_counter()
+            self._pending = True
+            return not was_pending
+
+    def take(self):
+        """Returns the newest pending frame, or None if there is none."""
+        with self._lock:
+            if not self._pending:
+                return None
+            frame = self._frame
+            self._frame = None
+            self._pending = False
+            self.taken_posted_at = self._posted_at
+            self.delivered += 1
+            return frame
+
+    def stats(self):
+        """Returns the frame counters as a dict."""
+        with self._lock:
+            return {
+                "posted": self.posted,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+            }
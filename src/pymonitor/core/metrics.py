@@ -0,0 +1,205 @@
+# src/pymonitor/core/metrics.py
+
+import threading
+import time
+from collections import deque
+
+# Values are bucketed like an HDR histogram: exact below 2**SUB_BUCKET_BITS
+# microseconds, then 2**(SUB_BUCKET_BITS - 1) linear buckets per power of two,
+# so a bucket is never wider than ~3% of its values
+SUB_BUCKET_BITS = 6
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+MAX_VALUE_US = (1 << 27) - 1  # ~134 s; longer durations are clamped
+
+DEFAULT_SLICE_SECONDS = 5.0
+DEFAULT_SLICES = 12  # Keeps the last minute
+
+
+def bucket_index(value_us):
+    """Returns the bucket of a duration in whole microseconds."""
+    if value_us < (1 << SUB_BUCKET_BITS):
+        return value_us
+    shift = value_us.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF + (value_us >> shift)
+
+
+def bucket_range(index):
+    """Returns the (lowest, highest) microsecond value of a bucket."""
+    if index < (1 << SUB_BUCKET_BITS):
+        return index, index
+    shift = index // _HALF - 1
+    top = index - shift * _HALF
+    return top << shift, ((top + 1) << shift) - 1
+
+
+class _Slice:
+    __slots__ = ("period", "counts", "count", "total", "max")
+
+    def __init__(self, period):
+        self.period = period
+        self.counts = {}  # Bucket index -> count
+        self.count = 0
+        self.total = 0  # Sum of the recorded values, in microseconds
+        self.max = 0
+
+
+class LatencyHistogram:
+    """A fixed-bucket latency histogram over a sliding time window.
+
+    Samples go into the slice for the current `slice_seconds` period; the
+    last `slices` periods are kept, so statistics can be read over any
+    window up to slice_seconds * slices. Percentiles are accurate to the
+    bucket width (~3%).
+
+    Recording takes well under a microsecond, takes no lock and allocates
+    nothing once a bucket has been seen. Each histogram must be written by
+    one thread only; reads from other threads are safe.
+    """
+
+    def __init__(
+        self,
+        slice_seconds=DEFAULT_SLICE_SECONDS,
+        slices=DEFAULT_SLICES,
+        clock=time.monotonic,
+    ):
+        self.slice_seconds = slice_seconds
+        self.clock = clock
+        self._slices = deque(maxlen=slices)
+        self._current = None
+
+    @property
+    def max_window(self):
+        return self.slice_seconds * self._slices.maxlen
+
+    def record(self, seconds):
+        """Records one duration, in seconds."""
+        value = int(seconds * 1e6)
+        if value > MAX_VALUE_US:
+            value = MAX_VALUE_US
+        elif value < 0:
+            value = 0
+        index = bucket_index(value)
+        period = int(self.clock() // self.slice_seconds)
+        current = self._current
+        if current is None or current.period != period:
+            current = self._current = _Slice(period)
+            self._slices.append(current)
+        counts = current.counts
+        counts[index] = counts.get(index, 0) + 1
+        current.count += 1
+        current.total += value
+        if value > current.max:
+            current.max = value
+
+    def _merged(self, window):
+        """Returns (bucket counts, count, total, max) over the last `window` s."""
+        oldest = int(self.clock() // self.slice_seconds) - max(
+            1, int(round((window or self.max_window) / self.slice_seconds))
+        )
+        merged = {}
+        count = total = maximum = 0
+        # Copying the deque and the dicts are single operations under the GIL,
+        # so the writer needs no lock; the totals may lag the buckets by a
+        # sample, which statistics do not notice
+        for piece in list(self._slices):
+            if piece.period <= oldest:
+                continue
+            for index, n in dict(piece.counts).items():
+                merged[index] = merged.get(index, 0) + n
+            count += piece.count
+            total += piece.total
+            maximum = max(maximum, piece.max)
+        return merged, count, total, maximum
+
+    @staticmethod
+    def _percentiles(merged, count, maximum, quantiles):
+        """Returns the value (µs) at each quantile, walking buckets in order.
+
+        A bucket's midpoint stands for its values, capped at the exact maximum.
+        """
+        results = []
+        ordered = sorted(merged.items())
+        for q in quantiles:
+            rank = max(1, int(q * count + 0.999999))
+            seen = 0
+            for index, n in ordered:
+                seen += n
+                if seen >= rank:
+                    low, high = bucket_range(index)
+                    results.append(min((low + high) / 2, maximum))
+                    break
+            else:
+                results.append(0.0)
+        return results
+
+    def percentile(self, q, window=None):
+        """Returns the q-quantile (0..1) in seconds, or None without samples."""
+        merged, count, _total, maximum = self._merged(window)
+        if not count:
+            return None
+        return self._percentiles(merged, count, maximum, (q,))[0] / 1e6
+
+    def snapshot(self, window=None):
+        """Returns count, mean, p50, p95, p99 and max (seconds) over `window` s."""
+        merged, count, total, maximum = self._merged(window)
+        if not count:
+            return dict(count=0, mean=None, p50=None, p95=None, p99=None, max=None)
+        p50, p95, p99 = self._percentiles(
+            merged, count, maximum, (0.50, 0.95, 0.99)
+        )
+        return {
+            "count": count,
+            "mean": total / count / 1e6,
+            "p50": p50 / 1e6,
+            "p95": p95 / 1e6,
+            "p99": p99 / 1e6,
+            "max": maximum / 1e6,
+        }
+
+
+class TickMetrics:
+    """Named latency histograms for the polling and display pipeline.
+
+    The worker thread records poll, per-device update, sensor read, render
+    and history timings; the GUI thread records frame delivery, overlay
+    update and paint timings. Read them with snapshot() (the settings
+    window's Performance tab does this), e.g.:
+
+        app.metrics.snapshot(window=10)["render"]["p99"]
+    """
+
+    def __init__(
+        self,
+        slice_seconds=DEFAULT_SLICE_SECONDS,
+        slices=DEFAULT_SLICES,
+        clock=time.monotonic,
+    ):
+        self.slice_seconds = slice_seconds
+        self.slices = slices
+        self.clock = clock
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        """Returns the histogram for `name`, creating it on first use."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = LatencyHistogram(self.slice_seconds, self.slices, self.clock)
+                    self._histograms[name] = histogram
+        return histogram
+
+    def record(self, name, seconds):
+        self.histogram(name).record(seconds)
+
+    def names(self):
+        with self._lock:
+            return sorted(self._histograms)
+
+    def snapshot(self, window=None):
+        """Returns {name: histogram snapshot} over the last `window` seconds."""
+        with self._lock:
+            histograms = list(self._histograms.items())
+        return {name: histogram.snapshot(window) for name, histogram in sorted(histograms)}
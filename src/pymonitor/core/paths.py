@@ -0,0 +1,12 @@
+# src/pymonitor/core/paths.py
+
+import os
+
+
+def user_cache_dir():
+    """Returns the per-user folder for PyMonitor.NET's caches and diagnostics.
+
+    %LOCALAPPDATA%\\PyMonitor.NET on Windows, ~/.cache/PyMonitor.NET elsewhere.
+    """
+    base = os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "PyMonitor.NET")
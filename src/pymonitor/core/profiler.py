@@ -0,0 +1,200 @@
+# src/pymonitor/core/profiler.py
+
+import marshal
+import os
+import sys
+import threading
+import time
+
+DEFAULT_INTERVAL = 0.005  # Seconds between samples
+# GIL switch interval in precise mode: 50 us, a hundredth of Python's 5 ms
+# default
+PRECISE_SWITCH_INTERVAL = 0.00005
+# The Qt (GUI) thread and the polling thread
+DEFAULT_THREADS = ("MainThread", "HardwareWorker")
+
+
+class SamplingProfiler:
+    """A stack-sampling profiler that can be started in a running instance.
+
+    A daemon thread reads the stacks of the watched threads with
+    sys._current_frames() every `interval` seconds and counts identical
+    stacks. Nothing is hooked into the profiled code, so its cost is that
+    of the sampling thread, and it can run in production to catch
+    intermittent stalls. Samples are taken when the sampler gets the GIL, so
+    short bursts of work are under-counted and samples pile up where a
+    thread releases the GIL; stalls are not affected.
+
+    With `precise`, the process-wide GIL switch interval is lowered to
+    PRECISE_SWITCH_INTERVAL while sampling. Samples then land closer to
+    where the time is spent, but every thread, including the profiled ones,
+    switches far more often, which slows them down and skews their timings.
+
+    stop() returns the number of samples; write() saves them as collapsed
+    stacks (one "thread;outer;...;inner count" line per stack, the input
+    format of flamegraph.pl, speedscope and similar tools) and as a pstats
+    file in which a "call" is a sample and times are sample counts times the
+    interval.
+    """
+
+    def __init__(
+        self, interval=DEFAULT_INTERVAL, thread_names=DEFAULT_THREADS, precise=False
+    ):
+        self.interval = interval
+        self.thread_names = thread_names
+        self.precise = precise
+        self.stacks = {}  # (thread name, code objects outermost first) -> count
+        self.samples = 0
+        self.started_at = None
+        self.duration = 0.0
+        self._thread = None
+        self._stopping = False
+        self._switch_interval = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.stacks = {}
+        self.samples = 0
+        self.started_at = time.time()
+        self._stopping = False
+        if self.precise:
+            # The sampler can only read the stacks once it holds the GIL. With
+            # the default 5 ms switch interval, a thread running Python code
+            # keeps the GIL until it releases it in a C call (e.g. a signal
+            # emit), so samples pile up at those calls
+            self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(
+                min(self._switch_interval, PRECISE_SWITCH_INTERVAL)
+            )
+        self._thread = threading.Thread(
+            target=self._run, name="SamplingProfiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling and returns the number of samples taken."""
+        if self._thread is None:
+            return self.samples
+        self._stopping = True
+        self._thread.join()
+        self._thread = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+        return self.samples
+
+    def _watched_threads(self):
+        """Returns {thread ident: name} of the threads to sample."""
+        return {
+            thread.ident: thread.name
+            for thread in threading.enumerate()
+            if thread.name in self.thread_names and thread.ident is not None
+        }
+
+    def _run(self):
+        start = time.perf_counter()
+        watched = self._watched_threads()
+        stacks = self.stacks
+        next_refresh = start + 1.0
+        # time.sleep() takes the GIL back once; Event.wait() would take it
+        # several times, delaying each sample behind busy threads
+        while not self._stopping:
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            if now >= next_refresh:
+                # Picks up a worker thread that started after the profiler
+                watched = self._watched_threads()
+                next_refresh = now + 1.0
+            frames = sys._current_frames()
+            for ident, name in watched.items():
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+                key = (name, tuple(codes))
+                stacks[key] = stacks.get(key, 0) + 1
+            self.samples += 1
+            del frames
+        self.duration = time.perf_counter() - start
+
+    @staticmethod
+    def _label(code):
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def collapsed(self):
+        """Returns the samples in the collapsed-stack format."""
+        labels = {}
+        lines = []
+        for (thread, codes), count in sorted(
+            self.stacks.items(), key=lambda item: -item[1]
+        ):
+            names = [thread]
+            for code in codes:
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = self._label(code).replace(";", ":")
+                names.append(label)
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def pstats_data(self):
+        """Returns the samples in the marshalled format pstats.Stats loads.
+
+        {(file, line, function): (calls, calls, self time, cumulative time,
+        {caller: (calls, calls, self time, cumulative time)})}
+        """
+        stats = {}  # function -> [self samples, cumulative samples, callers]
+
+        def entry(function):
+            item = stats.get(function)
+            if item is None:
+                item = stats[function] = [0, 0, {}]
+            return item
+
+        for (_thread, codes), count in self.stacks.items():
+            functions = [(c.co_filename, c.co_firstlineno, c.co_name) for c in codes]
+            if not functions:
+                continue
+            entry(functions[-1])[0] += count
+            # Recursive functions count once per stack for cumulative time
+            for function in set(functions):
+                entry(function)[1] += count
+            for caller, callee in set(zip(functions, functions[1:])):
+                callers = entry(callee)[2]
+                callers[caller] = callers.get(caller, 0) + count
+
+        interval = self.interval
+        return {
+            function: (
+                cumulative,
+                cumulative,
+                own * interval,
+                cumulative * interval,
+                {
+                    caller: (n, n, 0.0, n * interval)
+                    for caller, n in callers.items()
+                },
+            )
+            for function, (own, cumulative, callers) in stats.items()
+        }
+
+    def write(self, directory):
+        """Writes <stamp>.collapsed and <stamp>.pstats; returns their paths."""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("profile-%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        collapsed_path = os.path.join(directory, f"{stamp}.collapsed")
+        pstats_path = os.path.join(directory, f"{stamp}.pstats")
+        with open(collapsed_path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+        with open(pstats_path, "wb") as f:
+            marshal.dump(self.pstats_data(), f)
+        return collapsed_path, pstats_path
@@ -0,0 +1,248 @@
+# src/pymonitor/core/render_plan.py
+
+from .history import sensor_key, sparkline_url
+
+HW_ICONS_FALLBACK = {
+    "Cpu": "\uf2db",
+    "GPU": "\uf21b5",
+    "GpuNvidia": "\uf21b5",
+    "GpuAmd": "\uf21b5",
+    "GpuIntel": "\uf21b5",
+    "Memory": "\uf96a",
+    "Motherboard": "\uf2db",
+    "Storage": "\uf287",
+    "HDD": "\uf287",
+    "SSD": "\uf287",
+    "Network": "\uf6ff",
+    "Wifi": "\uf5a9",
+}
+
+SENSOR_ICONS_FALLBACK = {
+    "temperature": "\uf2c9",
+    "load": "\uf141",
+    "clock": "\uf251",
+    "power": "\uf0e7",
+    "fan": "\uf863",
+    "data": "\uf1c0",
+    "voltage": "\uf1e6",
+}
+
+# Substring heuristics for hardware types/names without an exact icon entry,
+# checked in order.
+_HW_ICON_HEURISTICS = (
+    (("gpu",), "GPU"),
+    (("cpu",), "Cpu"),
+    (("mem",), "Memory"),
+    (("stor", "disk"), "Storage"),
+    (("net",), "Network"),
+    (("wifi",), "Wifi"),
+)
+
+
+class _CompiledPlan:
+    """The settings-dependent parts of a RenderPlan, compiled from one snapshot.
+
+    Not changed once published, except that its icon caches gain entries,
+    which only depend on the compiled settings themselves.
+    """
+
+    def __init__(self, settings):
+        enabled_sensors_config = settings.get("visualization.enabled_sensors", {})
+        # Sensor id -> position in the configured order, per hardware id
+        self.sensor_order = {}
+        for hardware_id, sensor_ids in enabled_sensors_config.items():
+            if isinstance(sensor_ids, dict):
+                self.sensor_order[hardware_id] = {
+                    sensor_id: index for index, sensor_id in enumerate(sensor_ids)
+                }
+            # Name-based entries of hardware that is not present yet are
+            # skipped until config.migration converts them
+
+        component_order = settings.get("visualization.component_order", [])
+        self.component_order = {}
+        for index, hardware_id in enumerate(component_order):
+            self.component_order.setdefault(hardware_id, index)
+
+        self.show_titles = settings.get("visualization.show_component_titles", True)
+        indentation = settings.get("visualization.sensor_indentation", 4)
+        self.indent_space = "&nbsp;" * indentation
+        self.category_spacing = settings.get("visualization.category_spacing", 1)
+        self.display_mode = settings.get("visualization.display_mode", "multiline")
+        self.show_icons = settings.get("visualization.show_icons", True)
+        self.show_sparklines = settings.get("visualization.show_sparklines", False)
+
+        # Read customizable icons from settings with fallback defaults
+        icons_cfg = settings.get("icons", {}) or {}
+        self.hw_icons_user = icons_cfg.get("hardware", {}) or {}
+        self.sensor_icons_user = icons_cfg.get("sensors", {}) or {}
+        self._hw_icon_cache = {}
+        self._sensor_icon_cache = {}
+
+        self.version = settings.version
+
+    def get_hw_icon(self, hw_type_or_name):
+        icon = self._hw_icon_cache.get(hw_type_or_name)
+        if icon is None:
+            icon = self._hw_icon_cache[hw_type_or_name] = self._lookup_hw_icon(
+                hw_type_or_name
+            )
+        return icon
+
+    def _lookup_hw_icon(self, hw_type_or_name):
+        if not hw_type_or_name:
+            return ""
+        hw_icons_user = self.hw_icons_user
+        # Exact user overrides first, then fallback exacts
+        cap = hw_type_or_name.capitalize()
+        for icons in (hw_icons_user, HW_ICONS_FALLBACK):
+            if hw_type_or_name in icons:
+                return icons[hw_type_or_name]
+            if cap in icons:
+                return icons[cap]
+        # Heuristics by substring
+        low = hw_type_or_name.lower()
+        for needles, key in _HW_ICON_HEURISTICS:
+            if any(needle in low for needle in needles):
+                return hw_icons_user.get(key, HW_ICONS_FALLBACK.get(key, ""))
+        return ""
+
+    def get_sensor_icon(self, sensor_type_str):
+        icon = self._sensor_icon_cache.get(sensor_type_str)
+        if icon is None:
+            icon = ""
+            t = (sensor_type_str or "").lower()
+            for key, fallback in SENSOR_ICONS_FALLBACK.items():
+                if key in t:
+                    icon = self.sensor_icons_user.get(key, fallback)
+                    break
+            self._sensor_icon_cache[sensor_type_str] = icon
+        return icon
+
+
+class RenderPlan:
+    """Turns a hardware data snapshot into the overlay's HTML.
+
+    Everything that depends only on settings (sensor selection and order,
+    layout flags, icons) is compiled once and reused for every frame. The plan
+    recompiles itself whenever the settings version changes.
+
+    The worker thread renders every tick and the GUI thread re-renders on
+    settings changes, without a lock: a compilation is built aside and
+    published with one assignment, and each render reads it once.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._compiled = None
+        # Cleared by the CPU governor to suspend sparklines without
+        # changing the setting
+        self.sparklines_allowed = True
+
+    def _current(self):
+        """Returns the compiled settings, recompiling them if they changed."""
+        compiled = self._compiled
+        if compiled is None or compiled.version != self.settings.version:
+            # Compile from one snapshot so a concurrent change cannot produce
+            # a mix of old and new values recorded under the new version
+            compiled = self._compiled = _CompiledPlan(self.settings.snapshot())
+        return compiled
+
+    @property
+    def sensor_order(self):
+        return self._current().sensor_order
+
+    @property
+    def show_sparklines(self):
+        return self._current().show_sparklines
+
+    @property
+    def draws_sparklines(self):
+        return self.show_sparklines and self.sparklines_allowed
+
+    @staticmethod
+    def _get_sparkline(sensor, draws_sparklines):
+        if not draws_sparklines or sensor.get("raw") is None:
+            return ""
+        url = sparkline_url(sensor_key(sensor))
+        return f' <img src="{url}" align="middle">'
+
+    def render(self, data):
+        """Formats the hardware data for display. The snapshot is not modified."""
+        plan = self._current()
+
+        lines = []
+        show_titles = plan.show_titles
+        show_icons = plan.show_icons
+        category_spacing = plan.category_spacing
+        draws_sparklines = plan.show_sparklines and self.sparklines_allowed
+
+        # Sort data based on the component_order setting
+        if plan.component_order:
+            component_order = plan.component_order
+            data = sorted(
+                data, key=lambda x: component_order.get(x["id"], float("inf"))
+            )
+
+        section_count = 0  # Track number of sections added
+
+        for hardware_item in data:
+            hardware_name = hardware_item["name"]
+            hardware_type = hardware_item.get("type", "")
+            order = plan.sensor_order.get(hardware_item["id"])
+            if not order:
+                continue
+
+            filtered_sensors = [s for s in hardware_item["sensors"] if s["id"] in order]
+            if not filtered_sensors:
+                continue
+            filtered_sensors.sort(key=lambda s: order[s["id"]])
+
+            # Add spacing before this section (but not before the first section)
+            if section_count > 0 and category_spacing > 0:
+                lines.append(f'<div style="margin-bottom: {category_spacing}px;"></div>')
+            title_icon = (
+                plan.get_hw_icon(hardware_type or hardware_name) if show_icons else ""
+            )
+            title_prefix = (title_icon + " ") if (show_icons and title_icon) else ""
+
+            if plan.display_mode == "multiline":
+                if show_titles:
+                    lines.append(f"<b>{title_prefix}{hardware_name}</b>")
+
+                prefix = plan.indent_space if show_titles else ""
+                for sensor in filtered_sensors:
+                    sensor_icon = (
+                        plan.get_sensor_icon(sensor.get("type", "")) if show_icons else ""
+                    )
+                    sensor_label = (
+                        f"{sensor_icon} {sensor['name']}" if sensor_icon else sensor["name"]
+                    )
+                    lines.append(
+                        f"{prefix}{sensor_label}: {sensor['value']}"
+                        f"{self._get_sparkline(sensor, draws_sparklines)}"
+                    )
+            elif plan.display_mode == "singleline":
+                sensor_strings = []
+                for s in filtered_sensors:
+                    sensor_icon = (
+                        plan.get_sensor_icon(s.get("type", "")) if show_icons else ""
+                    )
+                    name_part = f"{sensor_icon} {s['name']}" if sensor_icon else s["name"]
+                    sensor_strings.append(
+                        f"{name_part}: {s['value']}"
+                        f"{self._get_sparkline(s, draws_sparklines)}"
+                    )
+                line = " | ".join(sensor_strings)
+                if show_titles:
+                    lines.append(f"<b>{title_prefix}{hardware_name}</b>: {line}")
+                else:
+                    lines.append(line)
+
+            # Increment section counter since we added a section
+            section_count += 1
+
+        # Remove the last blank lines if they exist
+        while lines and lines[-1] == "":
+            lines.pop()
+
+        return "<br>".join(lines)
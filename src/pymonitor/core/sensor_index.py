@@ -0,0 +1,201 @@
+# src/pymonitor/core/sensor_index.py
+
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Query tokens shorter than this only match by prefix; a one-edit tolerance on
+# one or two characters would match almost everything.
+MIN_FUZZY_LENGTH = 3
+
+
+def tokenize(text):
+    """Splits text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _deletions(token):
+    """Returns the token and every variant with one character removed."""
+    variants = {token}
+    for i in range(len(token)):
+        variants.add(token[:i] + token[i + 1 :])
+    return variants
+
+
+def _fuzzy_variants(token):
+    """Returns the one-deletion variants of the token and of each of its
+    prefixes of at least MIN_FUZZY_LENGTH characters."""
+    variants = _deletions(token)
+    for i in range(MIN_FUZZY_LENGTH, len(token)):
+        variants |= _deletions(token[:i])
+    return variants
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insert, delete, substitution or
+    transposition of adjacent characters."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diffs = [i for i in range(la) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return (
+            len(diffs) == 2
+            and diffs[1] == diffs[0] + 1
+            and a[diffs[0]] == b[diffs[1]]
+            and a[diffs[1]] == b[diffs[0]]
+        )
+    if la > lb:
+        a, b = b, a
+    # b is one character longer than a
+    for i in range(len(a)):
+        if a[i] != b[i]:
+            return a[i:] == b[i + 1 :]
+    return True
+
+
+class SensorIndex:
+    """An in-memory search index over the sensor catalog.
+
+    Each entry is a sensor row identified by an opaque, hashable key and
+    indexed by the tokens of its hardware name, sensor name and sensor type.
+    The sensor name is also indexed with the spaces removed, from each of its
+    words on ("GPU Hot Spot" adds "gpuhotspot" and "hotspot"), so words typed
+    together still match.
+    Lookups go through precomputed tables, so a search costs a few dictionary
+    lookups per query token instead of a scan over every sensor:
+
+    - a prefix table (prefix -> tokens) for matching while the user types,
+    - a one-deletion table (variant -> tokens) over tokens and their
+      prefixes, for typo tolerance in whole and partly typed words,
+    - posting sets (token -> keys), plus per-hardware and per-type key sets.
+
+    Entries are added and removed one by one as hardware appears or
+    disappears; the tables are never rebuilt.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._entries = {}  # key -> (tokens, hardware name, sensor type)
+        self._postings = {}  # token -> set of keys
+        self._prefixes = {}  # prefix -> set of tokens
+        self._deletes = {}  # one-deletion variant -> set of tokens
+        self._by_hardware = {}  # hardware name -> set of keys
+        self._by_type = {}  # sensor type -> set of keys
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def add(self, key, hardware_name, sensor_name, sensor_type):
+        """Indexes a sensor. Re-adding an existing key replaces its entry."""
+        if key in self._entries:
+            self.remove(key)
+        name_tokens = tokenize(sensor_name)
+        joined = ["".join(name_tokens[i:]) for i in range(len(name_tokens) - 1)]
+        tokens = frozenset(
+            tokenize(hardware_name) + name_tokens + joined + tokenize(sensor_type)
+        )
+        self._entries[key] = (tokens, hardware_name, sensor_type)
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                self._add_token(token)
+            keys.add(key)
+        self._by_hardware.setdefault(hardware_name, set()).add(key)
+        self._by_type.setdefault(sensor_type, set()).add(key)
+
+    def remove(self, key):
+        """Removes a sensor from the index; unknown keys are ignored."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        tokens, hardware_name, sensor_type = entry
+        for token in tokens:
+            keys = self._postings[token]
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+                self._remove_token(token)
+        self._discard(self._by_hardware, hardware_name, key)
+        self._discard(self._by_type, sensor_type, key)
+
+    def _add_token(self, token):
+        for i in range(1, len(token) + 1):
+            self._prefixes.setdefault(token[:i], set()).add(token)
+        for variant in _fuzzy_variants(token):
+            self._deletes.setdefault(variant, set()).add(token)
+
+    def _remove_token(self, token):
+        for i in range(1, len(token) + 1):
+            self._discard(self._prefixes, token[:i], token)
+        for variant in _fuzzy_variants(token):
+            self._discard(self._deletes, variant, token)
+
+    @staticmethod
+    def _discard(table, bucket, value):
+        values = table.get(bucket)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del table[bucket]
+
+    def hardware_names(self):
+        """Returns the names of the indexed hardware, sorted."""
+        return sorted(self._by_hardware)
+
+    def sensor_types(self):
+        """Returns the indexed sensor types, sorted."""
+        return sorted(self._by_type)
+
+    def matching_tokens(self, query_token):
+        """Returns the indexed tokens a single query token matches.
+
+        A token matches if it starts with the query token. Query tokens of at
+        least MIN_FUZZY_LENGTH characters also match tokens within one edit of
+        them, and tokens whose prefix of the same length is within one edit
+        (so "tmep" matches "temperature" while it is being typed).
+        """
+        matches = set(self._prefixes.get(query_token, ()))
+        length = len(query_token)
+        if length >= MIN_FUZZY_LENGTH:
+            for variant in _deletions(query_token):
+                for token in self._deletes.get(variant, ()):
+                    if token not in matches and (
+                        _within_one_edit(query_token, token)
+                        or _within_one_edit(query_token, token[:length])
+                    ):
+                        matches.add(token)
+        return matches
+
+    def search(self, query="", hardware_name=None, sensor_type=None):
+        """Returns the set of keys matching a free-text query and filters.
+
+        Every query token has to match (AND); a query token matches if any of
+        its matching tokens does. Returns None if there is nothing to filter
+        by, meaning every entry matches.
+        """
+        candidates = None
+        if hardware_name is not None:
+            candidates = set(self._by_hardware.get(hardware_name, ()))
+        if sensor_type is not None:
+            keys = self._by_type.get(sensor_type, set())
+            candidates = set(keys) if candidates is None else candidates & keys
+
+        for query_token in dict.fromkeys(tokenize(query)):
+            keys = set()
+            for token in self.matching_tokens(query_token):
+                keys |= self._postings[token]
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                break
+        return candidates
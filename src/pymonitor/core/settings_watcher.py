@@ -0,0 +1,170 @@
+# src/pymonitor/core/settings_watcher.py
+
+import hashlib
+import json
+import os
+import sys
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from ..config.persistence import serialize_settings
+
+# Editors and deployment tools often write a file in several steps; changes
+# are applied once the file has been quiet for this long.
+SETTLE_DELAY_MS = 200
+# Fallback polling interval when no native file watching is available
+POLL_INTERVAL_MS = 2000
+
+
+def diff_settings(old, new, depth=2, prefix=""):
+    """Returns the dotted keys whose values differ between two settings dicts.
+
+    Dicts are compared recursively down to `depth` levels (e.g.
+    "appearance.font_size"); deeper changes are reported at that level (a
+    changed sensor selection is "visualization.enabled_sensors"). Subtrees
+    shared between snapshots are skipped by identity.
+    """
+    changed = set()
+    for key in set(old) | set(new):
+        a, b = old.get(key), new.get(key)
+        if a is b:
+            continue
+        path = f"{prefix}{key}"
+        if depth > 1 and isinstance(a, dict) and isinstance(b, dict):
+            changed |= diff_settings(a, b, depth - 1, f"{path}.")
+        elif a != b:
+            changed.add(path)
+    return changed
+
+
+class SettingsFileWatcher(QObject):
+    """Reloads settings.json when it is changed by another program.
+
+    Uses QFileSystemWatcher (inotify on Linux, ReadDirectoryChangesW on
+    Windows) on the file and its directory, since atomic replaces swap the
+    file's inode. If the platform cannot watch the path, the file's mtime and
+    size are polled instead.
+
+    The file's content hash is kept, so touches and rewrites with the same
+    content are ignored, as are the application's own autosave writes. Otherwise
+    the file is parsed and published through Settings.apply_loaded, and the
+    dotted keys that changed are emitted with settings_changed.
+    """
+
+    settings_changed = pyqtSignal(set)
+
+    def __init__(self, settings, parent=None):
+        super().__init__(parent)
+        self.settings = settings
+        self.path = os.path.abspath(settings.path)
+        self._hash = self._hash_of(self._read())
+        self._stat = self._stat_of()
+        self._settling_stat = None  # File state the settle timer waits on
+
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(SETTLE_DELAY_MS)
+        self._settle_timer.timeout.connect(self.check)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._poll_timer = None
+        watched = self._watcher.addPath(os.path.dirname(self.path))
+        self._watch_file()
+        if not watched:
+            print(
+                "File watching is not available; polling settings.json for changes.",
+                file=sys.stderr,
+            )
+            self._poll_timer = QTimer(self)
+            self._poll_timer.timeout.connect(self._poll)
+            self._poll_timer.start(POLL_INTERVAL_MS)
+
+    @property
+    def polling(self):
+        return self._poll_timer is not None
+
+    def stop(self):
+        self._settle_timer.stop()
+        if self._poll_timer:
+            self._poll_timer.stop()
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+
+    def _watch_file(self):
+        # A replaced file drops out of the watch list; watch the new one
+        if os.path.exists(self.path) and self.path not in self._watcher.files():
+            self._watcher.addPath(self.path)
+
+    def _on_file_changed(self, _path):
+        self._watch_file()
+        self._settle_timer.start()
+
+    def _on_directory_changed(self, _path):
+        # The directory is the project root, where the PNG frame output and
+        # the profiler write files too. Only a new state of settings.json
+        # itself (e.g. an atomic replace) starts the settle timer, so a
+        # stream of unrelated writes cannot keep postponing the reload.
+        self._watch_file()
+        stat = self._stat_of()
+        if stat != self._stat and stat != self._settling_stat:
+            self._settling_stat = stat
+            self._settle_timer.start()
+
+    def _poll(self):
+        stat = self._stat_of()
+        if stat != self._stat:
+            self._stat = stat
+            self._settle_timer.start()
+
+    def _stat_of(self):
+        try:
+            st = os.stat(self.path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def _read(self):
+        try:
+            with open(self.path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _hash_of(content):
+        return hashlib.sha256(content).hexdigest() if content is not None else None
+
+    def check(self):
+        """Reloads the file if its content changed. Returns the changed keys."""
+        # Taken first and even for touches, so later directory events compare
+        # with it; a change after this point shows up as a newer state
+        self._stat = self._stat_of()
+        content = self._read()
+        digest = self._hash_of(content)
+        if content is None or digest == self._hash:
+            return set()
+        self._hash = digest
+
+        text = content.decode("utf-8", errors="replace")
+        if self.settings.is_saved_content(text):
+            return set()  # Our own autosave
+        if text == serialize_settings(self.settings.data):
+            return set()  # An edit that changes nothing
+        try:
+            user_settings = json.loads(text)
+        except ValueError as e:
+            # Likely a partial write; the next change event retries
+            print(f"Ignoring invalid settings.json change: {e}", file=sys.stderr)
+            return set()
+        if not isinstance(user_settings, dict):
+            return set()
+
+        previous, current = self.settings.apply_loaded(user_settings, text)
+        changed = diff_settings(previous, current)
+        if changed:
+            print(f"Reloaded settings.json ({', '.join(sorted(changed))})")
+            self.settings_changed.emit(changed)
+        return changed
@@ -0,0 +1,169 @@
+# src/pymonitor/core/startup_trace.py
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+# Taken when this module is first imported, which pymonitor.main does before
+# any other import, so the "imports" phase covers the application's imports
+_ORIGIN = time.perf_counter()
+
+# Returned by phase() while tracing is disabled; reusable and free to enter
+NO_PHASE = contextlib.nullcontext()
+
+
+class _Phase:
+    """Context manager recording one span into a StartupTrace."""
+
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.add_span(self.name, self.start, time.perf_counter())
+        return False
+
+
+class StartupTrace:
+    """Timestamps the phases of application startup.
+
+    Phases are spans (start and end) recorded with `phase()`; milestones such
+    as the first paint are instants recorded with `mark()`. Both may be
+    called from any thread. While tracing is disabled, which is the default,
+    `phase()` returns a shared no-op context manager and `mark()` returns
+    immediately.
+
+    `finish()` prints a report to stdout and writes the events as a Chrome
+    trace (open it in chrome://tracing or https://ui.perfetto.dev).
+    """
+
+    def __init__(self, origin=_ORIGIN):
+        self.origin = origin
+        self.enabled = False
+        self.path = None
+        self.spans = []  # (name, start, end, thread name)
+        self.marks = []  # (name, time, thread name)
+        self._lock = threading.Lock()
+
+    def enable(self, path=None):
+        """Starts recording; finish() will write the Chrome trace to `path`."""
+        self.enabled = True
+        self.path = path
+
+    def phase(self, name):
+        """Returns a context manager that records the enclosed code as `name`."""
+        if not self.enabled:
+            return NO_PHASE
+        return _Phase(self, name)
+
+    def add_span(self, name, start, end):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.spans.append((name, start, end, threading.current_thread().name))
+
+    def mark(self, name):
+        """Records an instant milestone, e.g. "first paint"."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.marks.append(
+                (name, time.perf_counter(), threading.current_thread().name)
+            )
+
+    def report(self):
+        """Returns the recorded phases and milestones as a text table."""
+
+        def ms(t):
+            return (t - self.origin) * 1000
+
+        with self._lock:
+            events = [
+                (start, f"{ms(start):9.1f} {(end - start) * 1000:9.1f}  {name} [{thread}]")
+                for name, start, end, thread in self.spans
+            ] + [
+                (t, f"{ms(t):9.1f} {'':>9}  * {name} [{thread}]")
+                for name, t, thread in self.marks
+            ]
+        lines = [
+            "Startup trace (ms since the first import)",
+            f"{'start':>9} {'duration':>9}  phase",
+        ]
+        lines += [line for _, line in sorted(events)]
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Returns the events in the Chrome trace event format."""
+        pid = os.getpid()
+        thread_ids = {}
+
+        def tid(thread):
+            return thread_ids.setdefault(thread, len(thread_ids) + 1)
+
+        def us(t):
+            return round((t - self.origin) * 1e6, 1)
+
+        with self._lock:
+            events = [
+                {
+                    "name": name,
+                    "cat": "startup",
+                    "ph": "X",
+                    "ts": us(start),
+                    "dur": round((end - start) * 1e6, 1),
+                    "pid": pid,
+                    "tid": tid(thread),
+                }
+                for name, start, end, thread in self.spans
+            ] + [
+                {
+                    "name": name,
+                    "cat": "startup",
+                    "ph": "i",
+                    "s": "g",
+                    "ts": us(t),
+                    "pid": pid,
+                    "tid": tid(thread),
+                }
+                for name, t, thread in self.marks
+            ]
+        events += [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": number,
+                "args": {"name": thread},
+            }
+            for thread, number in thread_ids.items()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def finish(self):
+        """Prints the report, writes the Chrome trace and stops recording."""
+        if not self.enabled:
+            return
+        print(self.report())
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(self.path, "w") as f:
+                    json.dump(self.chrome_trace(), f)
+                print(f"Startup trace written to: {self.path}")
+            except OSError as e:
+                print(f"Could not write startup trace: {e}", file=sys.stderr)
+        self.enabled = False
+
+
+# The process-wide trace. It is created at import time rather than by the
+# Application, since the phases it measures start before the Application exists.
+startup_trace = StartupTrace()
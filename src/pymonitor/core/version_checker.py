@@ -1,29 +1,114 @@
 # src/pymonitor/core/version_checker.py
 
-import requests
+import json
+import os
 import re
+import sys
+import time
+
+from .paths import user_cache_dir
 
 LHM_REPO_API_URL = "https://api.github.com/repos/LibreHardwareMonitor/LibreHardwareMonitor/releases/latest"
 
-def get_latest_lhm_version(timeout=5):
+# How long a cached answer is used without asking GitHub again
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def default_cache_path():
+    """Returns the per-user file the last version check result is cached in."""
+    return os.path.join(user_cache_dir(), "lhm_version.json")
+
+
+def _load_cache(cache_path, url):
+    """Returns the cached entry for `url`, or an empty dict."""
+    try:
+        with open(cache_path, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entry, dict) or entry.get("url") != url:
+        return {}
+    return entry
+
+
+def _save_cache(cache_path, entry):
+    """Writes the cache entry atomically; failures are not fatal."""
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write version check cache: {e}", file=sys.stderr)
+
+
+def _parse_version(data):
+    tag_name = data.get("tag_name")
+    if tag_name:
+        # Use regex to find a standard version pattern (e.g., 0.9.6)
+        match = re.search(r"(\d+\.\d+\.\d+)", tag_name)
+        if match:
+            return match.group(1)
+        # Fallback for tags like 'v0.9.6'
+        return tag_name.lstrip("v")
+    return None
+
+
+def get_cached_lhm_version(url=LHM_REPO_API_URL, cache_path=None):
+    """Returns the last known latest version without any network access.
+
+    Meant to be shown immediately while get_latest_lhm_version revalidates
+    in the background. Returns None if nothing is cached.
+    """
+    return _load_cache(cache_path or default_cache_path(), url).get("version")
+
+
+def get_latest_lhm_version(
+    timeout=5, url=LHM_REPO_API_URL, cache_path=None, ttl=DEFAULT_CACHE_TTL
+):
     """
     Fetches the latest release version of LibreHardwareMonitor from the GitHub API.
-    Returns the version string (e.g., '0.9.6') or None if an error occurs.
+    Returns the version string (e.g., '0.9.6') or None if it is not known.
+
+    The last answer is cached on disk. Within `ttl` seconds it is returned
+    without a request; after that it is revalidated with If-None-Match, so an
+    unchanged release costs a 304 response without a body. If the request
+    fails (e.g. offline), the cached answer is returned.
+
+    This blocks for up to `timeout` seconds; call it from a worker thread.
     """
+    cache_path = cache_path or default_cache_path()
+    entry = _load_cache(cache_path, url)
+    now = time.time()
+    if entry.get("version") and 0 <= now - entry.get("checked_at", 0) < ttl:
+        return entry["version"]
+
+    # Imported only when a request is needed; most checks hit the cache
+    import requests
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if entry.get("etag") and entry.get("version"):
+        headers["If-None-Match"] = entry["etag"]
     try:
-        response = requests.get(LHM_REPO_API_URL, timeout=timeout)
+        response = requests.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304:
+            entry["checked_at"] = now
+            _save_cache(cache_path, entry)
+            return entry["version"]
         response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
-        data = response.json()
-        
-        tag_name = data.get('tag_name')
-        if tag_name:
-            # Use regex to find a standard version pattern (e.g., 0.9.6)
-            match = re.search(r'(\d+\.\d+\.\d+)', tag_name)
-            if match:
-                return match.group(1)
-            # Fallback for tags like 'v0.9.6'
-            return tag_name.lstrip('v')
-        return None
+        version = _parse_version(response.json())
+        if version:
+            _save_cache(
+                cache_path,
+                {
+                    "url": url,
+                    "version": version,
+                    "etag": response.headers.get("ETag"),
+                    "checked_at": now,
+                },
+            )
+        return version
     except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Failed to fetch latest LHM version from GitHub: {e}")
-        return None
+        return entry.get("version")
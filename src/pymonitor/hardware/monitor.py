@@ -1,8 +1,20 @@
 # src/pymonitor/hardware/monitor.py
 
-import clr
 import os
-from System.Diagnostics import FileVersionInfo  # type: ignore # .NET library loaded at runtime
+import time
+
+from ..core.startup_trace import startup_trace
+from .throttle import should_update
+
+# "monitoring.hardware_categories" key -> the Computer property it sets
+HARDWARE_CATEGORIES = {
+    "cpu": "IsCpuEnabled",
+    "gpu": "IsGpuEnabled",
+    "memory": "IsMemoryEnabled",
+    "motherboard": "IsMotherboardEnabled",
+    "storage": "IsStorageEnabled",
+    "network": "IsNetworkEnabled",
+}
 
 
 class UntrustedLocationError(Exception):
@@ -14,9 +26,16 @@ class HardwareMonitor:
     """A wrapper for LibreHardwareMonitorLib to fetch hardware data."""
 
     def __init__(self, settings, lib_path=".") -> None:
-        """Initializes the HardwareMonitor, preparing pythonnet to use the DLL."""
+        """Initializes the HardwareMonitor. The DLL is loaded by initialize()."""
         self.settings = settings
         self.computer = None
+        # The per-sensor loop reads these instead of querying the settings;
+        # the subscription keeps them current. The unit and its cache of
+        # sensor type string -> unit are published together, so a poll
+        # never fills the new cache with units looked up for the old one
+        self.temperature_unit = settings.get("monitoring.temperature_unit", "celsius")
+        self._units = (self.temperature_unit, {})
+        settings.subscribe("monitoring.temperature_unit", self._set_temperature_unit)
         self.dll_path = os.path.abspath(
             os.path.join(lib_path, "LibreHardwareMonitorLib.dll")
         )
@@ -29,6 +48,50 @@ class HardwareMonitor:
         # Check if DLL is in an untrusted location
         self._check_dll_location()
 
+        # pythonnet and the DLL are loaded by initialize(), which runs on the
+        # worker thread, so the overlay can show before .NET starts up
+        self.Hardware = None
+
+        # TickMetrics the Application attaches; per-device histograms are
+        # looked up once per hardware identifier
+        self.metrics = None
+        self._update_times = {}
+        # Set by the CPU governor and applied by should_update(): hardware not
+        # in active_hardware (when it is not None) is only updated on every
+        # idle_update_every-th poll
+        self.active_hardware = None
+        self.idle_update_every = 1
+        self.polls = 0
+
+    def _set_temperature_unit(self, unit):
+        self.temperature_unit = unit or "celsius"
+        self._units = (self.temperature_unit, {})
+
+    def _check_dll_location(self):
+        """Check if DLL is in a potentially problematic location."""
+        dll_dir = os.path.dirname(self.dll_path).lower()
+        problematic_paths = [
+            "downloads",
+            "download", 
+            "temp",
+            "tmp",
+            "desktop\\pymonitor", # Only if it's a downloaded folder
+        ]
+        
+        # Check if path contains problematic folders
+        for problematic in problematic_paths:
+            if problematic in dll_dir:
+                print(f"⚠️  WARNING: Application is running from potentially untrusted location: {self.dll_path}")
+                print(f"   If you encounter loading errors, move the folder to a trusted location like:")
+                print(f"   - C:\\Program Files\\PyMonitor.NET")
+                print(f"   - C:\\Users\\{os.getenv('USERNAME', 'YourUser')}\\Documents\\PyMonitor.NET")
+                print(f"   - C:\\PyMonitor.NET")
+                break
+
+    def _load_library(self):
+        """Imports pythonnet and loads LibreHardwareMonitorLib.dll."""
+        import clr
+
         try:
             clr.AddReference(self.dll_path)
             from LibreHardwareMonitor import Hardware  # type: ignore # .NET library loaded at runtime
@@ -53,37 +116,25 @@ class HardwareMonitor:
             else:
                 raise
 
-    def _check_dll_location(self):
-        """Check if DLL is in a potentially problematic location."""
-        dll_dir = os.path.dirname(self.dll_path).lower()
-        problematic_paths = [
-            "downloads",
-            "download", 
-            "temp",
-            "tmp",
-            "desktop\\pymonitor", # Only if it's a downloaded folder
-        ]
-        
-        # Check if path contains problematic folders
-        for problematic in problematic_paths:
-            if problematic in dll_dir:
-                print(f"⚠️  WARNING: Application is running from potentially untrusted location: {self.dll_path}")
-                print(f"   If you encounter loading errors, move the folder to a trusted location like:")
-                print(f"   - C:\\Program Files\\PyMonitor.NET")
-                print(f"   - C:\\Users\\{os.getenv('USERNAME', 'YourUser')}\\Documents\\PyMonitor.NET")
-                print(f"   - C:\\PyMonitor.NET")
-                break
-
     def initialize(self) -> None:
-        """Creates an instance of the Computer class from the DLL."""
-        self.computer = self.Hardware.Computer()
-        self.computer.IsCpuEnabled = True
-        self.computer.IsGpuEnabled = True
-        self.computer.IsMemoryEnabled = True
-        self.computer.IsMotherboardEnabled = True
-        self.computer.IsStorageEnabled = True
-        self.computer.IsNetworkEnabled = True
-        self.computer.Open()
+        """Loads the library and opens the Computer instance from the DLL.
+
+        Computer.Open() probes every device and can take seconds; the
+        application calls this from the worker thread. Calling it again once
+        open does nothing.
+        """
+        if self.computer is not None:
+            return
+        if self.Hardware is None:
+            with startup_trace.phase("load LibreHardwareMonitorLib"):
+                self._load_library()
+        computer = self.Hardware.Computer()
+        categories = self.settings.get("monitoring.hardware_categories", {}) or {}
+        for category, flag in HARDWARE_CATEGORIES.items():
+            setattr(computer, flag, bool(categories.get(category, True)))
+        with startup_trace.phase("Computer.Open"):
+            computer.Open()
+        self.computer = computer
 
     def close(self) -> None:
         """Closes the computer instance to release resources."""
@@ -93,6 +144,9 @@ class HardwareMonitor:
     def get_local_dll_version(self) -> str:
         """Gets the file version of the local LibreHardwareMonitorLib.dll."""
         try:
+            import clr  # noqa: F401 # Makes the System namespace importable
+            from System.Diagnostics import FileVersionInfo  # type: ignore # .NET library loaded at runtime
+
             version_info = FileVersionInfo.GetVersionInfo(self.dll_path)
             return version_info.FileVersion
         except Exception as e:
@@ -105,10 +159,26 @@ class HardwareMonitor:
             return []
 
         data = []
+        units = self._units  # Read once, for the whole poll
+        fahrenheit = units[0] == "fahrenheit"
+        metrics = self.metrics
+        read_time = 0.0
+        self.polls += 1
         for hardware in self.computer.Hardware:
-            hardware.Update()  # Recommended to call Update() on each hardware component
+            hardware_id = str(hardware.Identifier)
+            started = time.perf_counter()
+            if should_update(self, hardware_id):
+                hardware.Update()  # Recommended to call Update() on each hardware component
+            else:
+                started = None  # Keeps the values of its last update
+            updated = time.perf_counter()
 
+            if metrics is not None and started is not None:
+                self._update_histogram(hardware_id, hardware.Name).record(
+                    updated - started
+                )
             item = {
+                "id": hardware_id,  # Stable identifier, e.g. "/gpu-nvidia/0"
                 "name": hardware.Name,
                 "type": str(hardware.HardwareType),
                 "sensors": [],
@@ -121,12 +191,13 @@ class HardwareMonitor:
 
             for sensor in hardware.Sensors:
                 value = sensor.Value
+                sensor_type = str(sensor.SensorType)
                 formatted_value = "N/A"
 
                 # Collect CPU core frequencies for the synthetic sensor
                 if (
                     is_cpu
-                    and str(sensor.SensorType) == "Clock"
+                    and sensor_type == "Clock"
                     and "Core" in sensor.Name
                     and value is not None
                 ):
@@ -134,19 +205,13 @@ class HardwareMonitor:
 
                 if value is not None:
                     try:
-                        unit = self._get_unit(sensor.SensorType)
-                        temp_unit = self.settings.get(
-                            "monitoring.temperature_unit", "celsius"
-                        )
-
-                        if (
-                            "Temperature" in str(sensor.SensorType)
-                            and temp_unit == "fahrenheit"
-                        ):
+                        unit = self._get_unit(sensor_type, units)
+
+                        if fahrenheit and "Temperature" in sensor_type:
                             value = (value * 9 / 5) + 32
 
                         # Special handling for data sensors (memory usage, etc.)
-                        if "Data" in str(sensor.SensorType):
+                        if "Data" in sensor_type:
                             formatted_value = self._format_data_value(
                                 value, sensor.Name
                             )
@@ -156,28 +221,42 @@ class HardwareMonitor:
                         formatted_value = str(value)
 
                 sensor_info = {
+                    "id": str(sensor.Identifier),
                     "name": sensor.Name,
-                    "type": str(sensor.SensorType),
+                    "type": sensor_type,
                     "value": formatted_value,
+                    "raw": value,  # Numeric value in display units, or None
                 }
                 item["sensors"].append(sensor_info)
 
             # Add the synthetic CPU Frequency sensor if applicable
             if is_cpu and cpu_core_frequencies:
                 max_freq = max(cpu_core_frequencies)
-                unit = self._get_unit(self.Hardware.SensorType.Clock)
+                unit = self._get_unit(self.Hardware.SensorType.Clock, units)
                 formatted_value = f"{max_freq:.2f} {unit}".strip()
 
                 cpu_freq_sensor = {
+                    "id": f"{hardware_id}/clock/pymonitor-max",
                     "name": "CPU Frequency",
                     "type": str(self.Hardware.SensorType.Clock),
                     "value": formatted_value,
+                    "raw": max_freq,
                 }
                 item["sensors"].insert(0, cpu_freq_sensor)
 
             data.append(item)
+            read_time += time.perf_counter() - updated
+        if metrics is not None:
+            metrics.record("sensor read", read_time)
         return data
 
+    def _update_histogram(self, hardware_id, name):
+        histogram = self._update_times.get(hardware_id)
+        if histogram is None:
+            histogram = self.metrics.histogram(f"update: {name} ({hardware_id})")
+            self._update_times[hardware_id] = histogram
+        return histogram
+
     def _format_data_value(self, value, sensor_name):
         """Formats data values with appropriate units (bytes, MB, GB)."""
         sensor_name_lower = sensor_name.lower()
@@ -206,13 +285,24 @@ class HardwareMonitor:
         # Default: assume MB
         return f"{value:.1f} MB"
 
-    def _get_unit(self, sensor_type) -> str:
-        """Returns the appropriate unit for a given sensor type."""
-        # This can be expanded based on the SensorType enum
+    def _get_unit(self, sensor_type, units) -> str:
+        """Returns the appropriate unit for a given sensor type.
+
+        `units` is the (temperature unit, cache) pair the poll read.
+        """
+        temperature_unit, cache = units
         sensor_type_str = str(sensor_type)
+        unit = cache.get(sensor_type_str)
+        if unit is None:
+            unit = cache[sensor_type_str] = self._lookup_unit(
+                sensor_type_str, temperature_unit
+            )
+        return unit
+
+    def _lookup_unit(self, sensor_type_str, temperature_unit) -> str:
+        # This can be expanded based on the SensorType enum
         if "Temperature" in sensor_type_str:
-            unit = self.settings.get("monitoring.temperature_unit", "celsius")
-            return "°F" if unit == "fahrenheit" else "°C"
+            return "°F" if temperature_unit == "fahrenheit" else "°C"
         if "Load" in sensor_type_str:
             return "%"
         if "Clock" in sensor_type_str:
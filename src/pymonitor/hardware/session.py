@@ -0,0 +1,282 @@
+# src/pymonitor/hardware/session.py
+
+import bisect
+import gzip
+import json
+import time
+
+from ..core.startup_trace import startup_trace
+from .throttle import should_update
+
+SESSION_FORMAT = "pymonitor-session"
+SESSION_VERSION = 1
+FLUSH_SECONDS = 10  # How much of a recording a crash can lose, at most
+
+
+class SessionRecorder:
+    """Records hardware snapshots into a compact session file.
+
+    The file is gzip-compressed JSON lines: a header, then a "topology" line
+    (hardware and sensor ids, names and types) whenever the set of sensors
+    changes, and one line per snapshot with its time since the first one,
+    the formatted values and the raw values, in topology order. Snapshots
+    are recorded as get_hardware_data returns them, so a replay reproduces
+    the formatting the backend produced as well as the values.
+
+    record() is called by the worker thread after each poll.
+    """
+
+    def __init__(self, path, hardware_monitor, settings, clock=time.monotonic):
+        self.path = path
+        self.hardware_monitor = hardware_monitor
+        self.settings = settings
+        self.clock = clock
+        self.frames = 0
+        self._file = None
+        self._started = None
+        self._topology_key = None
+        self._temperature_unit = None
+        self._next_flush = 0.0
+
+    def _write(self, record):
+        self._file.write(
+            (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode(
+                "utf-8"
+            )
+        )
+
+    def _open(self, now):
+        self._file = gzip.open(self.path, "wb")
+        self._started = now
+        self._next_flush = now + FLUSH_SECONDS
+        self._write(
+            {
+                "format": SESSION_FORMAT,
+                "version": SESSION_VERSION,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "backend": self.hardware_monitor.get_local_dll_version(),
+                "interval": self.settings.get("monitoring.update_interval", 1),
+            }
+        )
+
+    def record(self, data):
+        """Appends one snapshot, writing the topology first if it changed."""
+        now = self.clock()
+        if self._file is None:
+            self._open(now)
+        key = tuple(
+            (hardware["id"], hardware["name"], hardware["type"])
+            + tuple((s["id"], s["name"], s["type"]) for s in hardware["sensors"])
+            for hardware in data
+        )
+        unit = self.settings.get("monitoring.temperature_unit", "celsius")
+        if key != self._topology_key or unit != self._temperature_unit:
+            self._topology_key = key
+            self._temperature_unit = unit
+            self._write(
+                {
+                    "topology": [
+                        {
+                            "id": hardware["id"],
+                            "name": hardware["name"],
+                            "type": hardware["type"],
+                            "sensors": [
+                                [s["id"], s["name"], s["type"]]
+                                for s in hardware["sensors"]
+                            ],
+                        }
+                        for hardware in data
+                    ],
+                    "temperature_unit": unit,
+                }
+            )
+        values = []
+        raws = []
+        for hardware in data:
+            for sensor in hardware["sensors"]:
+                values.append(sensor["value"])
+                raw = sensor["raw"]
+                raws.append(None if raw is None else round(raw, 4))
+        self._write({"t": round(now - self._started, 3), "v": values, "r": raws})
+        self.frames += 1
+        if now >= self._next_flush:
+            self._file.flush()
+            self._next_flush = now + FLUSH_SECONDS
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _fahrenheit(celsius):
+    return celsius * 9 / 5 + 32
+
+
+def _celsius(fahrenheit):
+    return (fahrenheit - 32) * 5 / 9
+
+
+class ReplayHardwareMonitor:
+    """A stand-in for HardwareMonitor that replays a recorded session.
+
+    With a `speed` above zero, each poll returns the snapshot recorded at
+    the session time reached at that speed since initialize() (1 is real
+    time), whatever the polling interval. With a `speed` of 0 every poll
+    returns the next snapshot, so the session runs as fast as it is polled.
+    The session starts over when it ends.
+
+    Temperatures recorded in another unit than the current one are
+    converted. Follows the CPU governor's hardware throttling like the other
+    backends.
+    """
+
+    def __init__(self, settings, path, speed=1.0, clock=time.monotonic):
+        self.settings = settings
+        self.path = path
+        self.speed = speed
+        self.clock = clock
+        self.computer = None
+        self.header = {}
+        self.topologies = []  # [(topology, temperature unit)]
+        self.frames = []  # [(topology index, values, raws)]
+        self.times = []  # Session time of each frame
+        self.position = 0  # Index of the last frame returned
+        self.loops = 0  # How many times the session started over
+        self.temperature_unit = settings.get("monitoring.temperature_unit", "celsius")
+        settings.subscribe("monitoring.temperature_unit", self._set_temperature_unit)
+        self.polls = 0
+        self.metrics = None  # TickMetrics the Application attaches
+        # Hardware throttling by the CPU governor, as in HardwareMonitor
+        self.active_hardware = None
+        self.idle_update_every = 1
+        self._last_items = {}  # Hardware id -> item of its last update
+        self._started = None
+
+    def _set_temperature_unit(self, unit):
+        self.temperature_unit = unit or "celsius"
+
+    def load(self):
+        """Reads the session file; raises ValueError if it is not one."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != SESSION_FORMAT:
+                raise ValueError(f"{self.path} is not a PyMonitor.NET session")
+            if header.get("version", 0) > SESSION_VERSION:
+                raise ValueError(
+                    f"{self.path} is a newer session format (version {header['version']})"
+                )
+            topologies = []
+            frames = []
+            times = []
+            try:
+                for line in f:
+                    record = json.loads(line)
+                    if "topology" in record:
+                        topologies.append(
+                            (record["topology"], record.get("temperature_unit", "celsius"))
+                        )
+                    elif topologies:
+                        frames.append((len(topologies) - 1, record["v"], record["r"]))
+                        times.append(record["t"])
+            except (EOFError, json.JSONDecodeError):
+                pass  # A recording cut off by a crash ends at its last complete line
+        if not frames:
+            raise ValueError(f"{self.path} holds no snapshots")
+        self.header = header
+        self.topologies = topologies
+        self.frames = frames
+        self.times = times
+
+    @property
+    def duration(self):
+        """Session time of the last snapshot, in seconds."""
+        return self.times[-1] if self.times else 0.0
+
+    def initialize(self):
+        """Loads the session and starts its clock."""
+        if self.computer is not None:
+            return
+        with startup_trace.phase("load replay session"):
+            self.load()
+        print(
+            f"Replaying {self.path}: {len(self.frames)} snapshots over "
+            f"{self.duration:.0f} s, speed {self.speed:g}x"
+            if self.speed
+            else f"Replaying {self.path}: {len(self.frames)} snapshots, as fast as polled"
+        )
+        self._started = self.clock()
+        self.position = -1
+        self.computer = self
+
+    def close(self):
+        self.computer = None
+
+    def get_local_dll_version(self):
+        return f"{self.header.get('backend', 'N/A')} (replay)"
+
+    def _next_position(self):
+        count = len(self.frames)
+        if not self.speed:
+            position = self.position + 1
+            if position >= count:
+                position = 0
+                self.loops += 1
+            return position
+        elapsed = (self.clock() - self._started) * self.speed
+        # One loop lasts the session plus one recording interval
+        period = self.duration + float(self.header.get("interval", 1) or 1)
+        loops, offset = divmod(elapsed, period)
+        self.loops = int(loops)
+        return max(0, bisect.bisect_right(self.times, offset) - 1)
+
+    def get_hardware_data(self):
+        """Returns the snapshot due now, in the format of HardwareMonitor.get_hardware_data."""
+        if not self.computer:
+            return []
+        self.polls += 1
+        started = time.perf_counter()
+        self.position = self._next_position()
+        topology_index, values, raws = self.frames[self.position]
+        topology, unit = self.topologies[topology_index]
+        convert = None
+        if unit != self.temperature_unit:
+            if self.temperature_unit == "fahrenheit":
+                convert, symbol = _fahrenheit, "°F"
+            else:
+                convert, symbol = _celsius, "°C"
+        data = []
+        index = 0
+        for hardware in topology:
+            sensors = hardware["sensors"]
+            last = self._last_items.get(hardware["id"])
+            if last and not should_update(self, hardware["id"]):
+                data.append(last)  # Not updated; repeats its last values
+                index += len(sensors)
+                continue
+            item = self._last_items[hardware["id"]] = {
+                "id": hardware["id"],
+                "name": hardware["name"],
+                "type": hardware["type"],
+                "sensors": [],
+            }
+            for sensor_id, name, sensor_type in sensors:
+                value = values[index]
+                raw = raws[index]
+                index += 1
+                if convert is not None and "Temperature" in sensor_type and raw is not None:
+                    raw = convert(raw)
+                    value = f"{raw:.2f} {symbol}"
+                item["sensors"].append(
+                    {
+                        "id": sensor_id,
+                        "name": name,
+                        "type": sensor_type,
+                        "value": value,
+                        "raw": raw,
+                    }
+                )
+            data.append(item)
+        if self.metrics is not None:
+            self.metrics.record("sensor read", time.perf_counter() - started)
+        return data
@@ -0,0 +1,133 @@
+# src/pymonitor/hardware/synthetic.py
+
+import math
+import time
+
+from ..core.startup_trace import startup_trace
+from .throttle import should_update
+
+# (hardware type, hardware name, sensor types cycled through for its sensors)
+_HARDWARE_KINDS = (
+    ("Cpu", "Synthetic CPU", ("Load", "Temperature", "Clock", "Power", "Voltage")),
+    ("GpuNvidia", "Synthetic GPU", ("Load", "Temperature", "Clock", "Fan", "Power")),
+    ("Memory", "Synthetic Memory", ("Load", "Data")),
+    ("Storage", "Synthetic Disk", ("Temperature", "Load", "Data")),
+    ("Network", "Synthetic Network", ("Load", "Data")),
+)
+
+# Sensor type -> (unit, base value, amplitude)
+_SENSOR_RANGES = {
+    "Load": ("%", 40.0, 35.0),
+    "Temperature": ("°C", 55.0, 15.0),
+    "Clock": ("MHz", 3200.0, 800.0),
+    "Power": ("W", 90.0, 60.0),
+    "Voltage": ("V", 1.1, 0.15),
+    "Fan": ("RPM", 1400.0, 600.0),
+    "Data": ("MB", 8192.0, 2048.0),
+}
+
+SENSORS_PER_HARDWARE = 25
+
+
+class SyntheticHardwareMonitor:
+    """A stand-in for HardwareMonitor that generates sensor data.
+
+    Produces the same structure as HardwareMonitor.get_hardware_data, with
+    stable LibreHardwareMonitor-style identifiers, for `sensor_count` sensors
+    spread over hardware of several types. Values move smoothly over time.
+    Used by benchmarks and test scripts, and anywhere the real library is
+    unavailable. `open_delay` simulates the time Computer.Open() takes.
+    """
+
+    def __init__(self, settings, sensor_count=40, open_delay=0.0):
+        self.settings = settings
+        self.sensor_count = sensor_count
+        self.open_delay = open_delay
+        self.computer = None
+        self.temperature_unit = settings.get("monitoring.temperature_unit", "celsius")
+        settings.subscribe("monitoring.temperature_unit", self._set_temperature_unit)
+        self.polls = 0
+        self.metrics = None  # TickMetrics the Application attaches
+        # Hardware throttling by the CPU governor, as in HardwareMonitor
+        self.active_hardware = None
+        self.idle_update_every = 1
+        self._last_items = {}  # Hardware id -> item of its last update
+        self._layout = self._build_layout()
+
+    def _set_temperature_unit(self, unit):
+        self.temperature_unit = unit or "celsius"
+
+    def _build_layout(self):
+        """Returns [(hardware dict without sensors, [(id, name, type)])]."""
+        layout = []
+        remaining = self.sensor_count
+        index = 0
+        while remaining > 0:
+            hw_type, hw_name, sensor_types = _HARDWARE_KINDS[index % len(_HARDWARE_KINDS)]
+            number = index // len(_HARDWARE_KINDS)
+            hw_id = f"/synthetic/{hw_type.lower()}/{number}"
+            hardware = {"id": hw_id, "name": f"{hw_name} #{number}", "type": hw_type}
+            sensors = []
+            for i in range(min(SENSORS_PER_HARDWARE, remaining)):
+                sensor_type = sensor_types[i % len(sensor_types)]
+                sensors.append(
+                    (
+                        f"{hw_id}/{sensor_type.lower()}/{i}",
+                        f"{sensor_type} #{i}",
+                        sensor_type,
+                    )
+                )
+            layout.append((hardware, sensors))
+            remaining -= len(sensors)
+            index += 1
+        return layout
+
+    def initialize(self):
+        """Simulates opening the hardware backend."""
+        if self.computer is not None:
+            return
+        with startup_trace.phase("Computer.Open (synthetic)"):
+            if self.open_delay:
+                time.sleep(self.open_delay)
+        self.computer = self
+
+    def close(self):
+        self.computer = None
+
+    def get_local_dll_version(self):
+        return "synthetic"
+
+    def get_hardware_data(self):
+        """Returns one snapshot in the format of HardwareMonitor.get_hardware_data."""
+        if not self.computer:
+            return []
+        self.polls += 1
+        started = time.perf_counter()
+        phase = self.polls * 0.3
+        fahrenheit = self.temperature_unit == "fahrenheit"
+        data = []
+        for position, (hardware, sensors) in enumerate(self._layout):
+            last = self._last_items.get(hardware["id"])
+            if last and not should_update(self, hardware["id"]):
+                data.append(last)  # Not updated; repeats its last values
+                continue
+            item = self._last_items[hardware["id"]] = dict(hardware, sensors=[])
+            for i, (sensor_id, name, sensor_type) in enumerate(sensors):
+                unit, base, amplitude = _SENSOR_RANGES[sensor_type]
+                value = base + amplitude * math.sin(phase + position + i * 0.7)
+                if sensor_type == "Temperature" and fahrenheit:
+                    value = value * 9 / 5 + 32
+                    unit = "°F"
+                item["sensors"].append(
+                    {
+                        "id": sensor_id,
+                        "name": name,
+                        "type": sensor_type,
+                        "value": f"{value:.2f} {unit}",
+                        "raw": value,
+                    }
+                )
+            data.append(item)
+        if self.metrics is not None:
+            self.metrics.record("sensor read", time.perf_counter() - started)
+        return data
@@ -0,0 +1,17 @@
+# src/pymonitor/hardware/throttle.py
+
+
+def should_update(monitor, hardware_id):
+    """Returns True if a backend should update the hardware on this poll.
+
+    The CPU governor sets the monitor's active_hardware and
+    idle_update_every: while active_hardware is not None, hardware missing
+    from it is only updated on every idle_update_every-th poll (counted by
+    the monitor's polls) and otherwise keeps the values of its last update.
+    """
+    active = monitor.active_hardware
+    return (
+        active is None
+        or monitor.polls % monitor.idle_update_every == 0
+        or hardware_id in active
+    )
@@ -1,14 +1,81 @@
 # src/pymonitor/main.py
 
+# Imported first: it timestamps the start of the application's imports
+from .core.startup_trace import startup_trace
+
+import argparse
+import os
 import sys
+import time
 from PyQt6.QtWidgets import QMessageBox
 from .core.app import Application
 from .hardware.monitor import UntrustedLocationError
+from .core.paths import user_cache_dir
+from .hardware.session import ReplayHardwareMonitor, SessionRecorder
+
+
+def parse_args(argv):
+    """Parses PyMonitor.NET's own options; everything else is left for Qt."""
+    parser = argparse.ArgumentParser(prog="PyMonitor.NET", add_help=False)
+    parser.add_argument(
+        "--trace-startup",
+        nargs="?",
+        const=os.path.join(user_cache_dir(), "startup_trace.json"),
+        metavar="PATH",
+        help="print startup phase timings and write them as a Chrome trace to PATH",
+    )
+    parser.add_argument(
+        "--precise-profiling",
+        action="store_true",
+        help="sample more precisely while profiling, at the cost of slowing "
+        "down every thread",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record every hardware snapshot into a session file at PATH",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="show a session recorded with --record instead of the hardware",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=replay_speed,
+        default=1.0,
+        metavar="N",
+        help='replay speed: 1 is real time, "max" one snapshot per poll',
+    )
+    return parser.parse_known_args(argv[1:])
+
+
+def replay_speed(text):
+    """Parses --replay-speed; "max" (or 0) replays as fast as it is polled."""
+    if text == "max":
+        return 0.0
+    speed = float(text)
+    if speed < 0:
+        raise argparse.ArgumentTypeError("must be positive or \"max\"")
+    return speed
+
 
 def main():
     """Main entry point for the application."""
+    args, qt_args = parse_args(sys.argv)
+    if args.trace_startup:
+        startup_trace.enable(args.trace_startup)
+        startup_trace.add_span("imports", startup_trace.origin, time.perf_counter())
     try:
-        app = Application(sys.argv)
+        hardware_factory = None
+        if args.replay:
+            hardware_factory = lambda settings: ReplayHardwareMonitor(
+                settings, args.replay, speed=args.replay_speed
+            )
+        app = Application(sys.argv[:1] + qt_args, hardware_factory=hardware_factory)
+        app.precise_profiling = args.precise_profiling
+        if args.record:
+            app.recorder = SessionRecorder(args.record, app.hardware_monitor, app.settings)
 
         if app.is_already_running():
             msg_box = QMessageBox()
@@ -20,7 +87,12 @@ def main():
             msg_box.exec()
             sys.exit(1)
 
-        sys.exit(app.run())
+        exit_code = app.run()
+        if app.startup_error is not None:
+            # The hardware backend is opened after the event loop starts;
+            # report its failure like any other initialization error
+            raise app.startup_error
+        sys.exit(exit_code)
     except UntrustedLocationError as e:
         # Handle the specific case of untrusted location
         print("=" * 60)
@@ -0,0 +1,221 @@
+# src/pymonitor/ui/fonts.py
+
+import json
+import os
+import struct
+import sys
+
+from PyQt6.QtGui import QFontDatabase
+
+from ..core.paths import user_cache_dir
+from ..core.startup_trace import startup_trace
+
+# Family whose regular face provides the Nerd Font icon glyphs when the
+# overlay uses a font that is not bundled
+ICON_FALLBACK_FAMILY = "Hack Nerd Font"
+# Faces the overlay draws with: plain text and bold component titles
+OVERLAY_STYLES = ("Regular", "Bold")
+
+_CACHE_VERSION = 1
+
+
+def default_cache_path():
+    """Returns the per-user file the bundled font catalog is cached in."""
+    return os.path.join(user_cache_dir(), "fonts.json")
+
+
+def _normalize(family):
+    """Folds case, spaces and dashes, so "HackNerdFont" matches "Hack Nerd Font"."""
+    return "".join(c for c in family.lower() if c not in " -_")
+
+
+def _decode_name(platform_id, raw):
+    if platform_id in (0, 3):  # Unicode and Windows names are UTF-16BE
+        return raw.decode("utf-16-be", errors="replace")
+    return raw.decode("latin-1")
+
+
+def read_font_names(path):
+    """Returns (family, style) from a TrueType/OpenType file's name table.
+
+    Reads only the table directory and the name table, not the glyph data.
+    Typographic family/subfamily names (IDs 16/17) are preferred over the
+    legacy ones (IDs 1/2), like font pickers do. Returns None if the file is
+    not a single-font sfnt file or has no family name.
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] not in (b"\x00\x01\x00\x00", b"OTTO", b"true"):
+            return None
+        (num_tables,) = struct.unpack(">H", header[4:6])
+        directory = f.read(16 * num_tables)
+        for i in range(num_tables):
+            tag, _checksum, offset, length = struct.unpack(
+                ">4sIII", directory[16 * i : 16 * i + 16]
+            )
+            if tag == b"name":
+                f.seek(offset)
+                table = f.read(length)
+                break
+        else:
+            return None
+
+    _format, count, string_offset = struct.unpack(">HHH", table[:6])
+    names = {}  # name ID -> (preference, string)
+    for i in range(count):
+        platform_id, encoding_id, language_id, name_id, length, offset = struct.unpack(
+            ">HHHHHH", table[6 + 12 * i : 18 + 12 * i]
+        )
+        if name_id not in (1, 2, 16, 17):
+            continue
+        # Prefer English Windows names, then any Windows/Unicode name, then Mac
+        if platform_id == 3 and language_id == 0x409:
+            preference = 0
+        elif platform_id in (0, 3):
+            preference = 1
+        elif platform_id == 1 and language_id == 0:
+            preference = 2
+        else:
+            continue
+        if name_id in names and names[name_id][0] <= preference:
+            continue
+        start = string_offset + offset
+        names[name_id] = (preference, _decode_name(platform_id, table[start : start + length]))
+
+    family = (names.get(16) or names.get(1) or (None, None))[1]
+    style = (names.get(17) or names.get(2) or (None, "Regular"))[1]
+    if not family:
+        return None
+    return family, style
+
+
+class BundledFonts:
+    """Registers the fonts shipped in the fonts directory on demand.
+
+    Registering a font with Qt reads and parses the whole file, and the
+    bundled Nerd Fonts are about 2.7 MB each. Only the faces the overlays
+    use are loaded: the regular and bold faces of their font family, or the
+    icon fallback face if that family is not bundled. The family/style of
+    every file comes from a catalog cached on disk, which is rebuilt from
+    the files' name tables when the fonts directory changes.
+    """
+
+    def __init__(self, fonts_dir, cache_path=None):
+        self.fonts_dir = fonts_dir
+        self.cache_path = cache_path or default_cache_path()
+        self.loaded = set()  # File names registered with Qt
+        self._catalog = None  # family -> {style: file name}
+
+    def catalog(self):
+        """Returns {family: {style: file name}} for the bundled fonts."""
+        if self._catalog is None:
+            with startup_trace.phase("font catalog"):
+                self._catalog = self._load_catalog()
+        return self._catalog
+
+    def families(self):
+        return sorted(self.catalog())
+
+    def resolve(self, family):
+        """Returns the bundled family a font family name refers to, or None."""
+        catalog = self.catalog()
+        if family in catalog:
+            return family
+        wanted = _normalize(family or "")
+        for name in catalog:
+            if _normalize(name) == wanted:
+                return name
+        return None
+
+    def ensure_family(self, family, styles=OVERLAY_STYLES):
+        """Loads the faces needed to draw text in `family`.
+
+        If the family is not bundled (e.g. a system font), the icon fallback
+        face is loaded instead so Nerd Font icons still render. Faces that
+        are already loaded are skipped, so this is cheap to call whenever the
+        appearance is applied.
+        """
+        catalog = self.catalog()
+        bundled = self.resolve(family)
+        if bundled is None:
+            bundled, styles = ICON_FALLBACK_FAMILY, ("Regular",)
+        faces = catalog.get(bundled, {})
+        for style in styles:
+            file_name = faces.get(style)
+            if file_name:
+                self._register(file_name)
+
+    def load_all_families(self):
+        """Loads the regular face of every bundled family (for font pickers)."""
+        for faces in self.catalog().values():
+            file_name = faces.get("Regular") or next(iter(faces.values()))
+            self._register(file_name)
+
+    def _register(self, file_name):
+        if file_name in self.loaded:
+            return
+        # Marked even if it fails, so a broken file is not retried every time
+        self.loaded.add(file_name)
+        with startup_trace.phase(f"register font {file_name}"):
+            font_id = QFontDatabase.addApplicationFont(
+                os.path.join(self.fonts_dir, file_name)
+            )
+        if font_id < 0:
+            print(f"Warning: failed to load font {file_name}", file=sys.stderr)
+
+    def _directory_stamp(self):
+        try:
+            return os.stat(self.fonts_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_catalog(self):
+        stamp = self._directory_stamp()
+        if stamp is None:
+            return {}
+        try:
+            with open(self.cache_path, "r") as f:
+                cached = json.load(f)
+            if (
+                cached.get("version") == _CACHE_VERSION
+                and cached.get("fonts_dir") == os.path.abspath(self.fonts_dir)
+                and cached.get("stamp") == stamp
+            ):
+                return cached["families"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+        families = self._scan()
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "version": _CACHE_VERSION,
+                        "fonts_dir": os.path.abspath(self.fonts_dir),
+                        "stamp": stamp,
+                        "families": families,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Could not write font catalog cache: {e}", file=sys.stderr)
+        return families
+
+    def _scan(self):
+        """Builds the catalog by reading the name table of every font file."""
+        families = {}
+        for file_name in sorted(os.listdir(self.fonts_dir)):
+            if not file_name.lower().endswith((".ttf", ".otf")):
+                continue
+            try:
+                names = read_font_names(os.path.join(self.fonts_dir, file_name))
+            except (OSError, struct.error) as e:
+                print(f"Warning: could not read font {file_name}: {e}", file=sys.stderr)
+                continue
+            if names:
+                family, style = names
+                families.setdefault(family, {}).setdefault(style, file_name)
+        return families
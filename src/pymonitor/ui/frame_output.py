@@ -0,0 +1,183 @@
+# src/pymonitor/ui/frame_output.py
+
+import os
+import struct
+import sys
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtCore import QObject, QTimer, QBuffer, QByteArray, QIODevice, QSharedMemory, Qt
+
+
+class RenderedFrame:
+    """An overlay frame rendered offscreen.
+
+    Encodings are produced lazily and at most once per frame, so every sink
+    that needs the same format reuses the same bytes.
+    """
+
+    def __init__(self, image, serial):
+        self.image = image
+        self.serial = serial
+        self._png = None
+        self._rgba = None
+
+    def png(self):
+        """Returns the frame encoded as PNG bytes."""
+        if self._png is None:
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            self.image.save(buffer, "PNG")
+            buffer.close()
+            self._png = bytes(data)
+        return self._png
+
+    def rgba(self):
+        """Returns the raw, non-premultiplied RGBA8888 pixels (rows are packed)."""
+        if self._rgba is None:
+            image = self.image.convertToFormat(QImage.Format.Format_RGBA8888)
+            bits = image.constBits()
+            bits.setsize(image.sizeInBytes())
+            self._rgba = bytes(bits)
+        return self._rgba
+
+
+class PngFileSink:
+    """Writes each frame to a PNG file, replacing it atomically."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, frame):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(frame.png())
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        pass
+
+
+class SharedMemorySink:
+    """Publishes each frame as raw RGBA pixels in a QSharedMemory segment.
+
+    Layout: a little-endian header (magic b"PMON", format version, width,
+    height, bytes per line, frame serial) followed by the pixel rows. Readers
+    should lock the segment while copying and use the serial to detect new
+    frames.
+    """
+
+    HEADER = struct.Struct("<4sIIIIQ")
+    MAGIC = b"PMON"
+    VERSION = 1
+
+    def __init__(self, key):
+        self.memory = QSharedMemory(key)
+
+    def _ensure_capacity(self, size):
+        if self.memory.isAttached() and self.memory.size() >= size:
+            return True
+        if self.memory.isAttached():
+            self.memory.detach()
+        # Leave headroom so small size changes don't reallocate the segment
+        if not self.memory.create(size * 2):
+            if not self.memory.attach() or self.memory.size() < size:
+                print(
+                    f"Could not create shared memory frame buffer: "
+                    f"{self.memory.errorString()}",
+                    file=sys.stderr,
+                )
+                return False
+        return True
+
+    def write(self, frame):
+        pixels = frame.rgba()
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            frame.image.width(),
+            frame.image.height(),
+            frame.image.width() * 4,
+            frame.serial,
+        )
+        size = len(header) + len(pixels)
+        if not self._ensure_capacity(size):
+            return
+        self.memory.lock()
+        try:
+            buffer = self.memory.data()
+            buffer.setsize(self.memory.size())
+            view = memoryview(buffer)
+            view[: len(header)] = header
+            view[len(header) : size] = pixels
+        finally:
+            self.memory.unlock()
+
+    def close(self):
+        if self.memory.isAttached():
+            self.memory.detach()
+
+
+class FrameOutput(QObject):
+    """Renders an overlay offscreen at a fixed rate and feeds it to sinks.
+
+    Works without a visible desktop (e.g. with QT_QPA_PLATFORM=offscreen), so
+    screen-recording and streaming tools can consume the overlay directly.
+    A frame is only re-rendered and re-encoded when the overlay's content
+    changed since the last one.
+    """
+
+    def __init__(self, overlay, settings):
+        super().__init__()
+        self.overlay = overlay
+        self.settings = settings
+        self.frame = None
+        self._serial = 0
+        self._last_key = None
+
+        self.sinks = []
+        png_path = settings.get("output.png_path", "")
+        if png_path:
+            self.sinks.append(PngFileSink(png_path))
+        shm_key = settings.get("output.shared_memory_key", "")
+        if shm_key:
+            self.sinks.append(SharedMemorySink(shm_key))
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.render_frame)
+
+    def start(self):
+        """Starts rendering at the configured rate."""
+        fps = max(0.1, float(self.settings.get("output.fps", 2)))
+        self.timer.start(int(1000 / fps))
+
+    def stop(self):
+        """Stops rendering and releases the sinks."""
+        self.timer.stop()
+        for sink in self.sinks:
+            sink.close()
+
+    def render_frame(self):
+        """Renders and publishes a frame if the overlay content changed."""
+        overlay = self.overlay
+        size = overlay.size()
+        key = (overlay.content_version, size.width(), size.height())
+        if key == self._last_key:
+            return self.frame
+        self._last_key = key
+
+        image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setOpacity(overlay.settings.get("appearance.opacity", 100) / 100.0)
+        overlay.label.render_into(painter, size.width())
+        painter.end()
+
+        self._serial += 1
+        self.frame = RenderedFrame(image, self._serial)
+        for sink in self.sinks:
+            try:
+                sink.write(self.frame)
+            except OSError as e:
+                print(f"Error writing overlay frame: {e}", file=sys.stderr)
+        return self.frame
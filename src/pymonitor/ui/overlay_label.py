@@ -0,0 +1,128 @@
+# src/pymonitor/ui/overlay_label.py
+
+import math
+import time
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import (
+    QAbstractTextDocumentLayout,
+    QColor,
+    QFont,
+    QPainter,
+    QPalette,
+    QTextDocument,
+    QTextOption,
+)
+from PyQt6.QtCore import Qt, QSize
+
+from ..core.history import SPARKLINE_SCHEME
+
+
+class OverlayDocument(QTextDocument):
+    """A text document that resolves 'sparkline:' image URLs through a provider."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.image_provider = None  # Callable: key -> QPixmap or None
+
+    def loadResource(self, resource_type, name):
+        """Serves sparkline pixmaps directly from the provider's cache."""
+        if self.image_provider is not None and name.scheme() == SPARKLINE_SCHEME:
+            pixmap = self.image_provider(name.path())
+            if pixmap is not None:
+                return pixmap
+        return super().loadResource(resource_type, name)
+
+
+class OverlayLabel(QWidget):
+    """A lightweight rich-text label backed by an OverlayDocument.
+
+    Unlike QLabel it exposes its document, so inline images (sparklines) can be
+    served from in-memory pixmaps, and the same document can be painted onto
+    any paint device (e.g. an offscreen QImage).
+    """
+
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self.document = OverlayDocument(self)
+        self.document.setDocumentMargin(0)
+        self._text = ""
+        self._color = QColor("#FFFFFF")
+        self._word_wrap = False
+        self._alignment = Qt.AlignmentFlag.AlignLeft
+        self.paint_time = None  # Optional LatencyHistogram for paintEvent
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.setText(text)
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        """Sets the HTML content of the label."""
+        self._text = text
+        self.document.setHtml(text)
+        self.updateGeometry()
+        self.update()
+
+    def set_style(self, font_family, font_size, color):
+        """Sets the font and text color used for the document."""
+        font = QFont(font_family)
+        font.setPointSize(font_size)
+        self.document.setDefaultFont(font)
+        self._color = QColor(color)
+        self.updateGeometry()
+        self.update()
+
+    def setAlignment(self, alignment):
+        """Sets the horizontal text alignment (vertical alignment is always top)."""
+        self._alignment = alignment
+        self._apply_text_option()
+
+    def setWordWrap(self, on):
+        self._word_wrap = on
+        self._apply_text_option()
+
+    def _apply_text_option(self):
+        option = QTextOption(self.document.defaultTextOption())
+        option.setAlignment(self._alignment & Qt.AlignmentFlag.AlignHorizontal_Mask)
+        option.setWrapMode(
+            QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere
+            if self._word_wrap
+            else QTextOption.WrapMode.NoWrap
+        )
+        self.document.setDefaultTextOption(option)
+        self.updateGeometry()
+        self.update()
+
+    def hasHeightForWidth(self):
+        return self._word_wrap
+
+    def heightForWidth(self, width):
+        self.document.setTextWidth(width)
+        return math.ceil(self.document.size().height())
+
+    def sizeHint(self):
+        self.document.setTextWidth(-1)
+        width = math.ceil(self.document.idealWidth())
+        if self._word_wrap and self.width() > 0:
+            return QSize(width, self.heightForWidth(self.width()))
+        return QSize(width, math.ceil(self.document.size().height()))
+
+    def minimumSizeHint(self):
+        return QSize(0, 0)
+
+    def render_into(self, painter, width):
+        """Paints the document with the given layout width using an existing painter."""
+        self.document.setTextWidth(width)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(QPalette.ColorRole.Text, self._color)
+        self.document.documentLayout().draw(painter, context)
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        self.render_into(painter, self.width())
+        painter.end()
+        if self.paint_time is not None:
+            self.paint_time.record(time.perf_counter() - start)
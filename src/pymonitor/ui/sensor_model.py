@@ -0,0 +1,432 @@
+# src/pymonitor/ui/sensor_model.py
+
+from PyQt6.QtCore import (
+    QAbstractItemModel,
+    QByteArray,
+    QMimeData,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSignal,
+)
+
+from ..core.sensor_index import SensorIndex
+
+SENSOR_ROW_MIME_TYPE = "application/x-pymonitor-sensor-row"
+
+
+class _HardwareNode:
+    """A hardware component row in the sensor tree."""
+
+    __slots__ = ("id", "name", "type", "row", "sensors", "enabled", "checked_rows")
+
+    def __init__(self, hw_id, name, hw_type, row):
+        self.id = hw_id
+        self.name = name
+        self.type = hw_type
+        self.row = row
+        self.sensors = []
+        # Ids of the enabled sensors
+        self.enabled = set()
+        # Number of sensor rows whose id is in `enabled`
+        self.checked_rows = 0
+
+
+class _SensorNode:
+    """A sensor row under a hardware component."""
+
+    __slots__ = ("id", "name", "type", "row", "parent")
+
+    def __init__(self, sensor_id, name, sensor_type, row, parent):
+        self.id = sensor_id
+        self.name = name
+        self.type = sensor_type
+        self.row = row
+        self.parent = parent
+
+
+class SensorTreeModel(QAbstractItemModel):
+    """A two-level model (hardware -> sensors) over the sensor catalog.
+
+    The catalog is updated incrementally from hardware snapshots, so only the
+    rows of hardware/sensors that appeared or disappeared are inserted or
+    removed. Check states live in per-hardware sets of sensor ids: toggling a
+    sensor is an O(1) set update, and only that hardware's selection is
+    reported back.
+    The sensor rows are also kept in a SensorIndex for searching.
+    """
+
+    # Ids of the hardware whose sensor selection or order changed
+    selection_changed = pyqtSignal(list)
+    # The order of the hardware rows changed
+    component_order_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hardware = []
+        self._by_id = {}
+        # With an empty configuration every sensor is shown as checked until
+        # the user changes something (matches the previous tree behaviour).
+        self._all_by_default = False
+        self.search_index = SensorIndex()
+
+    # --- Catalog -----------------------------------------------------------
+
+    def load(self, data, enabled_sensors, component_order):
+        """Rebuilds the model from a snapshot and the selection settings."""
+        self.beginResetModel()
+        self._hardware = []
+        self._by_id = {}
+        self.search_index.clear()
+        self._all_by_default = not any(enabled_sensors.values())
+
+        position = {hw_id: i for i, hw_id in reversed(list(enumerate(component_order)))}
+        ordered = sorted(data, key=lambda x: position.get(x["id"], float("inf")))
+        for hw_item in ordered:
+            node = self._make_hardware(hw_item, len(self._hardware))
+            self._add_configured_sensors(node, hw_item, enabled_sensors)
+            self._hardware.append(node)
+        self.endResetModel()
+
+    def update_catalog(self, data, enabled_sensors):
+        """Applies topology changes from a snapshot with row inserts/removes.
+
+        Returns True if any rows were inserted or removed.
+        """
+        present = {hw_item["id"] for hw_item in data}
+        changed = False
+
+        # Removed hardware (walk backwards so row numbers stay valid)
+        for node in reversed(list(self._hardware)):
+            if node.id not in present:
+                self.beginRemoveRows(QModelIndex(), node.row, node.row)
+                del self._hardware[node.row]
+                del self._by_id[node.id]
+                for sensor in node.sensors:
+                    self.search_index.remove(sensor)
+                self._renumber(self._hardware, node.row)
+                self.endRemoveRows()
+                changed = True
+
+        for hw_item in data:
+            node = self._by_id.get(hw_item["id"])
+            if node is None:
+                row = len(self._hardware)
+                self.beginInsertRows(QModelIndex(), row, row)
+                node = self._make_hardware(hw_item, row)
+                self._add_configured_sensors(node, hw_item, enabled_sensors)
+                self._hardware.append(node)
+                self.endInsertRows()
+                changed = True
+            elif self._update_sensors(node, hw_item["sensors"]):
+                changed = True
+        return changed
+
+    def _make_hardware(self, hw_item, row):
+        node = _HardwareNode(hw_item["id"], hw_item["name"], hw_item.get("type", ""), row)
+        self._by_id[node.id] = node
+        return node
+
+    def _add_configured_sensors(self, node, hw_item, enabled_sensors):
+        """Adds a new hardware's sensors, the configured ones first and in order."""
+        configured = enabled_sensors.get(node.id) or {}
+        node.enabled = set(configured)
+        position = {sensor_id: i for i, sensor_id in enumerate(configured)}
+        sensors = sorted(
+            hw_item["sensors"], key=lambda s: position.get(s["id"], float("inf"))
+        )
+        self._add_sensors(node, sensors)
+
+    def _add_sensors(self, node, sensors):
+        for sensor in sensors:
+            sensor_node = _SensorNode(
+                sensor["id"], sensor["name"], sensor.get("type", ""), len(node.sensors), node
+            )
+            node.sensors.append(sensor_node)
+            self.search_index.add(sensor_node, node.name, sensor_node.name, sensor_node.type)
+            if sensor_node.id in node.enabled:
+                node.checked_rows += 1
+
+    def _update_sensors(self, node, sensors):
+        present = {sensor["id"] for sensor in sensors}
+        changed = False
+        for sensor in reversed(list(node.sensors)):
+            if sensor.id not in present:
+                parent_index = self.createIndex(node.row, 0, node)
+                self.beginRemoveRows(parent_index, sensor.row, sensor.row)
+                del node.sensors[sensor.row]
+                self.search_index.remove(sensor)
+                if sensor.id in node.enabled:
+                    node.checked_rows -= 1
+                self._renumber(node.sensors, sensor.row)
+                self.endRemoveRows()
+                changed = True
+
+        known = {s.id for s in node.sensors}
+        new = [s for s in sensors if s["id"] not in known]
+        if new:
+            parent_index = self.createIndex(node.row, 0, node)
+            first = len(node.sensors)
+            self.beginInsertRows(parent_index, first, first + len(new) - 1)
+            self._add_sensors(node, new)
+            self.endInsertRows()
+            changed = True
+        return changed
+
+    @staticmethod
+    def _renumber(nodes, start):
+        for row in range(start, len(nodes)):
+            nodes[row].row = row
+
+    # --- Selection results -------------------------------------------------
+
+    def enabled_sensors(self, hardware_id):
+        """Returns {sensor id: sensor name} of a hardware's enabled sensors in
+        tree order, the format stored in visualization.enabled_sensors."""
+        node = self._by_id.get(hardware_id)
+        if node is None:
+            return {}
+        return {s.id: s.name for s in node.sensors if s.id in node.enabled}
+
+    def component_order(self):
+        """Returns the hardware ids in tree order."""
+        return [node.id for node in self._hardware]
+
+    def _materialize_default_selection(self):
+        """Turns the implicit 'everything checked' state into explicit sets."""
+        self._all_by_default = False
+        for node in self._hardware:
+            node.enabled = {sensor.id for sensor in node.sensors}
+            node.checked_rows = len(node.sensors)
+
+    # --- Qt model interface ------------------------------------------------
+
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._hardware):
+                return self.createIndex(row, 0, self._hardware[row])
+            return QModelIndex()
+        node = parent.internalPointer()
+        if isinstance(node, _HardwareNode) and row < len(node.sensors):
+            return self.createIndex(row, 0, node.sensors[row])
+        return QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if isinstance(node, _SensorNode):
+            return self.createIndex(node.parent.row, 0, node.parent)
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._hardware)
+        node = parent.internalPointer()
+        if isinstance(node, _HardwareNode):
+            return len(node.sensors)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return "Hardware & Sensors"
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.name
+        if role == Qt.ItemDataRole.ToolTipRole and isinstance(node, _SensorNode):
+            return node.type
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return self._check_state(node)
+        return None
+
+    def _check_state(self, node):
+        if self._all_by_default:
+            return Qt.CheckState.Checked
+        if isinstance(node, _SensorNode):
+            return (
+                Qt.CheckState.Checked
+                if node.id in node.parent.enabled
+                else Qt.CheckState.Unchecked
+            )
+        if node.checked_rows == 0:
+            return Qt.CheckState.Unchecked
+        if node.checked_rows == len(node.sensors):
+            return Qt.CheckState.Checked
+        return Qt.CheckState.PartiallyChecked
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        flags = (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsUserCheckable
+            | Qt.ItemFlag.ItemIsDragEnabled
+        )
+        if isinstance(index.internalPointer(), _HardwareNode):
+            flags |= Qt.ItemFlag.ItemIsDropEnabled
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        if self._all_by_default:
+            self._materialize_default_selection()
+            changed = [node.id for node in self._hardware]
+        else:
+            changed = None
+
+        node = index.internalPointer()
+        if isinstance(node, _SensorNode):
+            hardware = node.parent
+            self._set_sensor_enabled(hardware, node.id, checked)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        else:
+            hardware = node
+            hardware.enabled = {s.id for s in hardware.sensors} if checked else set()
+            hardware.checked_rows = len(hardware.sensors) if checked else 0
+            if hardware.sensors:
+                first = self.createIndex(0, 0, hardware.sensors[0])
+                last = self.createIndex(
+                    len(hardware.sensors) - 1, 0, hardware.sensors[-1]
+                )
+                self.dataChanged.emit(first, last, [Qt.ItemDataRole.CheckStateRole])
+
+        hardware_index = self.createIndex(hardware.row, 0, hardware)
+        self.dataChanged.emit(
+            hardware_index, hardware_index, [Qt.ItemDataRole.CheckStateRole]
+        )
+        self.selection_changed.emit(changed or [hardware.id])
+        return True
+
+    @staticmethod
+    def _set_sensor_enabled(hardware, sensor_id, enabled):
+        if (sensor_id in hardware.enabled) == enabled:
+            return
+        if enabled:
+            hardware.enabled.add(sensor_id)
+            hardware.checked_rows += 1
+        else:
+            hardware.enabled.discard(sensor_id)
+            hardware.checked_rows -= 1
+
+    # --- Drag and drop reordering ------------------------------------------
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [SENSOR_ROW_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        if not indexes:
+            return None
+        node = indexes[0].internalPointer()
+        if isinstance(node, _SensorNode):
+            payload = f"{node.parent.row}:{node.row}"
+        else:
+            payload = f"{node.row}"
+        mime = QMimeData()
+        mime.setData(SENSOR_ROW_MIME_TYPE, QByteArray(payload.encode()))
+        return mime
+
+    def dropMimeData(self, data, action, row, column, parent):
+        """Moves the dragged row itself.
+
+        Returns False so the view does not also remove the source row, which it
+        would do after a successful MoveAction drop.
+        """
+        if action != Qt.DropAction.MoveAction or not data.hasFormat(SENSOR_ROW_MIME_TYPE):
+            return False
+        parts = [int(p) for p in bytes(data.data(SENSOR_ROW_MIME_TYPE)).decode().split(":")]
+
+        if len(parts) == 1:
+            # Hardware rows can only be reordered at the top level
+            if parent.isValid():
+                if row != -1:
+                    return False
+                row = parent.row()
+            self._move_row(QModelIndex(), self._hardware, parts[0], row)
+            self.component_order_changed.emit()
+        else:
+            hardware = self._hardware[parts[0]]
+            # Sensors can only be reordered within their own hardware
+            if not parent.isValid() or parent.internalPointer() is not hardware:
+                return False
+            parent_index = self.createIndex(hardware.row, 0, hardware)
+            self._move_row(parent_index, hardware.sensors, parts[1], row)
+            self.selection_changed.emit([hardware.id])
+        return False
+
+    def _move_row(self, parent_index, nodes, source, destination):
+        if destination < 0 or destination > len(nodes):
+            destination = len(nodes)
+        if destination in (source, source + 1):
+            return
+        self.beginMoveRows(parent_index, source, source, parent_index, destination)
+        node = nodes.pop(source)
+        nodes.insert(destination - 1 if destination > source else destination, node)
+        self._renumber(nodes, min(source, destination))
+        self.endMoveRows()
+
+
+class SensorFilterProxyModel(QSortFilterProxyModel):
+    """Shows only the sensors matching a search query and filters.
+
+    Matching is done once per filter change through the source model's
+    SensorIndex, so filterAcceptsRow is a set membership test. Hardware rows
+    are shown while any of their sensors matches.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+        self._hardware_name = None
+        self._sensor_type = None
+        self._matches = None  # None: no filter active, show everything
+        self._matching_hardware = set()
+
+    def is_filtering(self):
+        return self._matches is not None
+
+    def set_filter(self, query="", hardware_name=None, sensor_type=None):
+        """Sets the search text and the optional hardware/type filters."""
+        self._query = query
+        self._hardware_name = hardware_name
+        self._sensor_type = sensor_type
+        self.refresh()
+
+    def refresh(self):
+        """Re-runs the search, e.g. after the catalog changed."""
+        # A reset is much cheaper than invalidateFilter() here: the proxy
+        # rebuilds its mappings lazily for the rows the view asks for, instead
+        # of emitting a remove/insert signal for every changed range.
+        self.beginResetModel()
+        self._matches = self.sourceModel().search_index.search(
+            self._query, self._hardware_name, self._sensor_type
+        )
+        if self._matches is None:
+            self._matching_hardware = set()
+        else:
+            self._matching_hardware = {sensor.parent for sensor in self._matches}
+        self.endResetModel()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        matches = self._matches
+        if matches is None:
+            return True
+        if not source_parent.isValid():
+            hardware = self.sourceModel().index(source_row, 0).internalPointer()
+            return hardware in self._matching_hardware
+        return source_parent.internalPointer().sensors[source_row] in matches
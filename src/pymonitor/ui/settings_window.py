@@ -15,17 +15,20 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QDialogButtonBox,
     QLabel,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QLineEdit,
+    QTreeView,
     QMessageBox,
     QSlider,
     QHBoxLayout,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
 )
-import copy
 import sys
 from PyQt6.QtGui import QColor
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from ..core.version_checker import get_latest_lhm_version
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from ..core.version_checker import get_cached_lhm_version, get_latest_lhm_version
+from .sensor_model import SensorFilterProxyModel, SensorTreeModel
 
 
 class SettingsWindow(QDialog):
@@ -36,6 +39,9 @@ class SettingsWindow(QDialog):
         self.app = app
         self.settings = app.settings
         self.original_settings = None
+        # Autosave setting to go back to when the dialog closes; None while
+        # autosave is not suspended
+        self._suspended_autosave = None
 
         self.setWindowTitle("PyMonitor.NET Settings")
         self.setMinimumSize(500, 400)
@@ -45,11 +51,20 @@ class SettingsWindow(QDialog):
         self.tabs = QTabWidget()
         self.layout.addWidget(self.tabs)
 
-        # Create tabs
-        self.create_position_tab()
-        self.create_appearance_tab()
-        self.create_visualization_tab()
-        self.create_about_tab()
+        # Tabs start as empty pages and are built the first time they are
+        # shown, so opening the window only pays for the visible tab
+        self._tab_builders = {}
+        self._built_tabs = set()
+        for title, builder in (
+            ("Position", self.create_position_tab),
+            ("Appearance", self.create_appearance_tab),
+            ("Visualization", self.create_visualization_tab),
+            ("Performance", self.create_performance_tab),
+            ("About", self.create_about_tab),
+        ):
+            self._tab_builders[self.tabs.addTab(QWidget(), title)] = (title, builder)
+        self.tabs.currentChanged.connect(self.ensure_tab_built)
+        self.ensure_tab_built(self.tabs.currentIndex())
 
         # Dialog buttons
         self.button_box = QDialogButtonBox(
@@ -61,13 +76,36 @@ class SettingsWindow(QDialog):
 
     def showEvent(self, event):
         """Called when the dialog is shown. We capture the original settings here."""
-        self.original_settings = copy.deepcopy(self.settings.data)
-        self.populate_sensor_tree()  # Ensure the list is fresh every time
+        # Settings snapshots are immutable, so keeping a reference is enough
+        self.original_settings = self.settings.snapshot()
+        # Edits are previewed live but only written to the file on OK, so a
+        # cancelled or interrupted dialog leaves settings.json untouched
+        if self._suspended_autosave is None:
+            self._suspended_autosave = self.settings.autosave
+            self.settings.autosave = False
+        if self.is_tab_built("Visualization"):
+            self.populate_sensor_tree()  # Ensure the list is fresh every time
         super().showEvent(event)
 
-    def create_position_tab(self):
+    def _resume_autosave(self):
+        if self._suspended_autosave is not None:
+            self.settings.autosave = self._suspended_autosave
+            self._suspended_autosave = None
+
+    def ensure_tab_built(self, index):
+        """Builds the content of a tab page if it has not been built yet."""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        title, builder = entry
+        builder(self.tabs.widget(index))
+        self._built_tabs.add(title)
+
+    def is_tab_built(self, title):
+        return title in self._built_tabs
+
+    def create_position_tab(self, tab):
         """Creates the Position settings tab."""
-        tab = QWidget()
         layout = QFormLayout()
 
         # Monitor Selection
@@ -132,43 +170,43 @@ class SettingsWindow(QDialog):
         layout.addRow("Manual Width (px):", self.width_spinbox)
 
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "Position")
 
     def update_monitor(self, index):
         self.settings.set("position.monitor", index)
-        self.app.watermark.update_position()
+        self.app.reposition_overlays()
 
     def update_anchor(self, text):
         anchor_key = self.anchor_combo.currentData()
         self.settings.set("position.anchor", anchor_key)
-        self.app.watermark.update_position()
+        self.app.reposition_overlays()
 
     def update_offset_x(self, value):
         self.settings.set("position.offset_x", value)
-        self.app.watermark.update_position()
+        self.app.reposition_overlays()
 
     def update_offset_y(self, value):
         self.settings.set("position.offset_y", value)
-        self.app.watermark.update_position()
+        self.app.reposition_overlays()
 
     def update_width(self, value):
         """Updates the width setting."""
         self.settings.set("position.width", value)
-        self.app.watermark.update_appearance()
+        self.app.update_overlay_appearance()
 
     def update_auto_width(self, state):
         """Updates the auto_width setting and enables/disables the width spinbox."""
         is_checked = state == Qt.CheckState.Checked.value
         self.settings.set("position.auto_width", is_checked)
         self.width_spinbox.setEnabled(not is_checked)
-        self.app.watermark.update_appearance()
+        self.app.update_overlay_appearance()
 
-    def create_appearance_tab(self):
+    def create_appearance_tab(self, tab):
         """Creates the Appearance settings tab."""
-        tab = QWidget()
         layout = QFormLayout()
 
-        # Font Family
+        # Font Family. The picker lists registered fonts only, so register
+        # one face of every bundled family; the rest load when picked.
+        self.app.fonts.load_all_families()
         self.font_combo = QFontComboBox()
         current_font = self.settings.get("appearance.font_family", "Arial")
         self.font_combo.setCurrentText(current_font)
@@ -222,20 +260,19 @@ class SettingsWindow(QDialog):
         layout.addRow("Always on Top:", self.always_on_top_check)
 
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "Appearance")
 
     def update_font_family(self, font):
         self.settings.set("appearance.font_family", font.family())
-        self.app.watermark.update_appearance()
+        self.app.update_overlay_appearance()
 
     def update_font_size(self, size):
         self.settings.set("appearance.font_size", size)
-        self.app.watermark.update_appearance()
+        self.app.update_overlay_appearance()
 
     def update_text_align(self, align_text):
         align = align_text.lower()
         self.settings.set("appearance.text_align", align)
-        self.app.watermark.update_appearance()
+        self.app.update_overlay_appearance()
 
     def choose_color(self):
         color = QColorDialog.getColor(self.current_color, self)
@@ -243,7 +280,7 @@ class SettingsWindow(QDialog):
             self.current_color = color
             self.settings.set("appearance.font_color", color.name())
             self.update_color_button_style()
-            self.app.watermark.update_appearance()
+            self.app.update_overlay_appearance()
 
     def update_color_button_style(self):
         self.color_button.setText(self.current_color.name())
@@ -263,23 +300,47 @@ class SettingsWindow(QDialog):
 
     def update_always_on_top(self, checked):
         self.settings.set("window.always_on_top", checked)
-        self.app.watermark.update_flags()
+        self.app.update_overlay_flags()
 
     def update_opacity(self, value):
         self.settings.set("appearance.opacity", value)
-        self.app.watermark.update_appearance()
+        self.app.update_overlay_appearance()
 
-    def create_visualization_tab(self):
+    def create_visualization_tab(self, tab):
         """Creates the Visualization settings tab with a tree view for sensor selection."""
-        tab = QWidget()
         layout = QVBoxLayout()
 
-        self.sensor_tree = QTreeWidget()
-        self.sensor_tree.setHeaderLabels(["Hardware & Sensors"])
-        self.sensor_tree.setDragDropMode(QTreeWidget.DragDropMode.InternalMove)
-        self.sensor_tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
-        self.sensor_tree.itemChanged.connect(self.update_sensor_selection)
-        self.sensor_tree.model().rowsMoved.connect(self.handle_rows_moved)
+        self.sensor_model = SensorTreeModel(self)
+        self.sensor_model.selection_changed.connect(self.update_sensor_selection)
+        self.sensor_model.component_order_changed.connect(
+            self.handle_component_order_changed
+        )
+        self._sensor_tree_loaded = False
+        self.sensor_filter = SensorFilterProxyModel(self)
+        self.sensor_filter.setSourceModel(self.sensor_model)
+
+        # Search box and hardware/type filters
+        filter_layout = QHBoxLayout()
+        self.sensor_search_edit = QLineEdit()
+        self.sensor_search_edit.setPlaceholderText("Search sensors...")
+        self.sensor_search_edit.setClearButtonEnabled(True)
+        self.sensor_search_edit.textChanged.connect(self.apply_sensor_filter)
+        filter_layout.addWidget(self.sensor_search_edit, 1)
+        self.hardware_filter_combo = QComboBox()
+        self.hardware_filter_combo.currentIndexChanged.connect(self.apply_sensor_filter)
+        filter_layout.addWidget(self.hardware_filter_combo)
+        self.type_filter_combo = QComboBox()
+        self.type_filter_combo.currentIndexChanged.connect(self.apply_sensor_filter)
+        filter_layout.addWidget(self.type_filter_combo)
+        layout.addLayout(filter_layout)
+
+        self.sensor_tree = QTreeView()
+        self.sensor_tree.setModel(self.sensor_filter)
+        # Uniform rows let the view lay out only the visible rows, so the
+        # tree stays fast with thousands of sensors
+        self.sensor_tree.setUniformRowHeights(True)
+        self.sensor_tree.setDragDropMode(QTreeView.DragDropMode.InternalMove)
+        self.sensor_tree.setSelectionMode(QTreeView.SelectionMode.SingleSelection)
         layout.addWidget(self.sensor_tree)
 
         # Temperature Unit Selector
@@ -308,6 +369,13 @@ class SettingsWindow(QDialog):
         self.show_icons_check.stateChanged.connect(self.update_show_icons)
         display_layout.addRow("Show Icons:", self.show_icons_check)
 
+        self.show_sparklines_check = QCheckBox()
+        self.show_sparklines_check.setChecked(
+            self.settings.get("visualization.show_sparklines", False)
+        )
+        self.show_sparklines_check.stateChanged.connect(self.update_show_sparklines)
+        display_layout.addRow("Show Sparklines:", self.show_sparklines_check)
+
         self.indentation_spinbox = QSpinBox()
         self.indentation_spinbox.setRange(0, 16)
         self.indentation_spinbox.setValue(
@@ -338,170 +406,196 @@ class SettingsWindow(QDialog):
         layout.addWidget(populate_button)
 
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "Visualization")
+        self.populate_sensor_tree()
 
     def populate_sensor_tree(self):
-        """Fills the tree with hardware and sensors."""
-        self.sensor_tree.blockSignals(True)
-        self.sensor_tree.clear()
-        hardware_data = self.app.hardware_monitor.get_hardware_data()
-        enabled_sensors = self.settings.get("visualization.enabled_sensors", {})
-        is_config_empty = not any(enabled_sensors.values())
-
-        for hw_item in hardware_data:
-            hw_name = hw_item["name"]
-            parent = QTreeWidgetItem(self.sensor_tree, [hw_name])
-            parent.setFlags(parent.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            parent.setCheckState(0, Qt.CheckState.Unchecked)
-
-            hw_enabled_sensors = enabled_sensors.get(hw_name, [])
-            all_sensors_enabled = True
-
-            for sensor in hw_item["sensors"]:
-                sensor_name = sensor["name"]
-                child = QTreeWidgetItem(parent, [sensor_name])
-                child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                if is_config_empty or sensor_name in hw_enabled_sensors:
-                    child.setCheckState(0, Qt.CheckState.Checked)
-                else:
-                    child.setCheckState(0, Qt.CheckState.Unchecked)
-                    all_sensors_enabled = False
-
-            if all_sensors_enabled and parent.childCount() > 0:
-                parent.setCheckState(0, Qt.CheckState.Checked)
-            elif not all_sensors_enabled and hw_enabled_sensors:
-                parent.setCheckState(0, Qt.CheckState.PartiallyChecked)
-
-        self.sensor_tree.expandAll()
-        self.sensor_tree.blockSignals(False)
-
-    def handle_rows_moved(self, parent, start, end, destination, dest_row):
-        """Handles the reordering of items in the tree."""
-        # Update the component order in settings
-        new_order = []
-        for i in range(self.sensor_tree.topLevelItemCount()):
-            new_order.append(self.sensor_tree.topLevelItem(i).text(0))
-        self.settings.set("visualization.component_order", new_order)
-
-        # Update the enabled sensors order within a component if a sensor was moved
-        # This logic now handles both component and sensor reordering implicitly
-        # by rebuilding the enabled_sensors config based on the new tree structure.
-        self.update_sensor_selection(self.sensor_tree.invisibleRootItem(), 0)
-
-        # Force a UI update
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
+        """Reloads the sensor tree from the latest snapshot and the settings."""
+        # Use the worker's latest snapshot; the GUI thread never polls hardware
+        self.sensor_model.load(
+            self.app.latest_data,
+            self.settings.get("visualization.enabled_sensors", {}),
+            self.settings.get("visualization.component_order", []),
         )
+        self._sensor_tree_loaded = bool(self.app.latest_data)
+        self.update_sensor_filter_choices()
+        self.sensor_filter.refresh()
+        self.sensor_tree.expandAll()
 
-    def update_sensor_selection(self, item, column):
-        """Handles changes in the sensor selection tree."""
-        # Update children when a parent is checked/unchecked
-        if item.childCount() > 0:
-            self.sensor_tree.blockSignals(True)
-            for i in range(item.childCount()):
-                item.child(i).setCheckState(0, item.checkState(0))
-            self.sensor_tree.blockSignals(False)
-
-        # Update parent state based on children
-        parent = item.parent()
-        if parent:
-            self.sensor_tree.blockSignals(True)
-            checked_count = 0
-            for i in range(parent.childCount()):
-                if parent.child(i).checkState(0) == Qt.CheckState.Checked:
-                    checked_count += 1
-
-            if checked_count == 0:
-                parent.setCheckState(0, Qt.CheckState.Unchecked)
-            elif checked_count == parent.childCount():
-                parent.setCheckState(0, Qt.CheckState.Checked)
-            else:
-                parent.setCheckState(0, Qt.CheckState.PartiallyChecked)
-            self.sensor_tree.blockSignals(False)
-
-        # Save the current selection to settings
-        enabled_sensors = {}
-        for i in range(self.sensor_tree.topLevelItemCount()):
-            hw_item = self.sensor_tree.topLevelItem(i)
-            hw_name = hw_item.text(0)
-            enabled_sensors[hw_name] = []
-            for j in range(hw_item.childCount()):
-                sensor_item = hw_item.child(j)
-                if sensor_item.checkState(0) == Qt.CheckState.Checked:
-                    enabled_sensors[hw_name].append(sensor_item.text(0))
+    def refresh_sensor_catalog(self, data):
+        """Applies hardware that appeared or disappeared to the sensor tree."""
+        if not self.is_tab_built("Visualization"):
+            return
+        if not self._sensor_tree_loaded:
+            # The first snapshot arrived after the window was opened
+            self.populate_sensor_tree()
+            return
+        if self.sensor_model.update_catalog(
+            data, self.settings.get("visualization.enabled_sensors", {})
+        ):
+            self.update_sensor_filter_choices()
+            if self.sensor_filter.is_filtering():
+                self.sensor_filter.refresh()
+
+    def update_sensor_filter_choices(self):
+        """Fills the hardware/type filter combos from the search index."""
+        index = self.sensor_model.search_index
+        for combo, all_label, values in (
+            (self.hardware_filter_combo, "All Hardware", index.hardware_names()),
+            (self.type_filter_combo, "All Types", index.sensor_types()),
+        ):
+            choices = [None] + values
+            if [combo.itemData(i) for i in range(combo.count())] == choices:
+                continue
+            current = combo.currentData()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(all_label, None)
+            for value in values:
+                combo.addItem(value, value)
+            combo.setCurrentIndex(max(combo.findData(current), 0))
+            combo.blockSignals(False)
+
+    def apply_sensor_filter(self, *_):
+        """Filters the sensor tree by the search text and the selected filters."""
+        self.sensor_filter.set_filter(
+            self.sensor_search_edit.text(),
+            self.hardware_filter_combo.currentData(),
+            self.type_filter_combo.currentData(),
+        )
+        # Reordering a filtered list would be ambiguous, so only allow it
+        # while every row is visible
+        self.sensor_tree.setDragEnabled(not self.sensor_filter.is_filtering())
+        # Only the hardware rows need expanding; sensors are leaves
+        for row in range(self.sensor_filter.rowCount()):
+            self.sensor_tree.setExpanded(self.sensor_filter.index(row, 0), True)
+
+    def handle_component_order_changed(self):
+        """Stores the new hardware order after a drag-and-drop move."""
+        self.settings.set(
+            "visualization.component_order", self.sensor_model.component_order()
+        )
+        self.app.refresh_overlays()
 
+    def update_sensor_selection(self, hardware_ids):
+        """Stores the selection (and sensor order) of the changed hardware."""
+        enabled_sensors = dict(self.settings.get("visualization.enabled_sensors", {}))
+        for hw_id in hardware_ids:
+            enabled_sensors[hw_id] = self.sensor_model.enabled_sensors(hw_id)
         self.settings.set("visualization.enabled_sensors", enabled_sensors)
         # Trigger a UI update in the main app
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
-        )
+        self.app.refresh_overlays()
 
     def update_temp_unit(self, unit_text):
         """Updates the temperature unit setting."""
         unit = unit_text.lower()
         self.settings.set("monitoring.temperature_unit", unit)
-        # Force a data refresh to apply the new unit
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
-        )
+        # Values are converted when polled, so ask the worker for a fresh poll
+        self.app.request_poll()
 
     def update_show_titles(self, state):
         """Updates the setting for showing component titles."""
         show = bool(state == Qt.CheckState.Checked.value)
         self.settings.set("visualization.show_component_titles", show)
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
-        )
+        self.app.refresh_overlays()
 
     def update_show_icons(self, state):
         """Updates the setting for showing icons."""
         show = bool(state == Qt.CheckState.Checked.value)
         self.settings.set("visualization.show_icons", show)
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
-        )
+        self.app.refresh_overlays()
+
+    def update_show_sparklines(self, state):
+        """Updates the setting for showing a sparkline next to each sensor."""
+        show = bool(state == Qt.CheckState.Checked.value)
+        self.settings.set("visualization.show_sparklines", show)
+        self.app.refresh_overlays()
 
     def update_indentation(self, value):
         """Updates the sensor indentation setting."""
         self.settings.set("visualization.sensor_indentation", value)
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
-        )
+        self.app.refresh_overlays()
 
     def update_category_spacing(self, value):
         """Updates the vertical spacing between categories."""
         self.settings.set("visualization.category_spacing", value)
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
-        )
+        self.app.refresh_overlays()
 
     def update_display_mode(self, text):
         """Updates the display mode for categories."""
         mode = "singleline" if text == "Single Line" else "multiline"
         self.settings.set("visualization.display_mode", mode)
-        self.app.watermark.update_text(
-            self.app._format_data_for_display(
-                self.app.hardware_monitor.get_hardware_data()
-            )
+        self.app.refresh_overlays()
+
+    def create_performance_tab(self, tab):
+        """Creates the Performance tab showing the tick latency histograms."""
+        layout = QVBoxLayout()
+
+        window_layout = QHBoxLayout()
+        window_layout.addWidget(QLabel("Window:"))
+        self.metrics_window_combo = QComboBox()
+        self.metrics_window_combo.addItem("Last 10 seconds", 10)
+        self.metrics_window_combo.addItem("Last 60 seconds", 60)
+        self.metrics_window_combo.currentIndexChanged.connect(self.refresh_metrics)
+        window_layout.addWidget(self.metrics_window_combo)
+        window_layout.addStretch()
+        layout.addLayout(window_layout)
+
+        self.metrics_table = QTableWidget(0, 6)
+        self.metrics_table.setHorizontalHeaderLabels(
+            ["Metric", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"]
+        )
+        self.metrics_table.verticalHeader().setVisible(False)
+        self.metrics_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        header = self.metrics_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 6):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.metrics_table)
+
+        self.frame_stats_label = QLabel()
+        layout.addWidget(self.frame_stats_label)
+
+        tab.setLayout(layout)
+        self.performance_tab = tab
+
+        # Refreshed only while the tab is on screen
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(1000)
+        self.metrics_timer.timeout.connect(self.refresh_metrics)
+        self.metrics_timer.start()
+        self.refresh_metrics()
+
+    def refresh_metrics(self, *_):
+        """Fills the Performance tab from the application's TickMetrics."""
+        if not self.isVisible() or self.tabs.currentWidget() is not self.performance_tab:
+            return
+        window = self.metrics_window_combo.currentData()
+        rows = [
+            (name, stats)
+            for name, stats in self.app.metrics.snapshot(window).items()
+            if stats["count"]
+        ]
+        self.metrics_table.setRowCount(len(rows))
+        for row, (name, stats) in enumerate(rows):
+            cells = [name, str(stats["count"])] + [
+                f"{stats[key] * 1000:.3f}" for key in ("p50", "p95", "p99", "max")
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(
+                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                    )
+                self.metrics_table.setItem(row, column, item)
+
+        frames = self.app.frame_mailbox.stats()
+        self.frame_stats_label.setText(
+            f"Frames posted: {frames['posted']}, delivered: {frames['delivered']}, "
+            f"dropped: {frames['dropped']}"
         )
 
-    def create_about_tab(self):
+    def create_about_tab(self, tab):
         """Creates the About tab with version info and links."""
-        tab = QWidget()
         layout = QVBoxLayout()
 
         version = self.settings.get("about.version", "N/A")
@@ -536,14 +630,16 @@ class SettingsWindow(QDialog):
         layout.addStretch()
 
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "About")
-        self.check_lhm_version()  # Trigger version check when tab is created
+        # The tab is built when it is first shown, so the version check (a
+        # network request) only runs if the user looks at it
+        self.check_lhm_version()
 
     def accept(self):
         """Saves settings to file and closes the dialog."""
         try:
             self.settings.save()
             print("Settings saved successfully.")
+            self._resume_autosave()
             super().accept()
         except Exception as e:
             print(f"An error occurred while saving settings: {e}", file=sys.stderr)
@@ -558,20 +654,26 @@ class SettingsWindow(QDialog):
     def reject(self):
         """Restores settings to their original state and closes the dialog."""
         if self.original_settings:
-            self.settings.data = copy.deepcopy(self.original_settings)
+            self.settings.restore(self.original_settings)
             # Re-apply all settings to the UI
-            self.app.watermark.update_appearance()
-            self.app.watermark.update_position()
-            self.app.watermark.update_flags()
-            # Force an immediate data refresh with the correct filters
-            self.app.watermark.update_text(
-                self.app._format_data_for_display(
-                    self.app.hardware_monitor.get_hardware_data()
-                )
-            )
+            self.app.update_overlay_appearance()
+            self.app.reposition_overlays()
+            self.app.update_overlay_flags()
+            # Re-render immediately with the correct filters, and re-poll in
+            # case the temperature unit changed
+            self.app.refresh_overlays()
+            self.app.request_poll()
             # Also reset the controls in the settings window itself
             self.reset_controls_to_current_settings()
 
+        self._resume_autosave()
+        if self.settings.autosave:
+            # Writes changes made outside the dialog while it was open;
+            # does nothing if the file already holds these settings
+            try:
+                self.settings.save()
+            except IOError:
+                pass  # Already reported by save()
         print("Settings changes cancelled.")
         super().reject()
 
@@ -582,16 +684,24 @@ class SettingsWindow(QDialog):
         class VersionWorker(QThread):
             finished = pyqtSignal(str, str)
 
-            def __init__(self, app):
+            def __init__(self, app, ttl):
                 super().__init__()
                 self.app = app
+                self.ttl = ttl
 
             def run(self):
                 local_version = self.app.hardware_monitor.get_local_dll_version()
-                latest_version = get_latest_lhm_version()
-                self.finished.emit(local_version, latest_version)
-
-        self.version_worker = VersionWorker(self.app)
+                # Show the last known answer right away (also when offline),
+                # then the revalidated one
+                cached_version = get_cached_lhm_version()
+                if cached_version:
+                    self.finished.emit(local_version, cached_version)
+                latest_version = get_latest_lhm_version(ttl=self.ttl)
+                if latest_version != cached_version or not cached_version:
+                    self.finished.emit(local_version, latest_version)
+
+        ttl_hours = float(self.settings.get("about.version_check_ttl_hours", 24))
+        self.version_worker = VersionWorker(self.app, ttl_hours * 3600)
         self.version_worker.finished.connect(self.update_lhm_version_label)
         self.version_worker.start()
 
@@ -615,9 +725,28 @@ class SettingsWindow(QDialog):
 
         self.lhm_version_label.setText(text)
 
+    def apply_reloaded_settings(self):
+        """Shows settings reloaded from settings.json while the dialog is open.
+
+        The reloaded settings become the ones Cancel returns to, so closing
+        the dialog does not undo (and save over) the external change.
+        """
+        self.original_settings = self.settings.snapshot()
+        self.reset_controls_to_current_settings()
+
     def reset_controls_to_current_settings(self):
-        """Resets all UI controls in the dialog to reflect the current settings."""
-        # Appearance Tab
+        """Resets the UI controls of the built tabs to reflect the current settings.
+
+        Tabs that were not built yet read the settings when they are created.
+        """
+        if self.is_tab_built("Appearance"):
+            self.reset_appearance_controls()
+        if self.is_tab_built("Visualization"):
+            self.reset_visualization_controls()
+        if self.is_tab_built("Position"):
+            self.reset_position_controls()
+
+    def reset_appearance_controls(self):
         self.font_combo.setCurrentText(
             self.settings.get("appearance.font_family", "Arial")
         )
@@ -634,7 +763,7 @@ class SettingsWindow(QDialog):
             self.settings.get("window.always_on_top", True)
         )
 
-        # Visualization Tab
+    def reset_visualization_controls(self):
         self.temp_unit_combo.setCurrentText(
             self.settings.get("monitoring.temperature_unit", "celsius").capitalize()
         )
@@ -653,17 +782,19 @@ class SettingsWindow(QDialog):
         self.show_icons_check.setChecked(
             self.settings.get("visualization.show_icons", True)
         )
+        self.show_sparklines_check.setChecked(
+            self.settings.get("visualization.show_sparklines", False)
+        )
 
-        # Position Tab
+        self.populate_sensor_tree()
+
+    def reset_position_controls(self):
         self.monitor_combo.setCurrentIndex(self.settings.get("position.monitor", 0))
         self.anchor_combo.setCurrentIndex(
             self.anchor_combo.findData(self.settings.get("position.anchor", "top_left"))
         )
-        self.offset_x_spinbox.setValue(self.settings.get("position.offset_x", 10))
-        self.offset_y_spinbox.setValue(self.settings.get("position.offset_y", 10))
+        self.offset_x_spin.setValue(int(self.settings.get("position.offset_x", 10)))
+        self.offset_y_spin.setValue(int(self.settings.get("position.offset_y", 10)))
         self.auto_width_check.setChecked(self.settings.get("position.auto_width", True))
         self.width_spinbox.setValue(self.settings.get("position.width", 400))
         self.width_spinbox.setEnabled(not self.auto_width_check.isChecked())
-
-        # Visualization Tab
-        self.populate_sensor_tree()
@@ -0,0 +1,134 @@
+# src/pymonitor/ui/sparkline.py
+
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+from PyQt6.QtCore import Qt
+
+# Sensor types whose values are percentages get a fixed 0-100 scale, so their
+# sparklines never need a full redraw because of a range change.
+PERCENT_SENSOR_TYPES = ("Load", "Control", "Level")
+
+
+class Sparkline:
+    """A mini-graph drawn incrementally into a cached pixmap.
+
+    Each new sample scrolls the pixmap one column to the left and paints only
+    the new column. A full redraw from the ring buffer happens only when the
+    vertical scale has to change or more samples arrived than fit in the graph.
+    """
+
+    def __init__(self, width, height, color, value_range=None):
+        self.width = width
+        self.height = height
+        self.fixed_range = value_range
+        self.color = QColor(color)
+        self.fill_color = QColor(self.color)
+        self.fill_color.setAlpha(110)
+        self.pixmap = QPixmap(width, height)
+        self.pixmap.fill(Qt.GlobalColor.transparent)
+        self.count = 0  # History count already drawn into the pixmap
+        self._low, self._high = value_range if value_range else (None, None)
+        self._since_rescale = 0
+
+    def update(self, count, samples):
+        """Brings the pixmap up to date with a history snapshot."""
+        new = count - self.count
+        if new <= 0 or not samples:
+            return
+        self.count = count
+        new = min(new, len(samples))
+        new_samples = samples[-new:]
+        self._since_rescale += new
+
+        if new >= self.width or self._needs_rescale(new_samples):
+            self._rescale(samples)
+            self._redraw(samples)
+            return
+
+        self.pixmap.scroll(-new, 0, self.pixmap.rect())
+        painter = QPainter(self.pixmap)
+        x = self.width - new
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(x, 0, new, self.height, Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        for value in new_samples:
+            self._draw_column(painter, x, value)
+            x += 1
+        painter.end()
+
+    def _needs_rescale(self, new_samples):
+        if self.fixed_range:
+            return False
+        if self._low is None:
+            return True
+        # Periodically shrink the scale again once old peaks have scrolled out
+        if self._since_rescale >= self.width:
+            return True
+        return any(
+            v is not None and not (self._low <= v <= self._high) for v in new_samples
+        )
+
+    def _rescale(self, samples):
+        self._since_rescale = 0
+        if self.fixed_range:
+            return
+        values = [v for v in samples if v is not None]
+        if not values:
+            self._low, self._high = 0.0, 1.0
+            return
+        low, high = min(values), max(values)
+        padding = (high - low) * 0.1 or max(abs(high) * 0.1, 1.0)
+        self._low, self._high = low - padding, high + padding
+
+    def _redraw(self, samples):
+        self.pixmap.fill(Qt.GlobalColor.transparent)
+        visible = samples[-self.width :]
+        painter = QPainter(self.pixmap)
+        x = self.width - len(visible)
+        for value in visible:
+            self._draw_column(painter, x, value)
+            x += 1
+        painter.end()
+
+    def _draw_column(self, painter, x, value):
+        if value is None:
+            return
+        span = self._high - self._low
+        ratio = (value - self._low) / span if span else 0.0
+        bar = max(1, min(self.height, round(ratio * (self.height - 1)) + 1))
+        top = self.height - bar
+        painter.fillRect(x, top + 1, 1, bar - 1, self.fill_color)
+        painter.fillRect(x, top, 1, 1, self.color)
+
+
+class SparklineSet:
+    """The sparklines of one overlay, keyed like the HistoryStore."""
+
+    def __init__(self, history, settings):
+        self.history = history
+        self.settings = settings
+        self._sparklines = {}
+        self._history_version = history.version
+
+    def restyle(self):
+        """Drops all sparklines so they are recreated with the current settings."""
+        self._sparklines.clear()
+
+    def pixmap(self, key):
+        """Returns the up-to-date pixmap for a sensor's sparkline."""
+        if self._history_version != self.history.version:
+            # Histories were dropped (and may already be recreated); sparklines
+            # would keep their old samples, so rebuild them from the store
+            self._history_version = self.history.version
+            self._sparklines.clear()
+        sparkline = self._sparklines.get(key)
+        if sparkline is None or sparkline.width != self.history.capacity:
+            sensor_type = self.history.sensor_type(key)
+            sparkline = self._sparklines[key] = Sparkline(
+                self.history.capacity,
+                int(self.settings.get("visualization.sparkline_height", 12)),
+                self.settings.get("appearance.font_color", "#FFFFFF"),
+                (0.0, 100.0) if sensor_type in PERCENT_SENSOR_TYPES else None,
+            )
+        count, samples = self.history.snapshot(key, sparkline.count)
+        sparkline.update(count, samples)
+        return sparkline.pixmap
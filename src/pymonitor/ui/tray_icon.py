@@ -32,6 +32,11 @@ class TrayIcon(QSystemTrayIcon):
         settings_action.triggered.connect(self.show_settings)
         self.menu.addAction(settings_action)
 
+        # Samples the worker and UI threads until chosen again
+        self.profile_action = QAction("Start Profiling", self)
+        self.profile_action.triggered.connect(self.app.toggle_profiling)
+        self.menu.addAction(self.profile_action)
+
         self.menu.addSeparator()
 
         # Exit
@@ -56,11 +61,16 @@ class TrayIcon(QSystemTrayIcon):
 
     def show_settings(self):
         """Shows the settings window, ensuring it is brought to the front."""
-        if self.app.settings_window.isHidden():
-            self.app.settings_window.show()
+        settings_window = self.app.get_settings_window()
+        if settings_window.isHidden():
+            settings_window.show()
         else:
-            self.app.settings_window.activateWindow()
-            self.app.settings_window.raise_()
+            settings_window.activateWindow()
+            settings_window.raise_()
+
+    def set_profiling(self, running):
+        """Updates the profiling menu entry."""
+        self.profile_action.setText("Stop Profiling" if running else "Start Profiling")
 
     def on_activated(self, reason):
         """Handle activation events (e.g., clicks)."""
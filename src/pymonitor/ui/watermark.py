@@ -1,16 +1,25 @@
 # src/pymonitor/ui/watermark.py
 
-from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
+from PyQt6.QtCore import Qt, QPoint, pyqtSlot
+
+from .overlay_label import OverlayLabel
+from .sparkline import SparklineSet
+from ..core.render_plan import RenderPlan
 
 
 class WatermarkWindow(QWidget):
     """Displays the hardware data as a transparent, click-through overlay using PyQt6."""
 
-    def __init__(self, app):
+    def __init__(self, app, settings=None):
         super().__init__()
         self.app = app
-        self.settings = app.settings
+        # Additional overlays get a settings view with their own overrides
+        self.settings = settings if settings is not None else app.settings
+        self.render_plan = RenderPlan(self.settings)
+        # Incremented whenever what the overlay shows may have changed; used by
+        # offscreen outputs to skip re-rendering identical frames.
+        self.content_version = 0
 
         # Base flags for a frameless, non-interactive overlay
         flags = (
@@ -24,36 +33,112 @@ class WatermarkWindow(QWidget):
         # Main layout and label to display the text
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
-        self.label = QLabel("Initializing...")
+        self.label = OverlayLabel("Initializing...")
         self.label.setWordWrap(True)  # Enable word wrap for alignment
+        self.label.paint_time = app.metrics.histogram("paint")
         self.layout.addWidget(self.label)
+
+        # Sparkline images referenced by the HTML are served from cached pixmaps
+        self.sparklines = SparklineSet(app.history, self.settings)
+        self.label.document.image_provider = self.sparklines.pixmap
         self.setLayout(self.layout)
 
+        # Cached placement: the target screen and its geometry, plus the anchor
+        # position computed for a given window size. Invalidated by screen
+        # signals, resizes and position-setting changes, never per tick.
+        self._screen = None
+        self._screen_geometry = None
+        self._anchor_pos = None
+        self._anchor_size = None
+
+        qt_app = QApplication.instance()
+        qt_app.screenAdded.connect(self._on_screens_changed)
+        qt_app.screenRemoved.connect(self._on_screens_changed)
+
         # Initial setup from settings
         self.update_appearance()
         self.update_flags()
 
     @pyqtSlot(str)
     def update_text(self, text):
-        """Updates the text and triggers a style/size/position refresh."""
+        """Updates the text and refreshes the size (and position, if it changed)."""
+        # Drawn sparklines change with every frame even if the text does not
+        if text != self.label.text() or self.render_plan.draws_sparklines:
+            self.content_version += 1
         self.label.setText(text)
-        # Appearance update will handle resizing and repositioning
-        self.update_appearance()
+        # Style is applied by update_appearance() when settings change; a new
+        # frame only needs the size recomputed.
+        self._update_size()
+        self.update_position()
 
-    def update_position(self):
-        """Calculates and sets the window position. Should be called after resizing."""
+    def reposition(self):
+        """Drops the cached placement and recomputes it from the current settings.
+
+        Call this after changing any 'position.*' setting.
+        """
+        self._screen_geometry = None
+        self._anchor_pos = None
+        self.update_position()
+
+    def _on_screens_changed(self, *args):
+        """Handles screens being added/removed or changing geometry."""
+        self.reposition()
+
+    def _resolve_screen(self):
+        """Resolves the configured monitor and caches its geometry.
+
+        Returns False if no screen is attached (e.g. while displays are being
+        reconnected); screenAdded resolves it again once one is back.
+        """
         monitor_index = self.settings.get("position.monitor", 0)
         screens = QApplication.screens()
-        if monitor_index >= len(screens):
-            monitor_index = 0  # Default to primary screen
-        screen_geometry = screens[monitor_index].geometry()
+        if not screens:
+            return False
+        if 0 <= monitor_index < len(screens):
+            screen = screens[monitor_index]
+        else:
+            # The index is resolved only when screens or settings change, so
+            # this fallback (and its warning) happens once, not every tick.
+            screen = QApplication.primaryScreen() or screens[0]
+            print(
+                f"Monitor {monitor_index} is not available; "
+                "using the primary screen instead."
+            )
+
+        if screen is not self._screen:
+            if self._screen is not None:
+                try:
+                    self._screen.geometryChanged.disconnect(self._on_screens_changed)
+                except (TypeError, RuntimeError):
+                    pass  # Already disconnected or the screen was destroyed
+            screen.geometryChanged.connect(self._on_screens_changed)
+            self._screen = screen
+
+        self._screen_geometry = screen.geometry()
+        return True
+
+    def update_position(self):
+        """Moves the window to its anchor, recomputing it only when needed."""
+        win_size = self.size()  # Use current, fixed size
+        if self._screen_geometry is None:
+            if not self._resolve_screen():
+                return  # Nowhere to place the window until a screen is added
+            self._anchor_pos = None
+        if self._anchor_pos is None or win_size != self._anchor_size:
+            self._anchor_pos = self._compute_anchor_pos(win_size)
+            self._anchor_size = win_size
+
+        if self.pos() != self._anchor_pos:
+            self.move(self._anchor_pos)
+
+    def _compute_anchor_pos(self, win_size):
+        """Calculates the window position for the given size on the cached screen."""
+        screen_geometry = self._screen_geometry
 
         anchor = self.settings.get("position.anchor", "top_left")
         offset_x = self.settings.get("position.offset_x", 10)
         offset_y = self.settings.get("position.offset_y", 10)
 
-        win_size = self.size()  # Use current, fixed size
-
         # Horizontal alignment
         if "left" in anchor:
             x = screen_geometry.x() + offset_x
@@ -92,7 +177,7 @@ class WatermarkWindow(QWidget):
         else:
             y = screen_geometry.y() + offset_y  # Default case
 
-        self.move(x, y)
+        return QPoint(x, y)
 
     def update_flags(self):
         """Updates window flags like 'always on top'."""
@@ -117,18 +202,13 @@ class WatermarkWindow(QWidget):
         color = self.settings.get("appearance.font_color", "#FFFFFF")
         opacity = self.settings.get("appearance.opacity", 100)
         align_str = self.settings.get("appearance.text_align", "left")
-        auto_width = self.settings.get("position.auto_width", True)
 
-        # Apply font and color via stylesheet for robustness
-        self.label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-family: '{font_family}';
-                font-size: {font_size}pt;
-                color: {color};
-            }}
-        """
-        )
+        # Bundled fonts are registered when an overlay first needs them
+        self.app.fonts.ensure_family(font_family)
+        # Apply font and color to the overlay document
+        self.label.set_style(font_family, font_size, color)
+        self.content_version += 1
+        self.sparklines.restyle()
 
         # Set Text Alignment
         if align_str == "center":
@@ -139,12 +219,25 @@ class WatermarkWindow(QWidget):
             alignment = Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
         self.label.setAlignment(alignment)
 
+        # Apply opacity to the whole window
+        self.setWindowOpacity(opacity / 100.0)
+
+        # Finally, update the size; the position follows if the size changed
+        self._update_size()
+        self.update_position()
+
+    def _update_size(self):
+        """Resizes the window to fit the label according to the width settings."""
+        auto_width = self.settings.get("position.auto_width", True)
+
         # Adjust size based on auto_width setting
         if auto_width:
             # Unset fixed size constraints to allow auto-sizing
             self.setMinimumSize(0, 0)
             self.setMaximumSize(16777215, 16777215)  # QWIDGETSIZE_MAX
             self.label.setWordWrap(False)  # Disable word wrap for auto width
+            self.label.setMinimumWidth(0)
+            self.label.setMaximumWidth(16777215)
             self.adjustSize()  # Let the label and layout determine the size
         else:
             # Set fixed width and calculate required height
@@ -163,10 +256,9 @@ class WatermarkWindow(QWidget):
                 self.adjustSize()
                 self.setFixedWidth(width)
 
-        # Apply opacity to the whole window
-        self.setWindowOpacity(opacity / 100.0)
-
-        # Finally, update the position since the size might have changed
+    def resizeEvent(self, event):
+        """Re-anchors the window when its size changes."""
+        super().resizeEvent(event)
         self.update_position()
 
     def closeEvent(self, event):
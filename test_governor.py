@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for the CPU governor's defaults: with the default settings, a
+typical poll cost must keep PyMonitor at the full rate (level 0), whether the
+governor is left off or turned on with the default budget.
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+# CPU time of one poll of a typical desktop (hardware Update(), sensor reads
+# and rendering), and the default polling interval
+POLL_CPU_SECONDS = 0.06
+POLL_INTERVAL_SECONDS = 2.0
+
+
+def test_default_settings_keep_full_rate():
+    """Feeds the governor a typical poll cost and checks it stays at level 0."""
+    print("🧪 Testing the CPU governor with the default settings...")
+
+    from PyQt6.QtCore import QCoreApplication, QObject
+    from pymonitor.config.settings import Settings
+    from pymonitor.core.governor import SAMPLE_SECONDS, OverheadGovernor
+
+    # Keeps a Qt application alive for the governor's timer
+    qt_app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(os.path.join(tmp, "settings.json"))
+
+    class FakeApp(QObject):
+        pass
+
+    app = FakeApp()
+    app.settings = settings
+    clock = {"wall": 0.0, "cpu": 0.0}
+    governor = OverheadGovernor(
+        app,
+        process_clock=lambda: clock["cpu"],
+        thread_clock=lambda: 0.0,
+        wall_clock=lambda: clock["wall"],
+    )
+
+    default_enabled = settings.get("performance.governor")
+    polls_per_sample = SAMPLE_SECONDS / POLL_INTERVAL_SECONDS
+    levels = []
+    for enabled in (default_enabled, True):
+        settings.set("performance.governor", enabled)
+        governor.sample()  # Starts a new measurement
+        for _ in range(6):
+            clock["wall"] += SAMPLE_SECONDS
+            clock["cpu"] += polls_per_sample * POLL_CPU_SECONDS
+            governor.sample()
+            levels.append((enabled, governor.level))
+
+    assert default_enabled is False, "The governor should be off by default"
+    assert all(level == 0 for _, level in levels), (
+        f"The governor degraded at a typical poll cost: {levels}"
+    )
+    print(f"✅ Stayed at level 0 at {governor.usage:.1f}% of one core")
+
+
+if __name__ == "__main__":
+    test_default_settings_keep_full_rate()
+    print("\n🎉 The governor leaves a typical setup at the full rate!")
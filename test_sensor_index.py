@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for the sensor search index: partly typed words, typos and
+words typed together must still find the sensor.
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+
+def test_search_queries():
+    """Searches a small catalog with exact, partial and misspelled queries."""
+    print("🧪 Testing sensor search queries...")
+
+    from pymonitor.core.sensor_index import SensorIndex
+
+    index = SensorIndex()
+    index.add("hotspot", "NVIDIA GeForce RTX 3080", "GPU Hot Spot", "Temperature")
+    index.add("core", "NVIDIA GeForce RTX 3080", "GPU Core", "Load")
+    index.add("package", "AMD Ryzen 7 5800X", "CPU Package", "Power")
+
+    cases = [
+        ("gpu hot spot", {"hotspot"}),
+        ("gpu hto spot", {"hotspot"}),
+        ("hotspot", {"hotspot"}),
+        ("gpu hotspo", {"hotspot"}),
+        ("gpuhotspot", {"hotspot"}),
+        ("tmep", {"hotspot"}),
+        ("temperatuer", {"hotspot"}),
+        ("pakc", {"package"}),
+        ("geforce", {"hotspot", "core"}),
+    ]
+    failures = []
+    for query, expected in cases:
+        found = index.search(query)
+        if found != expected:
+            print(f"❌ {query!r} found {found}, expected {expected}")
+            failures.append(query)
+        else:
+            print(f"✅ {query!r} found {sorted(found)}")
+    assert not failures, f"Wrong results for {failures}"
+
+    index.remove("hotspot")
+    assert not index.search("hotspot"), "A removed sensor was still found"
+    assert not index.search("tmep"), "A removed sensor was still found"
+    print("✅ A removed sensor is no longer found")
+
+
+if __name__ == "__main__":
+    test_search_queries()
+    print("\n🎉 Sensor search works!")
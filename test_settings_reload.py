@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for live-reloading settings.json while the settings window is open.
+A change pushed to the file must survive closing the window with Cancel.
+Runs offscreen with the synthetic hardware backend.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+
+def test_push_while_open_then_cancel():
+    """Pushes font_size 30 while the settings window is open, then cancels."""
+    print("🧪 Testing a settings.json push while the settings window is open...")
+
+    from pymonitor.core.app import Application
+    from pymonitor.hardware.synthetic import SyntheticHardwareMonitor
+    import pymonitor.ui.settings_window as settings_window
+
+    # Keep the test offline
+    settings_window.get_latest_lhm_version = lambda **kwargs: None
+    settings_window.get_cached_lhm_version = lambda **kwargs: None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "settings.json")
+        app = Application(
+            sys.argv[:1],
+            hardware_factory=lambda settings: SyntheticHardwareMonitor(settings),
+            settings_path=path,
+        )
+        app.settings.set("appearance.font_size", 12)
+        app.settings.flush()
+
+        window = app.get_settings_window()
+        window.show()
+        app.processEvents()
+
+        # A deployment tool rewrites the file while the window is open
+        with open(path, encoding="utf-8") as f:
+            pushed = json.load(f)
+        pushed["appearance"]["font_size"] = 30
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(pushed, f, indent=4)
+        changed = app.settings_watcher.check()
+        assert "appearance.font_size" in changed, (
+            f"The push was not picked up: {changed}"
+        )
+        print("✅ Pushed font_size 30 was reloaded")
+
+        window.reject()
+        app.processEvents()
+        app.settings.flush()
+
+        in_memory = app.settings.get("appearance.font_size")
+        with open(path, encoding="utf-8") as f:
+            on_disk = json.load(f)["appearance"]["font_size"]
+        app.settings_watcher.stop()
+
+    assert in_memory == 30 and on_disk == 30, (
+        f"Cancel undid the push: {in_memory} in memory, {on_disk} on disk"
+    )
+    print("✅ Cancel kept the pushed value in memory and in settings.json")
+
+
+def test_push_supersedes_pending_autosave():
+    """Pushes a new settings.json while an autosave is still debouncing."""
+    print("🧪 Testing a settings.json push during a pending autosave...")
+
+    from pymonitor.config.settings import Settings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "settings.json")
+        settings = Settings(path)
+        settings.autosave = True
+        settings.set("appearance.font_size", 14)
+
+        # A deployment tool rewrites the file before the autosave ran
+        with open(path, encoding="utf-8") as f:
+            pushed = json.load(f)
+        pushed["appearance"]["font_size"] = 30
+        text = json.dumps(pushed, indent=4)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        settings.apply_loaded(pushed, text)
+        settings.flush()
+
+        with open(path, encoding="utf-8") as f:
+            on_disk = f.read()
+
+    assert on_disk == text, "The pending autosave overwrote the pushed settings.json"
+    print("✅ The pushed settings.json was kept on disk")
+
+
+if __name__ == "__main__":
+    test_push_while_open_then_cancel()
+    test_push_supersedes_pending_autosave()
+    print("\n🎉 Live reload and the settings window work together!")
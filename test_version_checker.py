@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached LibreHardwareMonitor version check.
+
+Runs get_latest_lhm_version against a local HTTP stand-in for the GitHub
+releases API, so it needs neither network access nor the hardware library.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the src directory to the path to import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from pymonitor.core.version_checker import (
+    get_cached_lhm_version,
+    get_latest_lhm_version,
+)
+
+
+class ReleasesStandIn(BaseHTTPRequestHandler):
+    """Serves a releases/latest JSON document with an ETag."""
+
+    tag_name = "v0.9.4"
+    requests_seen = []  # (If-None-Match header, status) per request
+
+    def do_GET(self):
+        etag = f'"{self.tag_name}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.requests_seen.append((self.headers.get("If-None-Match"), 304))
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = json.dumps({"tag_name": self.tag_name}).encode()
+        self.requests_seen.append((self.headers.get("If-None-Match"), 200))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_version_checker():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReleasesStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/releases/latest"
+    seen = ReleasesStandIn.requests_seen
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "lhm_version.json")
+        assert get_cached_lhm_version(url, cache_path) is None
+
+        # First check: full response, cached with its ETag
+        assert get_latest_lhm_version(url=url, cache_path=cache_path) == "0.9.4"
+        assert seen == [(None, 200)]
+        assert get_cached_lhm_version(url, cache_path) == "0.9.4"
+        print("✅ First check fetched and cached the release")
+
+        # Within the TTL: no request at all
+        assert get_latest_lhm_version(url=url, cache_path=cache_path) == "0.9.4"
+        assert len(seen) == 1
+        print("✅ Fresh cache answered without a request")
+
+        # TTL expired, release unchanged: conditional request, 304
+        assert get_latest_lhm_version(url=url, cache_path=cache_path, ttl=0) == "0.9.4"
+        assert seen[-1] == ('"v0.9.4"', 304)
+        print("✅ Expired cache was revalidated with If-None-Match (304)")
+
+        # TTL expired, new release: full response replaces the cache
+        ReleasesStandIn.tag_name = "v0.9.5"
+        assert get_latest_lhm_version(url=url, cache_path=cache_path, ttl=0) == "0.9.5"
+        assert seen[-1] == ('"v0.9.4"', 200)
+        print("✅ New release replaced the cached answer")
+
+        # Offline: the cached answer is returned without waiting for a timeout
+        server.shutdown()
+        server.server_close()
+        start = time.perf_counter()
+        version = get_latest_lhm_version(url=url, cache_path=cache_path, ttl=0)
+        elapsed = time.perf_counter() - start
+        assert version == "0.9.5", version
+        assert elapsed < 1.0, elapsed
+        print(f"✅ Offline check returned the cached answer in {elapsed * 1000:.0f} ms")
+
+        # A cache for another URL is not used
+        assert get_cached_lhm_version(url + "?other", cache_path) is None
+
+
+if __name__ == "__main__":
+    test_version_checker()
+    print("\n✅ All version checker tests passed")